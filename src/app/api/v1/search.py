@@ -5,7 +5,7 @@ from dependency_injector.wiring import Provide, inject
 
 from src.app.containers import Container
 from src.app.config import Settings
-from src.app.core.domain.models import SearchRequest
+from src.app.core.domain.models import SearchMode, SearchRequest
 from src.app.core.services.search_service import SearchService
 from src.client.schemas import SearchResultResponse
 from src.app.api.mappers import to_search_result_response
@@ -18,6 +18,7 @@ router = APIRouter(prefix="/search", tags=["search"])
 async def search(
     q: Annotated[str, Query(min_length=1, description="Search query string")],
     top_k: Annotated[int | None, Query(gt=0, le=100, description="Maximum number of results")] = None,
+    mode: Annotated[SearchMode, Query(description="Document retrieval strategy")] = SearchMode.HYBRID,
     service: SearchService = Depends(Provide[Container.search_service]),
     config: Settings = Depends(Provide[Container.config]),
 ) -> list[SearchResultResponse]:
@@ -31,6 +32,7 @@ async def search(
     Args:
         q: The search query string
         top_k: Maximum number of results to return (default from config, max: 100)
+        mode: Document retrieval strategy: hybrid (default), vector or keyword
 
     Returns:
         List of search results containing matched clients and documents,
@@ -39,7 +41,7 @@ async def search(
     # Use config default if top_k not specified
     effective_top_k = top_k if top_k is not None else config.search.default_top_k
 
-    request = SearchRequest(query=q, top_k=effective_top_k)
+    request = SearchRequest(query=q, top_k=effective_top_k, mode=mode)
     results = await service.search(request)
 
     return [to_search_result_response(result) for result in results]
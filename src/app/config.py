@@ -14,10 +14,18 @@ logger = logging.getLogger(__name__)
 
 
 class SearchSettings(BaseModel):
-    """Search pagination and general settings."""
+    """
+    Search pagination and general settings.
+
+    result_cache_size: Number of unified search requests whose results are cached
+        in-process (0 = disabled, so new clients and documents are searchable immediately).
+    result_cache_ttl_seconds: How long a cached result list is served before it is recomputed.
+    """
 
     default_top_k: int = 3
     max_top_k: int = 100
+    result_cache_size: int = 0
+    result_cache_ttl_seconds: float = 30.0
 
 
 class ClientSearchSettings(BaseModel):
@@ -44,22 +52,29 @@ class ChunkSearchSettings(BaseModel):
     Retrieval multipliers control how many candidates to fetch before ranking.
     reranker_score_threshold: Minimum cross-encoder score for chunk results.
         Document chunks typically have more content and score higher than client descriptions.
+    literal_shortcircuit_enabled: Skip cross-encoder reranking for quoted literal queries.
+        Disabled by default: the keyword leg matches terms rather than the exact phrase, and
+        the skipped results keep RRF-scale scores that are not comparable to reranked ones.
     """
 
     vector_similarity_threshold: float = 0.3
     retrieval_multiplier_with_rerank: int = 3
     retrieval_multiplier_no_rerank: int = 2
     reranker_score_threshold: float = 2.0
+    literal_shortcircuit_enabled: bool = False
 
 
 class DocumentSearchSettings(BaseModel):
     """
     Document-level search settings.
 
-    chunk_retrieval_multiplier: How many chunks to fetch per requested document.
+    chunk_retrieval_multiplier: How many chunks to fetch per requested document on the first pass.
+    max_chunk_retrieval_multiplier: Upper bound used for a second, wider pass when the
+        first pass yields some, but fewer, distinct documents than requested.
     """
 
     chunk_retrieval_multiplier: int = 5
+    max_chunk_retrieval_multiplier: int = 10
 
 
 class RerankerSettings(BaseModel):
@@ -72,9 +87,23 @@ class RerankerSettings(BaseModel):
 
     Note: Score thresholds are configured per-search-type in
     ClientSearchSettings and ChunkSearchSettings.
+
+    backend: Inference backend for the model. Production runs "torch". The test
+        suite can opt into "onnx", "openvino" or "onnxruntime" (a bare ONNX Runtime
+        session); their runtimes come only from the dev dependency group, so they
+        are not available in a production install.
+    model_file_name: Optional model file to load for the test-only non-torch backends.
+    num_threads: Intra-op thread count for the test-only "onnxruntime" backend (0 = runtime default).
+    max_length: Token cap per (query, content) pair. Sized for a full chunk
+        (ChunkingSettings.size) plus the query instead of the model's 512 limit,
+        since attention cost grows quadratically with sequence length.
     """
 
     model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    backend: str = "torch"  # Tests only: "onnx", "openvino", "onnxruntime"
+    model_file_name: str | None = None
+    num_threads: int = 0
+    max_length: int = 320
 
 
 class RRFSettings(BaseModel):
@@ -89,9 +118,19 @@ class RRFSettings(BaseModel):
 
 
 class EmbeddingSettings(BaseModel):
-    """Embedding model settings."""
+    """
+    Embedding model settings.
+
+    backend: Inference backend for the model. Production runs "torch"; "onnx" is
+        a test-only opt-in (TEST_FAST_EMBEDDER=1) that needs the dev dependency group.
+    model_file_name: Optional model file to load for the test-only "onnx" backend.
+    query_cache_size: Number of query embeddings kept in the in-process LRU cache.
+    """
 
     model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
+    backend: str = "torch"  # Tests only: "onnx"
+    model_file_name: str | None = None
+    query_cache_size: int = 1024
 
 
 class ChunkingSettings(BaseModel):
@@ -111,12 +150,14 @@ class SummarizationSettings(BaseModel):
 
     max_words: Target word count for summaries.
     max_tokens: Maximum tokens for LLM response.
+    cache_size: Number of summaries kept in the in-process LRU cache, keyed by content digest.
     """
 
     enabled: bool = True
     provider: str = "claude"  # Options: "claude", "gemini"
     max_words: int = 100
     max_tokens: int = 200
+    cache_size: int = 1024
 
 
 class LLMSettings(BaseModel):
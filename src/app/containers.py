@@ -28,13 +28,13 @@ from src.app.infrastructure.client_search_repository import ClientSearchReposito
 from src.app.core.services.client_service import ClientService
 from src.app.core.services.document_service import DocumentService
 from src.app.core.services.embedding import SentenceTransformerEmbedding
-from src.app.core.services.reranker import CrossEncoderReranker
+from src.app.core.services.reranker import CrossEncoderReranker, OnnxRuntimeCrossEncoder, PairScoringModel
 from src.app.core.services.chunking import RecursiveChunkingStrategy
 from src.app.core.services.document_processor import DocumentProcessor
 from src.app.core.services.chunks_search_service import DocumentChunkSearchService
 from src.app.core.services.document_search_service import DocumentSearchService
 from src.app.core.services.client_search_service import ClientSearchService
-from src.app.core.services.search_service import SearchService
+from src.app.core.services.search_service import SearchResultCache, SearchService
 from src.app.core.services.rrf import ReciprocalRankFusion
 from src.app.core.services.summarization import (
     SummarizationService,
@@ -60,6 +60,73 @@ def create_entity_mapper(
     )
 
 
+def create_sentence_transformer(
+    model_name: str,
+    backend: str,
+    model_file_name: str | None = None,
+) -> SentenceTransformer:
+    """
+    Factory function to create the SentenceTransformer embedding model.
+
+    Production runs backend="torch". The "onnx" backend is a test-suite opt-in:
+    its runtime only comes from the dev dependency group.
+    model_file_name selects a specific export from the model repository,
+    e.g. "onnx/model_qint8_avx512_vnni.onnx" for the INT8-quantized ONNX model.
+    """
+    model_kwargs = {"file_name": model_file_name} if model_file_name else None
+    return SentenceTransformer(
+        model_name_or_path=model_name,
+        device="cpu",
+        backend=backend,
+        model_kwargs=model_kwargs,
+    )
+
+
+def create_cross_encoder(
+    model_name: str,
+    backend: str,
+    model_file_name: str | None = None,
+    num_threads: int = 0,
+    max_length: int = 512,
+) -> PairScoringModel:
+    """
+    Factory function to create the CrossEncoder reranking model.
+
+    Production runs backend="torch". The other backends are test-suite opt-ins
+    whose runtimes only come from the dev dependency group.
+    With backend="onnx" the model runs on ONNX Runtime using the export
+    shipped in the model repository (onnx/model.onnx by default).
+    backend="onnxruntime" loads the same export into a bare ONNX Runtime
+    session without the sentence-transformers wrapper.
+    model_file_name selects a specific export, e.g. one of the INT8-quantized models.
+    num_threads caps the bare ONNX Runtime session's intra-op threads (0 = runtime default).
+    max_length truncates each (query, content) pair at the tokenizer.
+
+    The model runs one throwaway prediction before it is returned, so kernel
+    selection, thread-pool startup and weight paging happen at load time
+    rather than on the first real rerank.
+    """
+    if backend == "onnxruntime":
+        model = OnnxRuntimeCrossEncoder.from_pretrained(
+            model_name,
+            file_name=model_file_name or "onnx/model.onnx",
+            num_threads=num_threads,
+            max_length=max_length,
+        )
+    else:
+        model_kwargs = {"file_name": model_file_name} if model_file_name else None
+        model = CrossEncoder(
+            model_name_or_path=model_name,
+            device="cpu",
+            backend=backend,
+            model_kwargs=model_kwargs,
+            max_length=max_length,
+        )
+
+    model.predict([("warmup", "warmup " * 16)])
+    return model
+
+
 def create_tokenizer(model_name: str) -> AutoTokenizer:
     """
     Factory function to create HuggingFace tokenizer.
@@ -136,6 +203,7 @@ def create_summarization_service(
     config: Settings,
     max_words: int,
     max_tokens: int,
+    cache_size: int = 1024,
 ) -> SummarizationService | None:
     """
     Factory function to create summarization service based on configuration.
@@ -155,6 +223,7 @@ def create_summarization_service(
             model=config.llm.claude_model,
             max_words=max_words,
             max_tokens=max_tokens,
+            cache_size=cache_size,
         )
 
     if config.summarization.provider == "gemini" and config.llm.google_api_key:
@@ -163,6 +232,7 @@ def create_summarization_service(
             model=config.llm.gemini_model,
             max_words=max_words,
             max_tokens=max_tokens,
+            cache_size=cache_size,
         )
 
     # No valid configuration - return None (summarization disabled)
@@ -191,14 +261,19 @@ class Container(containers.DeclarativeContainer):
     # dependency-injector handles thread safety automatically.
     # =========================================================================
     sentence_transformer_model = providers.Singleton(
-        SentenceTransformer,
-        model_name_or_path=config.provided.embedding.model_name,
-        device="cpu",
+        create_sentence_transformer,
+        model_name=config.provided.embedding.model_name,
+        backend=config.provided.embedding.backend,
+        model_file_name=config.provided.embedding.model_file_name,
     )
 
     cross_encoder_model = providers.Singleton(
-        CrossEncoder,
-        model_name_or_path=config.provided.reranker.model_name,
+        create_cross_encoder,
+        model_name=config.provided.reranker.model_name,
+        backend=config.provided.reranker.backend,
+        model_file_name=config.provided.reranker.model_file_name,
+        num_threads=config.provided.reranker.num_threads,
+        max_length=config.provided.reranker.max_length,
     )
 
     # =========================================================================
@@ -254,6 +329,7 @@ class Container(containers.DeclarativeContainer):
         config=config,
         max_words=config.provided.summarization.max_words,
         max_tokens=config.provided.summarization.max_tokens,
+        cache_size=config.provided.summarization.cache_size,
     )
 
     # =========================================================================
@@ -329,18 +405,26 @@ class Container(containers.DeclarativeContainer):
     )
 
     # =========================================================================
-    # FACTORIES - Services
+    # SINGLETON - Embedding Service (holds the shared query embedding cache)
     # =========================================================================
-    embedding_service = providers.Factory(
+    embedding_service = providers.Singleton(
         SentenceTransformerEmbedding,
         model=sentence_transformer_model,
+        query_cache_size=config.provided.embedding.query_cache_size,
     )
 
-    reranker_service = providers.Factory(
+    # =========================================================================
+    # SINGLETON - Reranker Service (owns the dedicated inference thread)
+    # =========================================================================
+    reranker_service = providers.Singleton(
         CrossEncoderReranker,
         model=cross_encoder_model,
     )
 
+    # =========================================================================
+    # FACTORIES - Services
+    # =========================================================================
+
     document_processor = providers.Factory(
         DocumentProcessor,
         chunking_strategy=chunking_service,
@@ -388,6 +472,7 @@ class Container(containers.DeclarativeContainer):
         chunk_search_service=document_chunk_search_service,
         document_repository=document_repository,
         chunk_retrieval_multiplier=config.provided.document_search.chunk_retrieval_multiplier,
+        max_chunk_retrieval_multiplier=config.provided.document_search.max_chunk_retrieval_multiplier,
     )
 
     # Variant without reranking (for testing/comparison)
@@ -396,6 +481,7 @@ class Container(containers.DeclarativeContainer):
         chunk_search_service=document_chunk_search_service_no_rerank,
         document_repository=document_repository,
         chunk_retrieval_multiplier=config.provided.document_search.chunk_retrieval_multiplier,
+        max_chunk_retrieval_multiplier=config.provided.document_search.max_chunk_retrieval_multiplier,
     )
 
     client_search_service = providers.Factory(
@@ -413,10 +499,18 @@ class Container(containers.DeclarativeContainer):
         reranker_service=None,
     )
 
+    # Shared across the per-request SearchService instances
+    search_result_cache = providers.Singleton(
+        SearchResultCache,
+        max_size=config.provided.search.result_cache_size,
+        ttl_seconds=config.provided.search.result_cache_ttl_seconds,
+    )
+
     search_service = providers.Factory(
         SearchService,
         client_search_service=client_search_service,
         document_search_service=document_search_service,
+        result_cache=search_result_cache,
     )
 
     # Variant without reranking (for testing/comparison)
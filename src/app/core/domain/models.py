@@ -1,14 +1,29 @@
 """Domain models used in business logic."""
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
-from typing import Generic, Literal, TypeVar, Union
+from typing import Annotated, Generic, Literal, TypeVar, Union
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, EmailStr, Field, PlainSerializer, field_validator
 
 from src.shared import time_utils
 
+# float32 embedding vector; serialized to JSON as a plain list of floats
+EmbeddingArray = Annotated[
+    np.ndarray,
+    PlainSerializer(lambda array: array.tolist(), return_type=list[float], when_used="json"),
+]
+
+
+def embeddings_equal(left: np.ndarray | None, right: np.ndarray | None) -> bool:
+    """Compare two optional embeddings element-wise (== on arrays is not a bool)."""
+    if left is None or right is None:
+        return left is right
+    return np.array_equal(left, right)
+
 
 class Client(BaseModel):
     """Domain model for Client used in business logic."""
@@ -59,9 +74,27 @@ class DocumentChunk(BaseModel):
     document_id: UUID = Field(..., description="ID of the parent document")
     chunk_index: int = Field(..., ge=0, description="Index of this chunk in the document")
     chunk_content: str = Field(..., min_length=1, description="Text content of this chunk")
-    embedding: list[float] | None = Field(default=None, description="Vector embedding (null in Phase 1)")
+    embedding: EmbeddingArray | None = Field(default=None, description="Vector embedding as float32 array (null in Phase 1)")
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "arbitrary_types_allowed": True}
+
+    def __eq__(self, other: object) -> bool:
+        """Field-wise equality, comparing embeddings element-wise."""
+        if not isinstance(other, DocumentChunk):
+            return NotImplemented
+        return (
+            (self.id, self.document_id, self.chunk_index, self.chunk_content)
+            == (other.id, other.document_id, other.chunk_index, other.chunk_content)
+            and embeddings_equal(self.embedding, other.embedding)
+        )
+
+    @field_validator("embedding", mode="before")
+    @classmethod
+    def coerce_embedding(cls, v: object) -> np.ndarray | None:
+        """Store embeddings as contiguous float32 arrays (lists are converted)."""
+        if v is None:
+            return None
+        return np.ascontiguousarray(v, dtype=np.float32)
 
 
 # =============================================================================
@@ -89,18 +122,22 @@ class ScoreSource(StrEnum):
         return Score(value=value, source=self)
 
 
-class Score(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Score:
     """
     A relevance score with its source/origin.
 
     Encapsulates both the numeric value and where it came from,
     enabling meaningful interpretation and debugging. Immutable
     for safe use in score history tracking.
-    """
-    value: float = Field(..., description="The numeric score value")
-    source: ScoreSource = Field(..., description="Origin of this score")
 
-    model_config = {"frozen": True}
+    Scores are allocated for every hit at every pipeline stage, so Score and
+    ScoredResult are slotted dataclasses rather than pydantic models: values
+    come from the database or numpy as floats already, and skipping
+    validation and the per-instance __dict__ makes them much cheaper to build.
+    """
+    value: float  # The numeric score value
+    source: ScoreSource  # Origin of this score
 
     def __repr__(self) -> str:
         return f"Score({self.value:.4f}, {self.source.value})"
@@ -109,7 +146,8 @@ class Score(BaseModel):
 T = TypeVar("T")
 
 
-class ScoredResult(BaseModel, Generic[T]):
+@dataclass(frozen=True, slots=True)
+class ScoredResult(Generic[T]):
     """
     Universal wrapper for any entity with a relevance score and history.
 
@@ -127,13 +165,8 @@ class ScoredResult(BaseModel, Generic[T]):
         score_history: Previous scores in chronological order (oldest first)
     """
     item: T
-    score: Score = Field(..., description="Current score with source")
-    score_history: list[Score] = Field(
-        default_factory=list,
-        description="Previous scores in chronological order (oldest first)"
-    )
-
-    model_config = {"from_attributes": True, "arbitrary_types_allowed": True}
+    score: Score  # Current score with source
+    score_history: list[Score] = field(default_factory=list)  # Previous scores, oldest first
 
     def assign_score(self, new_score: Score) -> "ScoredResult[T]":
         """
@@ -174,6 +207,9 @@ class ScoredResult(BaseModel, Generic[T]):
         """
         Filter results below a score threshold.
 
+        Scores are compared in a single vectorized pass, and the input order
+        of the surviving results is preserved.
+
         Args:
             results: List of ScoredResult to filter
             threshold: Minimum score value (inclusive)
@@ -181,13 +217,31 @@ class ScoredResult(BaseModel, Generic[T]):
         Returns:
             Filtered list with only results where score.value >= threshold
         """
-        return [r for r in results if r.value >= threshold]
+        if not results:
+            return []
+
+        scores = np.fromiter((r.score.value for r in results), dtype=np.float64, count=len(results))
+        kept_idx = np.flatnonzero(scores >= threshold)
+        return [results[i] for i in kept_idx]
 
 
 # =============================================================================
 # Search Request Model
 # =============================================================================
 
+class SearchMode(StrEnum):
+    """
+    Retrieval strategy for document chunk search.
+
+    - HYBRID: Vector and keyword search fused with RRF
+    - VECTOR: Semantic vector search only
+    - KEYWORD: Full-text keyword search only (no query embedding)
+    """
+    HYBRID = "hybrid"
+    VECTOR = "vector"
+    KEYWORD = "keyword"
+
+
 class SearchRequest(BaseModel):
     """
     Request model for search operations across all search services.
@@ -197,6 +251,7 @@ class SearchRequest(BaseModel):
     """
     query: str = Field(..., min_length=1, description="Search query string")
     top_k: int = Field(default=10, gt=0, le=100, description="Maximum number of results to return")
+    mode: SearchMode = Field(default=SearchMode.HYBRID, description="Retrieval strategy for chunk search")
 
     @field_validator("query")
     @classmethod
@@ -207,15 +262,19 @@ class SearchRequest(BaseModel):
         return v.strip()
 
 
-class SearchResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SearchResult:
     """
     Unified search result that can contain either a Client or Document.
 
     Used by the unified SearchService to return heterogeneous search results
     sorted by score descending.
-    """
-    type: Literal["CLIENT", "DOCUMENT"] = Field(..., description="Type of entity in the result")
-    entity: Union[Client, Document] = Field(..., description="The actual entity (Client or Document)")
-    score: float = Field(..., description="Relevance score from the search")
 
-    model_config = {"from_attributes": True}
+    A plain slotted dataclass rather than a pydantic model: it is built once per
+    returned result on every search, and its fields are already-validated domain
+    objects, so re-validating them would be pure overhead. The API layer maps it
+    to the SearchResultResponse schema.
+    """
+    type: Literal["CLIENT", "DOCUMENT"]  # Type of entity in the result
+    entity: Union[Client, Document]  # The actual entity (Client or Document)
+    score: float  # Relevance score from the search
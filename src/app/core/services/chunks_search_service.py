@@ -4,7 +4,7 @@ import logging
 from typing import Optional
 
 from src.app.config import ChunkSearchSettings
-from src.app.core.domain.models import DocumentChunk, ScoredResult, SearchRequest
+from src.app.core.domain.models import DocumentChunk, ScoredResult, SearchMode, SearchRequest
 from src.app.core.services.embedding import EmbeddingService
 from src.app.core.services.reranker import RerankerService
 from src.app.core.services.rrf import ReciprocalRankFusion
@@ -58,7 +58,8 @@ class DocumentChunkSearchService:
         Search for document chunks using hybrid search (vector + keyword).
 
         This method:
-        1. Runs vector search and keyword search in parallel
+        1. Runs vector search and keyword search in parallel (or only one of them,
+           depending on request.mode)
         2. Combines results using Reciprocal Rank Fusion (RRF)
         3. Optionally reranks fused results using cross-encoder for better accuracy
         4. Returns top K results ranked by relevance score (descending)
@@ -73,48 +74,57 @@ class DocumentChunkSearchService:
         """
         logger.info("Hybrid search for query: '%s' (top_k=%d)", request.query[:100], request.top_k)
 
+        # Literal queries are exact-match lookups, so the cross-encoder adds cost but no value
+        reranker_service = self.reranker_service
+        if reranker_service and self._should_skip_rerank(request.query):
+            logger.info("Literal query detected, skipping reranking")
+            reranker_service = None
+
         # Fetch more candidates for fusion and potential reranking
         multiplier = (
             self.settings.retrieval_multiplier_with_rerank
-            if self.reranker_service
+            if reranker_service
             else self.settings.retrieval_multiplier_no_rerank
         )
         retrieval_limit = request.top_k * multiplier
 
-        # Run vector search and keyword search in parallel
-        embedding_task = self.embedding_service.embed_query(request.query)
-        keyword_task = self.search_repository.search_by_keyword(
-            query_text=request.query,
-            limit=retrieval_limit
-        )
-
-        # Wait for embedding first, then run vector search
-        embedding_result, keyword_results = await asyncio.gather(
-            embedding_task,
-            keyword_task
-        )
-
-        logger.debug("Generated query embedding with %d dimensions", len(embedding_result.embedding))
-        logger.info("Keyword search returned %d results", len(keyword_results))
+        # Only run the retrieval paths the requested mode needs; keyword-only
+        # searches never pay for a query embedding
+        vector_results: list[ScoredResult[DocumentChunk]] = []
+        keyword_results: list[ScoredResult[DocumentChunk]] = []
+        if request.mode == SearchMode.KEYWORD:
+            keyword_results = await self.search_repository.search_by_keyword(
+                query_text=request.query,
+                limit=retrieval_limit
+            )
+        elif request.mode == SearchMode.VECTOR:
+            vector_results = await self._search_by_vector(request.query, retrieval_limit)
+        else:
+            # Run vector search and keyword search in parallel
+            vector_results, keyword_results = await asyncio.gather(
+                self._search_by_vector(request.query, retrieval_limit),
+                self.search_repository.search_by_keyword(
+                    query_text=request.query,
+                    limit=retrieval_limit
+                )
+            )
 
-        # Run vector search with the embedding using configured threshold
-        vector_results = await self.search_repository.search_by_vector(
-            query_vector=embedding_result.embedding,
-            limit=retrieval_limit,
-            similarity_threshold=self.settings.vector_similarity_threshold
+        logger.info(
+            "Search mode '%s': vector returned %d, keyword returned %d results",
+            request.mode,
+            len(vector_results),
+            len(keyword_results)
         )
 
-        logger.info("Vector search returned %d results", len(vector_results))
-
         # Fuse results using RRF (preserves score history from both sources)
         fused_results = self.rrf.fuse(vector_results, keyword_results)
         logger.info("RRF fusion produced %d unique results", len(fused_results))
 
         # Apply reranking if reranker is available
-        if self.reranker_service and fused_results:
+        if reranker_service and fused_results:
             logger.info("Applying reranking to %d candidates", len(fused_results))
             # Reranker uses assign_score() to preserve history - no unwrapping needed!
-            results = await self.reranker_service.rerank(
+            results = await reranker_service.rerank(
                 query=request.query,
                 results=fused_results[:retrieval_limit],
                 content_extractor=lambda chunk: chunk.chunk_content,  # Extract from DocumentChunk
@@ -127,8 +137,42 @@ class DocumentChunkSearchService:
 
         # Apply score threshold filtering only when reranking was performed
         # Cross-encoder scores are logits (~-12 to +12), not probabilities
-        if self.reranker_service:
+        if reranker_service:
             results = ScoredResult.filter_by_threshold(results, self.settings.reranker_score_threshold)
 
         logger.info("Hybrid search complete. Returning %d results", len(results))
         return results
+
+    async def _search_by_vector(self, query: str, limit: int) -> list[ScoredResult[DocumentChunk]]:
+        """
+        Embed the query and run vector search using the configured threshold.
+
+        Args:
+            query: The search query string
+            limit: Maximum number of results to return
+
+        Returns:
+            List of ScoredResult[DocumentChunk] with VECTOR_SIMILARITY scores
+        """
+        embedding_result = await self.embedding_service.embed_query(query)
+        logger.debug("Generated query embedding with %d dimensions", len(embedding_result.embedding))
+
+        return await self.search_repository.search_by_vector(
+            query_vector=embedding_result.embedding,
+            limit=limit,
+            similarity_threshold=self.settings.vector_similarity_threshold
+        )
+
+    def _should_skip_rerank(self, query: str) -> bool:
+        """
+        Check whether the query is a quoted literal that should bypass reranking.
+
+        Args:
+            query: The (already stripped) search query
+
+        Returns:
+            True if the literal short-circuit is enabled and the query is quoted
+        """
+        if not self.settings.literal_shortcircuit_enabled:
+            return False
+        return len(query) > 2 and query[0] == query[-1] == '"'
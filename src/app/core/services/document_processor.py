@@ -67,6 +67,11 @@ class DocumentProcessor:
         Returns:
             ProcessingResult containing chunks and optional summary.
         """
+        # Fast path: nothing to chunk, embed or summarize
+        if not content or content.isspace():
+            logger.info("No chunks created for document %s (empty content)", document_id)
+            return ProcessingResult(chunks=[], summary=None)
+
         logger.info(
             "Processing text for document %s, content length: %d",
             document_id,
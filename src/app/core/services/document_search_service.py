@@ -1,4 +1,6 @@
 """Service for searching documents using semantic vector search aggregated from chunks."""
+import asyncio
+import heapq
 import logging
 from uuid import UUID
 
@@ -8,6 +10,9 @@ from src.app.infrastructure.document_repository import DocumentRepository
 
 logger = logging.getLogger(__name__)
 
+# Chunk requests are SearchRequests too, so they share its top_k upper bound
+MAX_CHUNK_RETRIEVAL_LIMIT = 100
+
 
 class DocumentSearchService:
     """
@@ -25,6 +30,7 @@ class DocumentSearchService:
             chunk_search_service: DocumentChunkSearchService,
             document_repository: DocumentRepository,
             chunk_retrieval_multiplier: int = 5,
+            max_chunk_retrieval_multiplier: int = 10,
     ):
         """
         Initialize the document search service.
@@ -33,11 +39,14 @@ class DocumentSearchService:
             chunk_search_service: Service for searching document chunks
             document_repository: Repository for retrieving full document records
             chunk_retrieval_multiplier: Multiplier for top_k to determine how many
-                chunks to fetch per requested document.
+                chunks to fetch per requested document on the first pass.
+            max_chunk_retrieval_multiplier: Multiplier for the wider second pass, used
+                only when the first pass yields fewer than top_k distinct documents.
         """
         self.chunk_search_service = chunk_search_service
         self.document_repository = document_repository
         self.chunk_retrieval_multiplier = chunk_retrieval_multiplier
+        self.max_chunk_retrieval_multiplier = max_chunk_retrieval_multiplier
 
     async def search(self, request: SearchRequest) -> list[ScoredResult[Document]]:
         """
@@ -55,35 +64,88 @@ class DocumentSearchService:
         if not chunk_results:
             return []
 
-        best_chunks_by_doc = self._group_chunks_by_document(chunk_results)
-        top_ranking_doc_ids = sorted(
-            best_chunks_by_doc.keys(),
-            key=lambda doc_id: best_chunks_by_doc[doc_id].value,
-            reverse=True
-        )[:request.top_k]
-        documents = await self.document_repository.get_by_ids(top_ranking_doc_ids)
+        # Chunks arrive ranked by score, so the first top_k distinct documents are the
+        # likely winners. Start fetching them now and rank while the query is in flight.
+        candidate_doc_ids = self._first_distinct_document_ids(chunk_results, request.top_k)
+        fetch_task = asyncio.create_task(self.document_repository.get_by_ids(candidate_doc_ids))
+        await asyncio.sleep(0)  # Let the fetch issue its query before ranking
+
+        best_chunks_by_doc, best_score_by_doc = self._group_chunks_by_document(chunk_results)
+        # Partial selection: O(N log k) instead of sorting every candidate document.
+        # Keyed by the plain float dict's __getitem__ so no Python-level lambda runs per document.
+        top_ranking_doc_ids = heapq.nlargest(
+            request.top_k,
+            best_score_by_doc.keys(),
+            key=best_score_by_doc.__getitem__,
+        )
+        documents = await fetch_task
+
+        # Only hit when chunks were not in score order
+        prefetched_doc_ids = set(candidate_doc_ids)
+        missing_doc_ids = [doc_id for doc_id in top_ranking_doc_ids if doc_id not in prefetched_doc_ids]
+        if missing_doc_ids:
+            logger.debug("Fetching %d documents missed by the prefetch", len(missing_doc_ids))
+            documents = [*documents, *await self.document_repository.get_by_ids(missing_doc_ids)]
+
         return self._build_results(top_ranking_doc_ids, documents, best_chunks_by_doc)
 
     async def _search_document_chunks(self, request: SearchRequest) -> list[ScoredResult[DocumentChunk]]:
-        """Fetch relevant chunks from chunk search service."""
-        chunk_limit = request.top_k * self.chunk_retrieval_multiplier
-        chunk_request = SearchRequest(query=request.query, top_k=chunk_limit)
+        """
+        Fetch relevant chunks from chunk search service, widening the search only if needed.
+
+        The first pass fetches top_k * chunk_retrieval_multiplier chunks. A second pass
+        with top_k * max_chunk_retrieval_multiplier chunks runs when the first pass found
+        some, but fewer than top_k, distinct documents. The chunk search drops reranked
+        chunks below its score threshold, so a short first pass does not mean the
+        candidates ran out; a wider pass reranks more of them.
+        """
+        chunk_limit = min(request.top_k * self.chunk_retrieval_multiplier, MAX_CHUNK_RETRIEVAL_LIMIT)
+        max_chunk_limit = min(request.top_k * self.max_chunk_retrieval_multiplier, MAX_CHUNK_RETRIEVAL_LIMIT)
+
+        results = await self._fetch_chunks(request, chunk_limit)
+
+        distinct_documents = len(self._first_distinct_document_ids(results, request.top_k))
+        if 0 < distinct_documents < request.top_k and max_chunk_limit > chunk_limit:
+            logger.info("Too few distinct documents, widening chunk search to %d", max_chunk_limit)
+            results = await self._fetch_chunks(request, max_chunk_limit)
+
+        return results
+
+    async def _fetch_chunks(self, request: SearchRequest, limit: int) -> list[ScoredResult[DocumentChunk]]:
+        """Run a single chunk search with the given limit."""
+        chunk_request = SearchRequest(query=request.query, top_k=limit, mode=request.mode)
         results = await self.chunk_search_service.search(chunk_request)
-        logger.info("Retrieved %d chunks", len(results))
+        logger.info("Retrieved %d chunks (limit=%d)", len(results), limit)
         return results
 
     @staticmethod
-    def _group_chunks_by_document(chunk_results: list[ScoredResult[DocumentChunk]]) -> dict[
-        UUID, ScoredResult[DocumentChunk]]:
-        """Group chunks by document ID, keeping only the best-scoring chunk per document."""
+    def _first_distinct_document_ids(chunk_results: list[ScoredResult[DocumentChunk]], limit: int) -> list[UUID]:
+        """Collect up to limit document IDs in the order their chunks appear."""
+        doc_ids: dict[UUID, None] = {}
+        for chunk_result in chunk_results:
+            doc_ids.setdefault(chunk_result.item.document_id)
+            if len(doc_ids) == limit:
+                break
+        return list(doc_ids)
+
+    @staticmethod
+    def _group_chunks_by_document(chunk_results: list[ScoredResult[DocumentChunk]]) -> tuple[
+        dict[UUID, ScoredResult[DocumentChunk]], dict[UUID, float]]:
+        """
+        Group chunks by document ID, keeping only the best-scoring chunk per document.
+
+        Returns the best chunk per document and, with the same key order, its score as a plain float.
+        """
         best_by_doc: dict[UUID, ScoredResult[DocumentChunk]] = {}
+        best_score_by_doc: dict[UUID, float] = {}
         for chunk_result in chunk_results:
             doc_id = chunk_result.item.document_id
-            current_best = best_by_doc.get(doc_id)
-            if current_best is None or chunk_result.value > current_best.value:
+            score = chunk_result.score.value
+            if score > best_score_by_doc.get(doc_id, float("-inf")):
+                best_score_by_doc[doc_id] = score
                 best_by_doc[doc_id] = chunk_result
         logger.info("Found %d unique documents", len(best_by_doc))
-        return best_by_doc
+        return best_by_doc, best_score_by_doc
 
     @staticmethod
     def _build_results(doc_ids: list[UUID], documents: list[Document],
@@ -147,8 +147,7 @@ class DocumentService:
         # Persist document status update and chunks in a single transaction
         async with self.unit_of_work:
             await self.unit_of_work.update(document)
-            for chunk in result.chunks:
-                self.unit_of_work.add(chunk)
+            self.unit_of_work.add_many(result.chunks)
 
         logger.info(
             "Successfully processed document %s with %d chunks%s",
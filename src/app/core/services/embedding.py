@@ -1,12 +1,16 @@
 """Embedding service interface and implementations for generating text embeddings."""
 import asyncio
+import hashlib
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from sentence_transformers import SentenceTransformer
 
+from src.app.core.domain.models import EmbeddingArray, embeddings_equal
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,9 +22,21 @@ class EmbeddingVectorResult(BaseModel):
     mismatches when processing multiple texts.
     """
     text: str
-    embedding: list[float]
+    embedding: EmbeddingArray
+
+    model_config = {"frozen": True, "arbitrary_types_allowed": True}  # Make immutable for safety
 
-    model_config = {"frozen": True}  # Make immutable for safety
+    def __eq__(self, other: object) -> bool:
+        """Equal when the texts match and the vectors are element-wise equal."""
+        if not isinstance(other, EmbeddingVectorResult):
+            return NotImplemented
+        return self.text == other.text and embeddings_equal(self.embedding, other.embedding)
+
+    @field_validator("embedding", mode="before")
+    @classmethod
+    def coerce_embedding(cls, v: object) -> np.ndarray:
+        """Store the vector as a contiguous float32 array (lists are converted)."""
+        return np.ascontiguousarray(v, dtype=np.float32)
 
 
 class EmbeddingService(ABC):
@@ -87,52 +103,103 @@ class SentenceTransformerEmbedding(EmbeddingService):
     Embedding service using SentenceTransformer models.
 
     This implementation uses the sentence-transformers library with an injected
-    SentenceTransformer model instance.
-    """
-
+    SentenceTransformer model instance. Embeddings are L2-normalized float32
+    arrays, so cosine similarity reduces to a dot product.
 
+    Query embeddings are cached in a bounded LRU keyed by a digest of the query
+    text, so recurring queries skip the model forward pass entirely.
+    """
 
-    def __init__(self, model: SentenceTransformer):
+    def __init__(self, model: SentenceTransformer, query_cache_size: int = 1024):
         """
         Initialize the SentenceTransformer embedding service.
 
         Args:
             model: Pre-configured SentenceTransformer model instance
+            query_cache_size: Maximum number of query embeddings to keep cached.
+                              Use 0 to disable caching.
         """
+        if query_cache_size < 0:
+            raise ValueError("query_cache_size must be non-negative")
+
+        # Inference only: make sure dropout/batch-norm are in eval mode from the start.
+        # encode() itself already runs under torch.inference_mode().
+        model.eval()
         self.model = model
+        self.query_cache_size = query_cache_size
+        self._query_cache: OrderedDict[bytes, EmbeddingVectorResult] = OrderedDict()
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Compute a compact digest of the text to use as a cache key."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _resolve_prompt(self, prompt_names: tuple[str, ...]) -> str:
+        """
+        Resolve a prompt the way encode_query/encode_document do.
+
+        The first of prompt_names found in the model's prompts wins; otherwise
+        the model's default prompt (if any) applies.
+        """
+        for prompt_name in prompt_names:
+            if prompt_name in self.model.prompts:
+                return self.model.prompts[prompt_name]
+        default_prompt_name = self.model.default_prompt_name
+        return self.model.prompts.get(default_prompt_name, "") if default_prompt_name else ""
 
     async def embed_query(self, text: str) -> EmbeddingVectorResult:
         """
-               Generate an embedding vector for the given text.
+        Generate an embedding vector for the given text.
 
-               Runs the synchronous model encoding in a thread pool to avoid blocking
-               the event loop.
+        Runs the synchronous model encoding in a thread pool to avoid blocking
+        the event loop. Results are served from the LRU cache when the same
+        query was embedded recently.
 
-               Args:
-                   text: The input text to embed
+        Args:
+            text: The input text to embed
 
-               Returns:
-                   EmbeddingVectorResult containing the text and its embedding vector
+        Returns:
+            EmbeddingVectorResult containing the text and its embedding vector
 
-               Raises:
-                   ValueError: If text is empty or invalid
-               """
+        Raises:
+            ValueError: If text is empty or invalid
+        """
         if not text or not text.strip():
             logger.warning("Attempted to embed empty or whitespace-only text")
             raise ValueError("Text cannot be empty or whitespace only")
 
+        key = self._cache_key(text)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            logger.debug("Query embedding cache hit for text of length %d", len(text))
+            return cached
+
         logger.debug("Generating embedding for text of length %d", len(text))
 
         # Run synchronous encoding in thread pool to avoid blocking event loop
         embedding = await asyncio.to_thread(
             self.model.encode_query,
             text,
-            convert_to_numpy=True
+            convert_to_numpy=True,
+            normalize_embeddings=True
         )
-        # Ensure it's a numpy array and convert to list
-        embedding_list = embedding.tolist() if isinstance(embedding, np.ndarray) else list(embedding)
 
-        return EmbeddingVectorResult(text=text, embedding=embedding_list)
+        result = EmbeddingVectorResult(text=text, embedding=embedding)
+        # Cached arrays are shared between callers, so make them read-only
+        result.embedding.flags.writeable = False
+        self._cache_query_result(key, result)
+        return result
+
+    def _cache_query_result(self, key: bytes, result: EmbeddingVectorResult) -> None:
+        """Store a query embedding, evicting the least recently used entry when full."""
+        if self.query_cache_size == 0:
+            return
+
+        self._query_cache[key] = result
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > self.query_cache_size:
+            self._query_cache.popitem(last=False)
 
     async def embed_document(self, text: str) -> EmbeddingVectorResult:
         """
@@ -160,13 +227,11 @@ class SentenceTransformerEmbedding(EmbeddingService):
         embedding = await asyncio.to_thread(
             self.model.encode_document,
             text,
-            convert_to_numpy=True
+            convert_to_numpy=True,
+            normalize_embeddings=True
         )
 
-        # Ensure it's a numpy array and convert to list
-        embedding_list = embedding.tolist() if isinstance(embedding, np.ndarray) else list(embedding)
-
-        return EmbeddingVectorResult(text=text, embedding=embedding_list)
+        return EmbeddingVectorResult(text=text, embedding=embedding)
 
     async def embed_document_batch(self, texts: list[str]) -> list[EmbeddingVectorResult]:
         """
@@ -199,13 +264,74 @@ class SentenceTransformerEmbedding(EmbeddingService):
         embeddings = await asyncio.to_thread(
             self.model.encode,
             texts,
-            convert_to_numpy=True
+            convert_to_numpy=True,
+            normalize_embeddings=True
         )
 
         # Create EmbeddingVectorResult for each text-embedding pair
+        # Rows of the batch matrix are float32 views, no per-value copying needed
         results = [
-            EmbeddingVectorResult(text=text, embedding=embedding.tolist())
+            EmbeddingVectorResult(text=text, embedding=embedding)
             for text, embedding in zip(texts, embeddings)
         ]
 
         return results
+
+    async def embed_mixed_batch(
+        self,
+        documents: list[str],
+        queries: list[str],
+    ) -> tuple[list[EmbeddingVectorResult], list[EmbeddingVectorResult]]:
+        """
+        Generate document and query embeddings in a single model invocation.
+
+        Each text gets the model's document or query prompt prepended, so the
+        results match embed_document/embed_query while paying for one batched
+        encode() call instead of one per text.
+
+        Args:
+            documents: Texts to embed as documents
+            queries: Texts to embed as queries
+
+        Returns:
+            Tuple of (document results, query results), each in input order
+
+        Raises:
+            ValueError: If both lists are empty or any text is empty
+        """
+        texts = [*documents, *queries]
+        if not texts:
+            logger.warning("Attempted to embed empty texts list")
+            raise ValueError("Texts list cannot be empty")
+
+        if any(not text or not text.strip() for text in texts):
+            logger.warning("Attempted to embed batch containing empty text")
+            raise ValueError("All texts must be non-empty and not just whitespace")
+
+        logger.debug(
+            "Generating embeddings for mixed batch of %d documents and %d queries",
+            len(documents),
+            len(queries)
+        )
+
+        document_prompt = self._resolve_prompt(("document", "passage", "corpus"))
+        query_prompt = self._resolve_prompt(("query",))
+        prompted_texts = [
+            *(document_prompt + text for text in documents),
+            *(query_prompt + text for text in queries),
+        ]
+
+        # prompt="" stops encode() from applying a default prompt on top of ours
+        embeddings = await asyncio.to_thread(
+            self.model.encode,
+            prompted_texts,
+            prompt="",
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+
+        results = [
+            EmbeddingVectorResult(text=text, embedding=embedding)
+            for text, embedding in zip(texts, embeddings)
+        ]
+        return results[:len(documents)], results[len(documents):]
@@ -2,9 +2,11 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import TypeVar, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TypeVar, Callable, Sequence, Protocol
 
-from sentence_transformers import CrossEncoder
+import numpy as np
 
 from src.app.core.domain.models import ScoredResult, Score, ScoreSource
 
@@ -13,6 +15,121 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+class PairScoringModel(Protocol):
+    """
+    Anything that scores (query, content) pairs like CrossEncoder.predict().
+
+    Satisfied by CrossEncoder regardless of backend (torch, onnx, openvino).
+    """
+
+    def predict(self, sentences: list[tuple[str, str]], **kwargs) -> np.ndarray:
+        ...
+
+
+class OnnxRuntimeCrossEncoder:
+    """
+    Cross-encoder that runs an ONNX export directly on ONNX Runtime.
+
+    Skips the sentence-transformers/torch wrapper entirely: pairs are tokenized
+    with the Rust `tokenizers` library and fed to an InferenceSession as int64
+    numpy arrays. The raw logit of the first output column is returned, which
+    matches CrossEncoder.predict() for single-label rerankers (no activation,
+    so ordering and score thresholds are unchanged).
+
+    Test-only: requires onnxruntime, which only the dev dependency group installs
+    (through the sentence-transformers[onnx] extra).
+    """
+
+    def __init__(self, session, tokenizer, max_length: int = 512):
+        """
+        Initialize from an already-built session and tokenizer.
+
+        Args:
+            session: onnxruntime.InferenceSession for the cross-encoder export
+            tokenizer: tokenizers.Tokenizer for the same model
+            max_length: Maximum tokens per (query, content) pair
+        """
+        tokenizer.enable_truncation(max_length=max_length)
+        tokenizer.enable_padding()  # Pad to the longest pair in each batch
+        self.session = session
+        self.tokenizer = tokenizer
+        self._input_names = {model_input.name for model_input in session.get_inputs()}
+
+    @classmethod
+    def from_pretrained(
+        cls,
+        model_name: str,
+        file_name: str = "onnx/model.onnx",
+        max_length: int = 512,
+        num_threads: int = 0,
+    ) -> "OnnxRuntimeCrossEncoder":
+        """
+        Load the ONNX export and tokenizer from the HuggingFace Hub (or local cache).
+
+        The session is created from the cached file path rather than from bytes,
+        so ONNX Runtime can memory-map the weights and processes loading the
+        same file share those pages.
+
+        Args:
+            model_name: HuggingFace model repository, e.g. "cross-encoder/ms-marco-MiniLM-L-6-v2"
+            file_name: ONNX file inside the repository
+            max_length: Maximum tokens per (query, content) pair
+            num_threads: Intra-op threads for ONNX Runtime. 0 uses its default
+                         (one per physical core); 1 also disables inter-op parallelism,
+                         for running one model per process on many processes.
+        """
+        import onnxruntime as ort
+        from huggingface_hub import hf_hub_download
+        from tokenizers import Tokenizer
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.enable_mem_pattern = True
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        if num_threads == 1:
+            options.inter_op_num_threads = 1
+        session = ort.InferenceSession(
+            hf_hub_download(model_name, file_name),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        return cls(session, Tokenizer.from_pretrained(model_name), max_length=max_length)
+
+    def predict(
+        self,
+        sentences: list[tuple[str, str]],
+        batch_size: int = 32,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Score (query, content) pairs.
+
+        Args:
+            sentences: Pairs to score
+            batch_size: Number of pairs per ONNX Runtime call
+            **kwargs: Accepted for CrossEncoder.predict() compatibility and ignored
+
+        Returns:
+            float32 array with one raw logit per pair
+        """
+        scores = []
+        for start in range(0, len(sentences), batch_size):
+            encodings = self.tokenizer.encode_batch(sentences[start:start + batch_size])
+            inputs = {
+                "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+                "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+                "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+            }
+            inputs = {name: value for name, value in inputs.items() if name in self._input_names}
+            logits = self.session.run(None, inputs)[0]
+            scores.append(logits[:, 0])
+
+        if not scores:
+            return np.empty(0, dtype=np.float32)
+        return np.concatenate(scores).astype(np.float32, copy=False)
+
+
 class RerankerService(ABC):
     """
     Abstract base class for reranking search results.
@@ -54,6 +171,48 @@ class RerankerService(ABC):
         """
         pass
 
+    @staticmethod
+    def _validate_rerank_inputs(queries: Sequence[str], results: Sequence[ScoredResult[T]]) -> None:
+        """
+        Validate rerank inputs without touching the model.
+
+        Raises:
+            ValueError: If queries is empty, any query is empty, or results sequence is empty
+        """
+        if not queries:
+            raise ValueError("Queries list cannot be empty")
+
+        if any(not query or not query.strip() for query in queries):
+            raise ValueError("Query cannot be empty")
+
+        if not results:
+            raise ValueError("Results list cannot be empty")
+
+    @abstractmethod
+    async def rerank_many(
+        self,
+        queries: Sequence[str],
+        results: Sequence[ScoredResult[T]],
+        content_extractor: Callable[[T], str],
+        top_k: int | None = None,
+    ) -> list[list[ScoredResult[T]]]:
+        """
+        Rerank the same results against several queries at once.
+
+        Args:
+            queries: The search query strings
+            results: Sequence of ScoredResult[T] to rerank against every query
+            content_extractor: Function to extract text content from the item
+            top_k: Optional number of top results to return per query. If None, returns all.
+
+        Returns:
+            One reranked list per query, in query order, each as returned by rerank().
+
+        Raises:
+            ValueError: If queries is empty, any query is empty, or results sequence is empty
+        """
+        pass
+
 
 class CrossEncoderReranker(RerankerService):
     """
@@ -65,16 +224,30 @@ class CrossEncoderReranker(RerankerService):
 
     Uses the assign_score() method to preserve score history, enabling
     full audit trail of how scores evolved through the pipeline.
+
+    Predictions run on a dedicated single-thread executor rather than the
+    event loop's default pool, so concurrent reranks queue up instead of
+    competing with the model's own intra-op threads for CPU cores.
     """
 
-    def __init__(self, model: CrossEncoder):
+    def __init__(self, model: PairScoringModel):
         """
         Initialize the CrossEncoder reranker.
 
         Args:
-            model: Pre-configured CrossEncoder model instance
+            model: Pre-configured CrossEncoder model instance (any backend),
+                   or any object exposing a compatible predict() method
         """
         self.model = model
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rerank")
+
+    async def _predict(self, pairs: list[tuple[str, str]], **kwargs) -> np.ndarray:
+        """Run model.predict on the reranker's inference thread without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(self.model.predict, pairs, convert_to_numpy=True, show_progress_bar=False, **kwargs)
+        )
 
     async def rerank(
         self,
@@ -103,11 +276,7 @@ class CrossEncoderReranker(RerankerService):
         Raises:
             ValueError: If query is empty or results sequence is empty
         """
-        if not query or not query.strip():
-            raise ValueError("Query cannot be empty")
-
-        if not results:
-            raise ValueError("Results list cannot be empty")
+        self._validate_rerank_inputs([query], results)
 
         logger.info(
             "Reranking %d items for query: '%s' (top_k=%s)",
@@ -120,25 +289,11 @@ class CrossEncoderReranker(RerankerService):
         pairs = [(query, content_extractor(result.item)) for result in results]
 
         # Score all pairs using the cross-encoder
-        # Run in thread pool to avoid blocking the event loop
-        scores = await asyncio.to_thread(
-            self.model.predict,
-            pairs,
-            convert_to_numpy=True
-        )
-
-        # Use assign_score() to preserve history
-        reranked_results = [
-            result.assign_score(Score(value=float(score), source=ScoreSource.CROSS_ENCODER))
-            for result, score in zip(results, scores)
-        ]
-
-        # Sort by score descending (highest relevance first)
-        reranked_results.sort(key=lambda x: x.value, reverse=True)
+        # Runs on the dedicated inference thread to avoid blocking the event loop
+        scores = await self._predict(pairs)
 
-        # Apply top_k limit if specified
-        if top_k is not None:
-            reranked_results = reranked_results[:top_k]
+        # Order (and top_k-limit) on the score array, then assign_score() to preserve history
+        reranked_results = self._assign_ranked_scores(results, scores, top_k)
 
         logger.info(
             "Reranking complete. Top score: %.4f, Bottom score: %.4f",
@@ -147,3 +302,75 @@ class CrossEncoderReranker(RerankerService):
         )
 
         return reranked_results
+
+    async def rerank_many(
+        self,
+        queries: Sequence[str],
+        results: Sequence[ScoredResult[T]],
+        content_extractor: Callable[[T], str],
+        top_k: int | None = None,
+    ) -> list[list[ScoredResult[T]]]:
+        """
+        Rerank the same results against several queries with one predict() call.
+
+        All (query, content) pairs go through the CrossEncoder as a single
+        batched workload, so tokenizer padding and the forward pass are
+        amortized across queries instead of paid once per query.
+
+        Args:
+            queries: The search query strings
+            results: Sequence of ScoredResult[T] to rerank against every query
+            content_extractor: Function to extract text content from the item
+            top_k: Optional number of top results to return per query. If None, returns all.
+
+        Returns:
+            One list per query (in query order) of ScoredResult[T] sorted by
+            CrossEncoder score descending, with previous scores in score_history.
+
+        Raises:
+            ValueError: If queries is empty, any query is empty, or results sequence is empty
+        """
+        self._validate_rerank_inputs(queries, results)
+
+        logger.info("Reranking %d items for %d queries", len(results), len(queries))
+
+        contents = [content_extractor(result.item) for result in results]
+        pairs = [(query, content) for query in queries for content in contents]
+
+        scores = await self._predict(pairs, batch_size=32)
+        score_matrix = np.asarray(scores).reshape(len(queries), len(results))
+
+        return [
+            self._assign_ranked_scores(results, query_scores, top_k)
+            for query_scores in score_matrix
+        ]
+
+    @staticmethod
+    def _assign_ranked_scores(
+        results: Sequence[ScoredResult[T]],
+        scores: np.ndarray,
+        top_k: int | None,
+    ) -> list[ScoredResult[T]]:
+        """
+        Return results ordered by score descending, limited to top_k, with CrossEncoder scores assigned.
+
+        Ordering happens on the numpy score array: argpartition finds the
+        top_k-th score in O(n), and only candidates at or above it are sorted.
+        The stable sort keeps input order for tied scores, matching a
+        stable descending sort. Only the returned results get assign_score().
+        """
+        scores = np.asarray(scores, dtype=np.float32)
+        if top_k is not None and top_k < len(scores):
+            if top_k <= 0:
+                return []
+            kth_score = -np.partition(-scores, top_k - 1)[top_k - 1]
+            candidates = np.flatnonzero(scores >= kth_score)
+            order = candidates[np.argsort(-scores[candidates], kind="stable")][:top_k]
+        else:
+            order = np.argsort(-scores, kind="stable")
+
+        # One tolist() call converts the selected float32 scores to Python floats in C
+        return [
+            results[i].assign_score(Score(value=value, source=ScoreSource.CROSS_ENCODER))
+            for i, value in zip(order.tolist(), scores[order].tolist())
+        ]
@@ -1,13 +1,20 @@
 """Reciprocal Rank Fusion (RRF) for combining multiple ranked result lists."""
+import heapq
+
+import numpy as np
 
-from uuid import UUID
 from src.app.core.domain.models import (
     DocumentChunk,
+    Score,
     ScoredResult,
     ScoreSource,
 )
 
 
+# Covers search.max_top_k (100) times the largest retrieval multiplier (3) per input list
+_PRESIZED_RANKS = 512
+
+
 class ReciprocalRankFusion:
     """
     Implements Reciprocal Rank Fusion (RRF) for combining multiple ranked lists.
@@ -41,6 +48,20 @@ class ReciprocalRankFusion:
         if k < 0:
             raise ValueError("k must be non-negative")
         self.k = k
+        # Table of 1 / (k + rank) for rank = 1, 2, ...: k is fixed per instance, so each
+        # RRF contribution is a table load. Pre-sized for typical list depths and grown
+        # on demand for deeper ones.
+        self._reciprocals: np.ndarray = np.empty(0, dtype=np.float32)
+        self._ensure_reciprocals(_PRESIZED_RANKS)
+
+    def _ensure_reciprocals(self, n: int) -> np.ndarray:
+        """Return the reciprocal-rank table, growing it (at least doubling) to cover n ranks."""
+        if n > len(self._reciprocals):
+            size = max(2 * len(self._reciprocals), n)
+            ranks = np.arange(1, size + 1, dtype=np.float64)
+            # Replace rather than resize in place, so concurrent readers keep a valid table
+            self._reciprocals = (1.0 / (self.k + ranks)).astype(np.float32)
+        return self._reciprocals
 
     def fuse(
         self,
@@ -50,7 +71,8 @@ class ReciprocalRankFusion:
         Fuse multiple ranked lists using Reciprocal Rank Fusion.
 
         For each chunk, the score_history is populated with all scores from
-        the input lists (preserving provenance for debugging) using assign_score().
+        the input lists (preserving provenance for debugging), in the order
+        assign_score() would record them.
 
         Args:
             *ranked_lists: Variable number of ranked result lists.
@@ -64,41 +86,17 @@ class ReciprocalRankFusion:
         if not ranked_lists:
             return []
 
-        # Track RRF scores and accumulated ScoredResults for each chunk
-        rrf_scores: dict[UUID, float] = {}
-        chunk_results: dict[UUID, ScoredResult[DocumentChunk]] = {}
-
-        for ranked_list in ranked_lists:
-            for rank, result in enumerate(ranked_list, start=1):
-                chunk_id = result.item.id
-
-                # Compute RRF contribution: 1 / (k + rank)
-                rrf_contribution = 1.0 / (self.k + rank)
-                rrf_scores[chunk_id] = rrf_scores.get(chunk_id, 0.0) + rrf_contribution
-
-                if chunk_id not in chunk_results:
-                    # First occurrence - store as-is
-                    chunk_results[chunk_id] = result
-                else:
-                    # Merge scores using assign_score to preserve history
-                    existing = chunk_results[chunk_id]
-                    # Add each historical score from the new result
-                    for hist_score in result.score_history:
-                        existing = existing.assign_score(hist_score)
-                    # Add the new result's current score
-                    existing = existing.assign_score(result.score)
-                    chunk_results[chunk_id] = existing
-
-        # Build fused results by assigning RRF scores using assign_score
-        fused_results = [
-            chunk_results[chunk_id].assign_score(ScoreSource.RRF_FUSION.of(score))
-            for chunk_id, score in rrf_scores.items()
-        ]
+        single_list = self._single_ranked_list(ranked_lists)
+        if single_list is not None:
+            return self._rank_single_list(single_list)
 
-        # Sort by score descending (highest RRF score first)
-        fused_results.sort(key=lambda r: r.value, reverse=True)
+        chunk_results, merged_histories, rrf_scores = self._accumulate(ranked_lists)
 
-        return fused_results
+        # Sort by RRF score descending, breaking ties explicitly on first-seen order
+        # (slots are assigned in first-seen order, so the slot index is the tie key)
+        first_seen = np.arange(len(rrf_scores))
+        order = np.lexsort((first_seen, -rrf_scores))
+        return self._assign_rrf_scores(chunk_results, merged_histories, rrf_scores, order.tolist())
 
     def fuse_with_limit(
         self,
@@ -108,7 +106,9 @@ class ReciprocalRankFusion:
         """
         Fuse multiple ranked lists and return top-k results.
 
-        This is a convenience method that applies a limit after fusion.
+        Only the top `limit` chunks are selected (heapq.nlargest, O(n log limit))
+        and given their RRF score; the rest of the fused list is never sorted
+        or built.
 
         Args:
             *ranked_lists: Variable number of ranked result lists.
@@ -117,5 +117,129 @@ class ReciprocalRankFusion:
         Returns:
             Top-k fused results sorted by RRF score.
         """
-        fused = self.fuse(*ranked_lists)
-        return fused[:limit]
+        if not ranked_lists or limit <= 0:
+            return []
+
+        single_list = self._single_ranked_list(ranked_lists)
+        if single_list is not None:
+            return self._rank_single_list(single_list[:limit])
+
+        chunk_results, merged_histories, rrf_scores = self._accumulate(ranked_lists)
+
+        # nlargest is stable: equal RRF scores keep first-seen order, as in fuse()
+        scores = rrf_scores.tolist()
+        top_slots = heapq.nlargest(limit, range(len(scores)), key=scores.__getitem__)
+        return self._assign_rrf_scores(chunk_results, merged_histories, rrf_scores, top_slots)
+
+    @staticmethod
+    def _single_ranked_list(
+        ranked_lists: tuple[list[ScoredResult[DocumentChunk]], ...],
+    ) -> list[ScoredResult[DocumentChunk]] | None:
+        """
+        Return the only non-empty input list when there is nothing to fuse, else None.
+
+        A single list with distinct chunks keeps its order under RRF (1 / (k + rank)
+        strictly decreases), so it needs no slot map, scatter-add or sort. A list
+        that repeats a chunk still goes through the full path to merge its scores.
+        """
+        non_empty = [ranked_list for ranked_list in ranked_lists if ranked_list]
+        if len(non_empty) > 1:
+            return None
+        if not non_empty:
+            return []
+
+        ranked_list = non_empty[0]
+        if len({result.item.id.int for result in ranked_list}) != len(ranked_list):
+            return None
+        return ranked_list
+
+    def _rank_single_list(
+        self,
+        ranked_list: list[ScoredResult[DocumentChunk]],
+    ) -> list[ScoredResult[DocumentChunk]]:
+        """Assign each result its positional RRF score 1 / (k + rank), keeping input order."""
+        reciprocals = self._ensure_reciprocals(len(ranked_list))[:len(ranked_list)]
+        return [
+            result.assign_score(ScoreSource.RRF_FUSION.of(score))
+            for result, score in zip(ranked_list, reciprocals.tolist())
+        ]
+
+    def _accumulate(
+        self,
+        ranked_lists: tuple[list[ScoredResult[DocumentChunk]], ...],
+    ) -> tuple[list[ScoredResult[DocumentChunk]], dict[int, list[Score]], np.ndarray]:
+        """
+        Merge the input lists into one slot per chunk plus its RRF score.
+
+        Returns:
+            (results, merged_histories, scores): results[i] is the chunk's first-seen
+            ScoredResult and scores[i] its RRF score, with slots in first-seen order.
+            For chunks seen more than once, merged_histories[i] holds every score from
+            all occurrences (oldest first), ready to become the fused score_history.
+        """
+        # Map each chunk ID to a dense slot (first-seen order) and keep its first result.
+        # Keyed by UUID.int: a plain int hashes in C, while UUID.__hash__ is a Python-level call.
+        slot_by_id: dict[int, int] = {}
+        chunk_results: list[ScoredResult[DocumentChunk]] = []
+        merged_histories: dict[int, list[Score]] = {}
+        list_slots: list[np.ndarray] = []
+
+        for ranked_list in ranked_lists:
+            slots = np.empty(len(ranked_list), dtype=np.intp)
+            for position, result in enumerate(ranked_list):
+                # Single dict probe: returns the existing slot or claims the next free one
+                next_slot = len(chunk_results)
+                slot = slot_by_id.setdefault(result.item.id.int, next_slot)
+
+                if slot == next_slot:
+                    # First occurrence - store as-is
+                    chunk_results.append(result)
+                else:
+                    # Repeat occurrence: collect its scores in the same order assign_score()
+                    # would, and build the merged ScoredResult once in _assign_rrf_scores()
+                    history = merged_histories.get(slot)
+                    if history is None:
+                        first = chunk_results[slot]
+                        history = merged_histories[slot] = [*first.score_history, first.score]
+                    history.extend(result.score_history)
+                    history.append(result.score)
+
+                slots[position] = slot
+            list_slots.append(slots)
+
+        # Scatter-add each list's RRF contributions 1 / (k + rank) into the slot scores.
+        # float32 is ample for RRF (a 24-bit mantissa against contributions >= ~1e-4)
+        # and halves the memory the scatter-add and sort walk over for large pools.
+        reciprocals = self._ensure_reciprocals(max(len(slots) for slots in list_slots))
+        rrf_scores = np.zeros(len(chunk_results), dtype=np.float32)
+        for slots in list_slots:
+            np.add.at(rrf_scores, slots, reciprocals[:len(slots)])
+
+        return chunk_results, merged_histories, rrf_scores
+
+    @staticmethod
+    def _assign_rrf_scores(
+        chunk_results: list[ScoredResult[DocumentChunk]],
+        merged_histories: dict[int, list[Score]],
+        rrf_scores: np.ndarray,
+        slots: list[int],
+    ) -> list[ScoredResult[DocumentChunk]]:
+        """
+        Build the fused results for the given slots (in order).
+
+        Chunks seen once get assign_score(); repeated chunks are built once from
+        their merged history, matching what chained assign_score() calls produce.
+        """
+        fused = []
+        for slot, value in zip(slots, rrf_scores[slots].tolist()):
+            rrf_score = ScoreSource.RRF_FUSION.of(value)
+            history = merged_histories.get(slot)
+            if history is None:
+                fused.append(chunk_results[slot].assign_score(rrf_score))
+            else:
+                fused.append(ScoredResult(
+                    item=chunk_results[slot].item,
+                    score=rrf_score,
+                    score_history=history,
+                ))
+        return fused
@@ -6,12 +6,15 @@ merging and ranking results from different search services.
 """
 import asyncio
 import logging
-from typing import cast
+import time
+from collections import OrderedDict
+from typing import Optional, cast
 
 from src.app.core.domain.models import (
     Client,
     Document,
     ScoredResult,
+    SearchMode,
     SearchRequest,
     SearchResult,
 )
@@ -21,6 +24,62 @@ from src.app.core.services.document_search_service import DocumentSearchService
 logger = logging.getLogger(__name__)
 
 
+class SearchResultCache:
+    """
+    Bounded LRU of unified search results keyed by (query, top_k, mode).
+
+    SearchService is built per request, so the cache is a separate object
+    shared across instances. Entries expire after ttl_seconds, which bounds
+    how long a newly added client or document can be missing from a cached
+    query's results.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 30.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached requests. Use 0 to disable caching.
+            ttl_seconds: Seconds a cached result list stays valid
+        """
+        if max_size < 0:
+            raise ValueError("max_size must be non-negative")
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, int, SearchMode], tuple[float, tuple[SearchResult, ...]]] = OrderedDict()
+
+    @staticmethod
+    def _key(request: SearchRequest) -> tuple[str, int, SearchMode]:
+        return request.query, request.top_k, request.mode
+
+    def get(self, request: SearchRequest) -> Optional[list[SearchResult]]:
+        """Return the cached results for the request, or None on a miss or expired entry."""
+        key = self._key(request)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, results = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return list(results)
+
+    def put(self, request: SearchRequest, results: list[SearchResult]) -> None:
+        """Store results for the request, evicting the least recently used entry when full."""
+        if self.max_size == 0:
+            return
+
+        key = self._key(request)
+        self._entries[key] = (time.monotonic(), tuple(results))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
 class SearchService:
     """
     Unified search service that queries both clients and documents.
@@ -33,6 +92,7 @@ class SearchService:
         self,
         client_search_service: ClientSearchService,
         document_search_service: DocumentSearchService,
+        result_cache: Optional[SearchResultCache] = None,
     ):
         """
         Initialize the unified search service.
@@ -40,16 +100,20 @@ class SearchService:
         Args:
             client_search_service: Service for searching clients
             document_search_service: Service for searching documents
+            result_cache: Optional shared cache. Repeated requests are answered
+                          from it without calling either search service.
         """
         self.client_search_service = client_search_service
         self.document_search_service = document_search_service
+        self.result_cache = result_cache
 
     async def search(self, request: SearchRequest) -> list[SearchResult]:
         """
         Search across both clients and documents.
 
-        Executes searches in parallel, combines results, sorts by score descending,
-        assigns ranks, and returns the top_k results.
+        Executes searches in parallel, merges the two score-sorted result lists,
+        and returns the top_k results. With a result cache configured, a repeated
+        request is served from the cache instead.
 
         Args:
             request: Search request with query, top_k, and threshold
@@ -63,6 +127,12 @@ class SearchService:
             request.top_k,
         )
 
+        if self.result_cache is not None:
+            cached = self.result_cache.get(request)
+            if cached is not None:
+                logger.info("Returning %d cached unified results", len(cached))
+                return cached
+
         # Execute searches in parallel for better performance
         client_results_raw, document_results_raw = await asyncio.gather(
             self.client_search_service.search(request),
@@ -70,37 +140,71 @@ class SearchService:
             return_exceptions=True,
         )
 
-        # Build unified results from both sources
-        unified_results: list[SearchResult] = []
+        client_results: list[ScoredResult[Client]] = []
+        document_results: list[ScoredResult[Document]] = []
 
         # Handle exceptions from either service
         if isinstance(client_results_raw, Exception):
             logger.error("Client search failed: %s", client_results_raw)
         else:
             client_results = cast(list[ScoredResult[Client]], client_results_raw)
-            for result in client_results:
-                unified_results.append(SearchResult(
-                    type="CLIENT",
-                    entity=result.item,
-                    score=result.value,
-                ))
         if isinstance(document_results_raw, Exception):
             logger.error("Document search failed: %s", document_results_raw)
         else:
             document_results = cast(list[ScoredResult[Document]], document_results_raw)
-            for result in document_results:
-                unified_results.append(SearchResult(
-                    type="DOCUMENT",
-                    entity=result.item,
-                    score=result.value,
-                ))
 
-        # Sort by score descending and take top_k
-        unified_results.sort(key=lambda r: r.score, reverse=True)
-        unified_results = unified_results[:request.top_k]
+        unified_results = self._merge_two_desc(client_results, document_results, request.top_k)
+
+        # Only cache complete answers: a failed service would otherwise stay hidden until expiry
+        both_succeeded = not isinstance(client_results_raw, Exception) and not isinstance(
+            document_results_raw, Exception
+        )
+        if self.result_cache is not None and both_succeeded:
+            self.result_cache.put(request, unified_results)
 
         logger.info(
             "Returning %d unified results (top_k=%d)", len(unified_results), request.top_k
         )
 
         return unified_results
+
+    @staticmethod
+    def _merge_two_desc(
+        client_results: list[ScoredResult[Client]],
+        document_results: list[ScoredResult[Document]],
+        limit: int,
+    ) -> list[SearchResult]:
+        """
+        Merge two score-sorted (descending) result lists into the top `limit` SearchResults.
+
+        Both services return results sorted by score descending, so a two-pointer
+        merge yields the combined order with one comparison per output and stops
+        after `limit` results. On equal scores clients come before documents.
+        """
+        unified_results: list[SearchResult] = []
+        i = j = 0
+        while i < len(client_results) and j < len(document_results) and len(unified_results) < limit:
+            client_result = client_results[i]
+            document_result = document_results[j]
+            if client_result.value >= document_result.value:
+                unified_results.append(
+                    SearchResult(type="CLIENT", entity=client_result.item, score=client_result.value)
+                )
+                i += 1
+            else:
+                unified_results.append(
+                    SearchResult(type="DOCUMENT", entity=document_result.item, score=document_result.value)
+                )
+                j += 1
+
+        remaining = limit - len(unified_results)
+        unified_results.extend(
+            SearchResult(type="CLIENT", entity=result.item, score=result.value)
+            for result in client_results[i:i + remaining]
+        )
+        remaining = limit - len(unified_results)
+        unified_results.extend(
+            SearchResult(type="DOCUMENT", entity=result.item, score=result.value)
+            for result in document_results[j:j + remaining]
+        )
+        return unified_results
@@ -1,6 +1,10 @@
 """Document summarization service using LLM providers."""
+import asyncio
+import hashlib
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
 
 import anthropic
 import google.generativeai as genai
@@ -25,6 +29,25 @@ Document:
 Summary:"""
 
 
+@lru_cache(maxsize=8)
+def _prompt_parts(max_words: int) -> tuple[str, str]:
+    """Split the template around {content} once per max_words, with max_words already filled in."""
+    prefix, suffix = SUMMARIZATION_PROMPT_TEMPLATE.split("{content}")
+    return prefix.format(max_words=max_words), suffix.format(max_words=max_words)
+
+
+def _format_prompt(content: str, max_words: int) -> str:
+    """Build the summarization prompt by concatenation instead of parsing the template per call."""
+    prefix, suffix = _prompt_parts(max_words)
+    return prefix + content + suffix
+
+
+@lru_cache(maxsize=8)
+def _get_claude_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Return the shared AsyncAnthropic client for an API key, so its connection pool is reused."""
+    return anthropic.AsyncAnthropic(api_key=api_key)
+
+
 class SummarizationService(ABC):
     """Abstract base class for document summarization."""
 
@@ -44,16 +67,126 @@ class SummarizationService(ABC):
         """
         pass
 
+    async def summarize_many(self, contents: list[str], max_concurrency: int = 8) -> list[str | None]:
+        """
+        Summarize several documents concurrently.
+
+        LLM round-trips overlap instead of running back to back, with at most
+        max_concurrency requests in flight to stay within provider rate limits.
+
+        Args:
+            contents: The document texts to summarize.
+            max_concurrency: Maximum number of concurrent summarize() calls.
+
+        Returns:
+            One summary per input, in input order. None for a document whose
+            summarization failed, so one failure does not discard the batch.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def summarize_one(content: str) -> str | None:
+            async with semaphore:
+                try:
+                    return await self.summarize(content)
+                except SummarizationError as e:
+                    logger.warning("Summarization failed for one document in batch: %s", e)
+                    return None
+
+        return list(await asyncio.gather(*(summarize_one(content) for content in contents)))
+
 
 class SummarizationError(Exception):
     """Exception raised when summarization fails."""
     pass
 
 
-class ClaudeSummarizationService(SummarizationService):
-    """Summarization service using Anthropic's Claude API."""
+class LLMSummarizationService(SummarizationService):
+    """
+    Shared summarize() flow for LLM providers.
+
+    Formats the prompt, awaits the provider's completion, strips the text and
+    wraps provider errors in SummarizationError. Subclasses only implement
+    _complete() and name the errors their SDK raises.
+
+    Successful summaries are cached in a bounded LRU keyed by a digest of the
+    content, so summarizing the same document again skips the LLM call.
+    """
+
+    provider_name: str = "LLM"
+    api_errors: tuple[type[Exception], ...] = (Exception,)
+
+    def __init__(self, max_words: int = 100, max_tokens: int = 200, cache_size: int = 1024):
+        if cache_size < 0:
+            raise ValueError("cache_size must be non-negative")
+        self.max_words = max_words
+        self.max_tokens = max_tokens
+        self.cache_size = cache_size
+        self._summary_cache: OrderedDict[bytes, str] = OrderedDict()
+
+    @staticmethod
+    def _cache_key(content: str) -> bytes:
+        """Compute a compact digest of the content to use as a cache key."""
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+    def _cache_summary(self, key: bytes, summary: str) -> None:
+        """Store a summary, evicting the least recently used entry when full."""
+        if self.cache_size == 0:
+            return
+
+        self._summary_cache[key] = summary
+        self._summary_cache.move_to_end(key)
+        if len(self._summary_cache) > self.cache_size:
+            self._summary_cache.popitem(last=False)
+
+    @abstractmethod
+    async def _complete(self, prompt: str) -> str:
+        """Return the provider's raw completion text for the prompt."""
+        pass
+
+    async def summarize(self, content: str) -> str:
+        """Generate a summary using the provider's completion, or return the cached one."""
+        key = self._cache_key(content)
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            self._summary_cache.move_to_end(key)
+            logger.debug("Summary cache hit for content of length %d", len(content))
+            return cached
+
+        try:
+            summary = (await self._complete(_format_prompt(content, self.max_words))).strip()
+        except self.api_errors as e:
+            logger.error("%s API error during summarization: %s", self.provider_name, e)
+            raise SummarizationError(f"{self.provider_name} summarization failed: {e}") from e
+        logger.info("Generated summary with %s (%d chars)", self.provider_name, len(summary))
+        self._cache_summary(key, summary)
+        return summary
+
+
+class ClaudeSummarizationService(LLMSummarizationService):
+    """
+    Summarization service using Anthropic's Claude API.
+
+    Services built with the same API key share one AsyncAnthropic client
+    (and its HTTP connection pool) instead of opening new connections.
+    """
+
+    provider_name = "Claude"
+    api_errors = (anthropic.APIError,)
 
-    def __init__(self, api_key: str, model: str, max_words: int = 100, max_tokens: int = 200):
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        max_words: int = 100,
+        max_tokens: int = 200,
+        cache_size: int = 1024,
+    ):
         """
         Initialize the Claude summarization service.
 
@@ -62,38 +195,47 @@ class ClaudeSummarizationService(SummarizationService):
             model: Claude model to use for summarization.
             max_words: Target maximum words for the summary.
             max_tokens: Maximum tokens for the LLM response.
+            cache_size: Maximum number of summaries to keep cached. Use 0 to disable caching.
 
         Raises:
             ValueError: If model is not provided.
         """
         if not model:
             raise ValueError("Claude model must be specified")
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        super().__init__(max_words=max_words, max_tokens=max_tokens, cache_size=cache_size)
+        self.client = _get_claude_client(api_key)
         self.model = model
-        self.max_words = max_words
-        self.max_tokens = max_tokens
 
-    async def summarize(self, content: str) -> str:
-        """Generate a summary using Claude."""
-        try:
-            prompt = SUMMARIZATION_PROMPT_TEMPLATE.format(content=content, max_words=self.max_words)
-            message = await self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            summary = message.content[0].text.strip()
-            logger.info("Generated summary with Claude (%d chars)", len(summary))
-            return summary
-        except anthropic.APIError as e:
-            logger.error("Claude API error during summarization: %s", e)
-            raise SummarizationError(f"Claude summarization failed: {e}") from e
-
-
-class GeminiSummarizationService(SummarizationService):
-    """Summarization service using Google's Gemini API."""
-
-    def __init__(self, api_key: str, model: str, max_words: int = 100, max_tokens: int = 200):
+    async def _complete(self, prompt: str) -> str:
+        """Return the text of Claude's response to the prompt."""
+        message = await self.client.messages.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return message.content[0].text
+
+
+class GeminiSummarizationService(LLMSummarizationService):
+    """
+    Summarization service using Google's Gemini API.
+
+    genai.configure() is process-global, so each service configures the SDK
+    with its own API key rather than caching per key: a cached entry would
+    silently keep whichever key was configured last.
+    """
+
+    provider_name = "Gemini"
+    api_errors = (Exception,)
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        max_words: int = 100,
+        max_tokens: int = 200,
+        cache_size: int = 1024,
+    ):
         """
         Initialize the Gemini summarization service.
 
@@ -102,25 +244,18 @@ class GeminiSummarizationService(SummarizationService):
             model: Gemini model to use for summarization.
             max_words: Target maximum words for the summary.
             max_tokens: Maximum tokens for the LLM response (not used by Gemini but kept for consistency).
+            cache_size: Maximum number of summaries to keep cached. Use 0 to disable caching.
 
         Raises:
             ValueError: If model is not provided.
         """
         if not model:
             raise ValueError("Gemini model must be specified")
+        super().__init__(max_words=max_words, max_tokens=max_tokens, cache_size=cache_size)
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel(model)
-        self.max_words = max_words
-        self.max_tokens = max_tokens
 
-    async def summarize(self, content: str) -> str:
-        """Generate a summary using Gemini."""
-        try:
-            prompt = SUMMARIZATION_PROMPT_TEMPLATE.format(content=content, max_words=self.max_words)
-            response = await self.model.generate_content_async(prompt)
-            summary = response.text.strip()
-            logger.info("Generated summary with Gemini (%d chars)", len(summary))
-            return summary
-        except Exception as e:
-            logger.error("Gemini API error during summarization: %s", e)
-            raise SummarizationError(f"Gemini summarization failed: {e}") from e
\ No newline at end of file
+    async def _complete(self, prompt: str) -> str:
+        """Return the text of Gemini's response to the prompt."""
+        response = await self.model.generate_content_async(prompt)
+        return response.text
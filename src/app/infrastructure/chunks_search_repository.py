@@ -2,13 +2,22 @@
 import re
 from typing import Optional
 
-from sqlalchemy import select, func
+import numpy as np
+from pgvector.sqlalchemy import HALFVEC, VECTOR
+from sqlalchemy import bindparam, cast, select, func
 
 from src.app.core.domain.models import DocumentChunk, ScoredResult, Score, ScoreSource
 from src.shared.database.base_repo import BaseRepository
 from src.shared.database.database import Database
 from src.app.infrastructure.entities.document_entity import DocumentChunkEntity
-from src.app.infrastructure.mappers.document_chunk_mapper import DocumentChunkMapper
+from src.app.infrastructure.mappers.document_chunk_mapper import DocumentChunkMapper, l2_normalize
+
+# Candidates fetched from the half-precision index per requested result, before exact rescoring
+_HALFVEC_CANDIDATE_MULTIPLIER = 4
+
+# Bounds for hnsw.ef_search: pgvector's default and its maximum
+_MIN_EF_SEARCH = 40
+_MAX_EF_SEARCH = 1000
 
 
 class ChunksRepositorySearch(BaseRepository[DocumentChunkEntity, DocumentChunk]):
@@ -16,7 +25,9 @@ class ChunksRepositorySearch(BaseRepository[DocumentChunkEntity, DocumentChunk])
     Repository for searching document chunks using vector similarity.
 
     This repository extends BaseRepository to provide vector search capabilities
-    using pgvector's cosine distance operator for finding semantically similar chunks.
+    using pgvector's inner product operator for finding semantically similar chunks.
+    Stored embeddings are unit length (see DocumentChunkMapper), so the inner
+    product with a normalized query is the cosine similarity.
     """
 
     def __init__(self, db: Database, mapper: DocumentChunkMapper):
@@ -24,14 +35,21 @@ class ChunksRepositorySearch(BaseRepository[DocumentChunkEntity, DocumentChunk])
 
     async def search_by_vector(
         self,
-        query_vector: list[float],
+        query_vector: np.ndarray | list[float],
         limit: int = 10,
         similarity_threshold: Optional[float] = None
     ) -> list[ScoredResult[DocumentChunk]]:
         """
         Search for document chunks similar to the query vector.
 
-        Uses pgvector's cosine distance (<=> operator) to find similar chunks.
+        Uses pgvector's negative inner product (<#> operator) against the
+        normalized query vector, which ranks identically to cosine distance
+        on unit-length embeddings but skips the per-row norm computation.
+
+        Ranking runs in two stages: the half-precision (halfvec) HNSW index
+        picks limit * 4 candidates while reading half the vector bytes, then
+        the candidates are rescored against the full-precision embeddings,
+        which are the scores returned and compared to the threshold.
         Results are ordered by similarity (highest first) and limited to top K.
 
         Args:
@@ -47,33 +65,59 @@ class ChunksRepositorySearch(BaseRepository[DocumentChunkEntity, DocumentChunk])
         Raises:
             ValueError: If query_vector is empty or has wrong dimensions
         """
-        if not query_vector:
+        if query_vector is None or len(query_vector) == 0:
             raise ValueError("Query vector cannot be empty")
 
-        if len(query_vector) != 384:
+        # Convert once to a contiguous float32 buffer (the column's precision);
+        # lists are accepted and converted here rather than boxed per element by the driver
+        query_vector = np.ascontiguousarray(query_vector, dtype=np.float32)
+        if query_vector.shape != (384,):
             raise ValueError(f"Query vector must be 384-dimensional, got {len(query_vector)}")
+        query_vector = l2_normalize(query_vector)
+
+        # One bind parameter reused by both stages, so the vector is serialized
+        # and sent once. The explicit cast keeps its inferred type consistent.
+        query_param = cast(bindparam("query_vector", query_vector, type_=VECTOR(384)), VECTOR(384))
+
+        # Coarse stage: order by the half-precision expression the HNSW index is built on
+        candidate_count = limit * _HALFVEC_CANDIDATE_MULTIPLIER
+        half_distance = cast(DocumentChunkEntity.embedding, HALFVEC(384)).max_inner_product(
+            cast(query_param, HALFVEC(384))
+        )
+        candidate_ids = (
+            select(DocumentChunkEntity.id)
+            .where(DocumentChunkEntity.embedding.isnot(None))
+            .order_by(half_distance)
+            .limit(candidate_count)
+            .scalar_subquery()
+        )
 
-        # Compute similarity as 1 - cosine_distance
-        similarity = (1 - DocumentChunkEntity.embedding.cosine_distance(query_vector)).label("similarity")
+        # Exact stage: <#> returns the negative inner product, so ascending order is most similar first
+        distance = DocumentChunkEntity.embedding.max_inner_product(query_param)
+        # Compute similarity as the inner product (cosine similarity for unit vectors)
+        similarity = (-distance).label("similarity")
 
         # Build query with threshold filter in SQL for efficiency
         query = (
             select(DocumentChunkEntity, similarity)
-            .where(DocumentChunkEntity.embedding.isnot(None))
+            .where(DocumentChunkEntity.id.in_(candidate_ids))
         )
 
         if similarity_threshold is not None:
-            query = query.where(
-                (1 - DocumentChunkEntity.embedding.cosine_distance(query_vector)) >= similarity_threshold
-            )
+            query = query.where(distance <= -similarity_threshold)
 
         query = (
             query
-            .order_by(DocumentChunkEntity.embedding.cosine_distance(query_vector))
+            .order_by(distance)
             .limit(limit)
         )
 
-        results = await self._search_with_scores(query)
+        # An HNSW scan returns at most ef_search rows, so widen it to cover every
+        # candidate. set_config(..., true) is SET LOCAL: it ends with the transaction.
+        ef_search = min(max(candidate_count, _MIN_EF_SEARCH), _MAX_EF_SEARCH)
+        set_ef_search = select(func.set_config("hnsw.ef_search", str(ef_search), True))
+
+        results = await self._search_with_scores(query, setup_statements=[set_ef_search])
         return [
             ScoredResult(
                 item=chunk,
@@ -115,7 +159,8 @@ class ChunksRepositorySearch(BaseRepository[DocumentChunkEntity, DocumentChunk])
         # ts_rank will give higher scores to documents matching more terms
         or_query = ' | '.join(cleaned_words)
         ts_query = func.to_tsquery('english', or_query)
-        ts_vector = func.to_tsvector('english', DocumentChunkEntity.chunk_content)
+        # Stored generated column: matched rows are ranked without re-running to_tsvector
+        ts_vector = DocumentChunkEntity.content_tsv
 
         query = (
             select(
@@ -1,6 +1,7 @@
 from uuid import UUID
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, select, Uuid
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from src.app.core.domain.models import Document
 from src.shared.database.base_repo import BaseRepository
@@ -25,6 +26,10 @@ class DocumentRepository(BaseRepository[DocumentEntity, Document]):
         """
         Get multiple documents by their IDs in a single query.
 
+        The IDs are bound as one uuid[] parameter (id = ANY($1)) rather than an
+        expanded IN list, so the SQL text is identical for any number of IDs
+        and the prepared statement is reused across calls.
+
         Args:
             document_ids: List of document IDs to fetch
 
@@ -34,8 +39,9 @@ class DocumentRepository(BaseRepository[DocumentEntity, Document]):
         if not document_ids:
             return []
 
+        ids_param = bindparam("document_ids", value=list(document_ids), type_=ARRAY(Uuid()))
         return await self.find_all(
-            select(DocumentEntity).where(DocumentEntity.id.in_(document_ids))
+            select(DocumentEntity).where(DocumentEntity.id == any_(ids_param))
         )
 
     async def get_client_document_by_id(
@@ -2,13 +2,39 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from uuid import UUID, uuid4
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import String, DateTime, func, Enum, ForeignKey, Integer, Text, Index, text
+import numpy as np
+from pgvector.sqlalchemy import HALFVEC, Vector
+from sqlalchemy import String, DateTime, func, Enum, ForeignKey, Integer, Text, Index, Computed, cast, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.shared.database.database import Base
 
 
+class Float32Vector(Vector):
+    """
+    pgvector column type that loads values as float32 numpy arrays.
+
+    From pgvector 0.5 the stock type parses the '[x,y,...]' text into a list of
+    Python floats, which DocumentChunk then converts to float32 again; parsing
+    straight into a numpy array skips the per-element float objects. Older
+    releases (0.4.x) already return float32 arrays, and np.asarray passes those
+    through without a copy.
+    """
+
+    cache_ok = True
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            if value is None:
+                return None
+            if isinstance(value, str):
+                return np.fromstring(value[1:-1], dtype=np.float32, sep=",")
+            return np.asarray(value, dtype=np.float32)
+        return process
+
+
 class DocumentStatus(str, PyEnum):
     """Document processing status enum."""
     PENDING = "PENDING"
@@ -59,11 +85,20 @@ class DocumentChunkEntity(Base):
 
     # Vector embedding field - nullable for now
     # Using all-MiniLM-L6-v2 which produces 384-dimensional embeddings
-    embedding: Mapped[list[float] | None] = mapped_column(
-        Vector(384),  # Dimension for all-MiniLM-L6-v2 embeddings
+    embedding: Mapped[np.ndarray | None] = mapped_column(
+        Float32Vector(384),  # Dimension for all-MiniLM-L6-v2 embeddings
         nullable=True
     )
 
+    # Full-text search vector, computed and stored by PostgreSQL on insert/update
+    # so keyword ranking reads it instead of re-parsing chunk_content per matched row.
+    # Deferred: search results never need it, so it is not loaded with the entity.
+    content_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', chunk_content)", persisted=True),
+        deferred=True,
+    )
+
     # Relationship to document
     document: Mapped[DocumentEntity] = relationship(
         "DocumentEntity",
@@ -73,20 +108,50 @@ class DocumentChunkEntity(Base):
 
 # HNSW index for fast approximate nearest neighbor search on embeddings
 # This dramatically improves vector similarity search performance (O(log n) vs O(n))
-# Using cosine distance operator (<=>) which matches DocumentSearchRepository queries
-Index(
-    'ix_document_chunks_embedding_hnsw',
-    DocumentChunkEntity.embedding,
+# Using inner product operator (<#>) which matches ChunksRepositorySearch queries;
+# embeddings are stored L2-normalized, so this ranks the same as cosine distance.
+# Built on the half-precision cast of the column: the index is half the size and
+# ChunksRepositorySearch rescores its candidates against the full-precision vectors
+embedding_halfvec_hnsw_index = Index(
+    'ix_document_chunks_embedding_halfvec_hnsw',
+    cast(DocumentChunkEntity.embedding, HALFVEC(384)).label('embedding_halfvec'),
     postgresql_using='hnsw',
     postgresql_with={'m': 16, 'ef_construction': 64},
-    postgresql_ops={'embedding': 'vector_cosine_ops'}
+    postgresql_ops={'embedding_halfvec': 'halfvec_ip_ops'}
 )
 
-# GIN index for full-text search on chunk_content
-# Uses PostgreSQL's to_tsvector function for efficient keyword search
-# Note: text("'english'") is used because SQLAlchemy doesn't have a built-in REGCONFIG type
-Index(
-    'ix_document_chunks_content_gin',
-    func.to_tsvector(text("'english'"), DocumentChunkEntity.chunk_content),
+# GIN index for full-text search on the stored content_tsv column
+content_tsv_gin_index = Index(
+    'ix_document_chunks_content_tsv_gin',
+    DocumentChunkEntity.content_tsv,
     postgresql_using='gin'
 )
+
+
+async def upgrade_document_chunks_schema(conn: AsyncConnection) -> None:
+    """
+    Bring an existing document_chunks table up to the current schema.
+
+    create_all() only creates missing tables, so columns and indexes added to
+    an existing table are applied here. Every step is idempotent and a no-op
+    on a freshly created database.
+    """
+    # Stored tsvector column for keyword search, replacing the to_tsvector() expression index
+    await conn.execute(text(
+        "ALTER TABLE document_chunks ADD COLUMN IF NOT EXISTS content_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', chunk_content)) STORED"
+    ))
+    await conn.run_sync(lambda sync_conn: content_tsv_gin_index.create(sync_conn, checkfirst=True))
+    await conn.execute(text("DROP INDEX IF EXISTS ix_document_chunks_content_gin"))
+
+    # Vector search ranks by inner product, which needs unit-length embeddings.
+    # Tables that still have the old full-precision HNSW index predate normalization
+    # on insert, so their stored embeddings are normalized once before it is dropped.
+    legacy_hnsw_index = await conn.scalar(text("SELECT to_regclass('ix_document_chunks_embedding_hnsw')"))
+    if legacy_hnsw_index is not None:
+        await conn.execute(text(
+            "UPDATE document_chunks SET embedding = l2_normalize(embedding) "
+            "WHERE embedding IS NOT NULL AND vector_norm(embedding) > 0"
+        ))
+        await conn.execute(text("DROP INDEX ix_document_chunks_embedding_hnsw"))
+    await conn.run_sync(lambda sync_conn: embedding_halfvec_hnsw_index.create(sync_conn, checkfirst=True))
@@ -1,20 +1,40 @@
+import numpy as np
+
 from src.shared.database.base_mapper import BaseEntityMapper
 from src.app.core.domain.models import DocumentChunk
 from src.app.infrastructure.entities import DocumentChunkEntity
 
 
+def l2_normalize(vector: np.ndarray | list[float]) -> np.ndarray:
+    """
+    Return the vector as a unit-length float32 array.
+
+    Stored embeddings and query vectors are both unit length, so the inner
+    product equals cosine similarity. A zero vector is returned unchanged.
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
 class DocumentChunkMapper(BaseEntityMapper[DocumentChunk, DocumentChunkEntity]):
     """Mapper for converting between DocumentChunk domain model and DocumentChunkEntity."""
 
     @staticmethod
     def to_entity(model_instance: DocumentChunk) -> DocumentChunkEntity:
-        """Convert DocumentChunk (domain model) to DocumentChunkEntity (database entity)."""
+        """
+        Convert DocumentChunk (domain model) to DocumentChunkEntity (database entity).
+
+        Embeddings are L2-normalized on the way in, so vector search can rank by
+        inner product without recomputing norms for every row.
+        """
+        embedding = model_instance.embedding
         return DocumentChunkEntity(
             id=model_instance.id,
             document_id=model_instance.document_id,
             chunk_index=model_instance.chunk_index,
             chunk_content=model_instance.chunk_content,
-            embedding=model_instance.embedding,
+            embedding=l2_normalize(embedding) if embedding is not None else None,
         )
 
     @staticmethod
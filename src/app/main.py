@@ -38,6 +38,10 @@ async def default_lifespan(app: FastAPI):
         from src.shared.database.database import Base
         await conn.run_sync(Base.metadata.create_all)
 
+        # Apply columns and indexes added since the tables were first created
+        from src.app.infrastructure.entities.document_entity import upgrade_document_chunks_schema
+        await upgrade_document_chunks_schema(conn)
+
     logger.info("Database initialized successfully")
 
     # Ensure S3 bucket exists on startup
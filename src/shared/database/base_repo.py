@@ -1,5 +1,5 @@
 import abc
-from typing import Generic, TypeVar, Optional
+from typing import Generic, TypeVar, Optional, Sequence
 
 from sqlalchemy import Executable
 
@@ -31,7 +31,7 @@ class BaseRepository(abc.ABC, Generic[TEntity, TModel]):
             return [self.mapper.to_model(entity) for entity in entities]
 
     async def _search_with_scores(
-        self, statement: Executable
+        self, statement: Executable, setup_statements: Sequence[Executable] = ()
     ) -> list[tuple[TModel, float]]:
         """
         Execute a query returning (entity, score) tuples and map entities to models.
@@ -40,11 +40,15 @@ class BaseRepository(abc.ABC, Generic[TEntity, TModel]):
 
         Args:
             statement: SQLAlchemy select statement returning (Entity, score) tuples
+            setup_statements: Statements run first in the same transaction,
+                              e.g. transaction-local planner settings
 
         Returns:
             List of (model, score) tuples
         """
         async with self.db.session_maker() as session:
+            for setup_statement in setup_statements:
+                await session.execute(setup_statement)
             result = await session.execute(statement)
             rows = result.all()
 
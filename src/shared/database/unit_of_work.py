@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -35,6 +35,10 @@ class UnitOfWork:
         entity = self._map_to_entity(model_instance)
         self.session.add(entity)
 
+    def add_many(self, model_instances: Iterable[Any]):
+        # Convenience wrapper: same flush behaviour as calling add() for each instance
+        self.session.add_all([self._map_to_entity(model_instance) for model_instance in model_instances])
+
     async def update(self, model_instance: Any):
         entity = self._map_to_entity(model_instance)
         await self.session.merge(entity)
@@ -0,0 +1,50 @@
+"""Tests for DocumentChunk domain model embedding handling."""
+import json
+from uuid import UUID
+
+import numpy as np
+
+from src.app.core.domain.models import DocumentChunk, ScoredResult, Score, ScoreSource
+
+
+def create_chunk(embedding: list[float] | None) -> DocumentChunk:
+    """Helper to create a chunk with fixed IDs and the given embedding."""
+    return DocumentChunk(
+        id=UUID(int=1),
+        document_id=UUID(int=2),
+        chunk_index=0,
+        chunk_content="Chunk content",
+        embedding=embedding,
+    )
+
+
+class TestDocumentChunkEmbedding:
+    """Test DocumentChunk equality and serialization with numpy embeddings."""
+
+    def test_embedding_is_stored_as_float32_array(self):
+        """Test that list embeddings are converted to float32 arrays."""
+        chunk = create_chunk([1.0, 2.0])
+
+        assert isinstance(chunk.embedding, np.ndarray)
+        assert chunk.embedding.dtype == np.float32
+
+    def test_chunks_with_equal_embeddings_are_equal(self):
+        """Test that equality compares embeddings element-wise instead of raising."""
+        assert create_chunk([1.0, 2.0]) == create_chunk([1.0, 2.0])
+        assert create_chunk([1.0, 2.0]) != create_chunk([1.0, 3.0])
+        assert create_chunk([1.0, 2.0]) != create_chunk(None)
+        assert create_chunk(None) == create_chunk(None)
+
+    def test_scored_results_of_chunks_compare_equal(self):
+        """Test that frozen ScoredResult dataclasses wrapping chunks can be compared."""
+        score = Score(value=0.5, source=ScoreSource.VECTOR_SIMILARITY)
+
+        assert ScoredResult(item=create_chunk([1.0]), score=score) == ScoredResult(
+            item=create_chunk([1.0]), score=score
+        )
+
+    def test_json_serialization_writes_embedding_as_list(self):
+        """Test that model_dump_json() serializes the embedding as a list of floats."""
+        data = json.loads(create_chunk([1.0, 2.5]).model_dump_json())
+
+        assert data["embedding"] == [1.0, 2.5]
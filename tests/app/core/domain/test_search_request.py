@@ -4,7 +4,7 @@ from typing import cast
 import pytest
 from pydantic import ValidationError
 
-from src.app.core.domain.models import SearchRequest
+from src.app.core.domain.models import SearchMode, SearchRequest
 
 
 class TestSearchRequestValidation:
@@ -23,6 +23,18 @@ class TestSearchRequestValidation:
 
         assert request.query == "test query"
         assert request.top_k == 10  # Default
+        assert request.mode == SearchMode.HYBRID  # Default
+
+    def test_mode_accepts_string_values(self):
+        """Test that search mode can be given as its string value."""
+        request = SearchRequest(query="test query", mode="keyword")
+
+        assert request.mode == SearchMode.KEYWORD
+
+    def test_invalid_mode_raises_error(self):
+        """Test that an unknown search mode raises validation error."""
+        with pytest.raises(ValidationError):
+            SearchRequest(query="test query", mode="fuzzy")
 
     def test_query_whitespace_trimming(self):
         """Test that query strings are trimmed of leading/trailing whitespace."""
@@ -1,6 +1,9 @@
 """Tests for DocumentChunkSearchService, particularly reranker score threshold filtering."""
+import itertools
+from functools import lru_cache
+from typing import Callable
 from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 
@@ -10,6 +13,7 @@ from src.app.core.domain.models import (
     ScoredResult,
     Score,
     ScoreSource,
+    SearchMode,
     SearchRequest,
 )
 from src.app.core.services.chunks_search_service import DocumentChunkSearchService
@@ -19,8 +23,14 @@ from src.app.core.services.rrf import ReciprocalRankFusion
 from src.app.infrastructure.chunks_search_repository import ChunksRepositorySearch
 
 
+@lru_cache(maxsize=64)
 def create_chunk_settings(reranker_score_threshold: float = 0.0) -> ChunkSearchSettings:
-    """Create chunk search settings with custom threshold."""
+    """
+    Create chunk search settings with custom threshold.
+
+    Memoized per threshold: the service only reads its settings, so tests can
+    share one validated instance instead of rebuilding it every time.
+    """
     return ChunkSearchSettings(reranker_score_threshold=reranker_score_threshold)
 
 
@@ -60,12 +70,12 @@ def mock_reranker_service():
     return service
 
 
-def create_chunk_result(score: float, content: str = "Test content", source: ScoreSource = ScoreSource.RRF_FUSION) -> ScoredResult[DocumentChunk]:
+def create_chunk_result(uid: Callable[[], UUID], score: float, content: str = "Test content", source: ScoreSource = ScoreSource.RRF_FUSION) -> ScoredResult[DocumentChunk]:
     """Helper to create a ScoredResult[DocumentChunk] with given score."""
     return ScoredResult(
         item=DocumentChunk(
-            id=uuid4(),
-            document_id=uuid4(),
+            id=uid(),
+            document_id=uid(),
             chunk_index=0,
             chunk_content=content
         ),
@@ -85,51 +95,82 @@ def to_reranked_results(results: list[ScoredResult[DocumentChunk]]) -> list[Scor
     ]
 
 
+@lru_cache(maxsize=32)
+def create_rerank_scenario(
+    scores: tuple[float, ...]
+) -> tuple[tuple[ScoredResult[DocumentChunk], ...], tuple[ScoredResult[DocumentChunk], ...]]:
+    """
+    Build fused results and their reranked counterparts for the given scores.
+
+    Memoized per score tuple so parametrized scenarios sharing the same input
+    reuse one set of (read-only) results instead of rebuilding them per test.
+    Outlives any single test, so IDs come from a local counter, not the uid fixture.
+    """
+    ids = itertools.count(1)
+
+    def uid() -> UUID:
+        return UUID(int=next(ids))
+
+    fused_results = tuple(create_chunk_result(uid, score, f"Document {i}") for i, score in enumerate(scores))
+    return fused_results, tuple(to_reranked_results(list(fused_results)))
+
+
 # =============================================================================
 # Tests for Reranker Score Threshold Filtering
 # =============================================================================
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "threshold,scores_in,expected_out",
+    [
+        # Decision boundary: only positive logits are kept
+        (0.0, [4.5, 1.2, -2.5, -8.0, -11.0], [4.5, 1.2]),
+        # Permissive negative threshold keeps borderline results
+        (-3.0, [4.5, 1.2, -2.5, -8.0, -11.0], [4.5, 1.2, -2.5]),
+        # Strict positive threshold keeps only highly relevant results
+        (2.0, [4.5, 2.5, 1.8, 0.5, -2.0], [4.5, 2.5]),
+        # Everything can be filtered out
+        (5.0, [4.5, 2.0, -1.0], []),
+        # Results exactly at the threshold are included (>= comparison)
+        (0.0, [1.0, 0.0, -0.001], [1.0, 0.0]),
+    ],
+    ids=["zero", "negative", "strict", "all_below", "exact"],
+)
 async def test_filtering_applied_when_reranker_enabled(
     mock_embedding_service,
     mock_search_repository,
     mock_rrf,
     mock_reranker_service,
+    threshold,
+    scores_in,
+    expected_out,
 ):
     """Test that results below threshold are filtered when reranker is enabled."""
-    # Arrange - Create service with reranker and threshold of 0.0
+    # Arrange - Create service with reranker and the scenario threshold
     service = DocumentChunkSearchService(
         embedding_service=mock_embedding_service,
         search_repository=mock_search_repository,
         rrf=mock_rrf,
-        settings=create_chunk_settings(reranker_score_threshold=0.0),
+        settings=create_chunk_settings(reranker_score_threshold=threshold),
         reranker_service=mock_reranker_service,
     )
 
-    # Mock search results - mix of positive and negative scores (cross-encoder logits)
-    fused_results = [
-        create_chunk_result(4.5, "Highly relevant document"),
-        create_chunk_result(1.2, "Relevant document"),
-        create_chunk_result(-2.5, "Borderline document"),
-        create_chunk_result(-8.0, "Irrelevant document"),
-        create_chunk_result(-11.0, "Very irrelevant document"),
-    ]
+    # Mock search results - cross-encoder logits, built once per score tuple
+    fused_results, reranked_results = create_rerank_scenario(tuple(scores_in))
 
     mock_search_repository.search_by_keyword.return_value = []
-    mock_search_repository.search_by_vector.return_value = fused_results
-    mock_rrf.fuse.return_value = fused_results
+    mock_search_repository.search_by_vector.return_value = list(fused_results)
+    mock_rrf.fuse.return_value = list(fused_results)
 
     # Reranker returns ScoredResult objects with cross-encoder scores
-    mock_reranker_service.rerank.return_value = to_reranked_results(fused_results)
+    mock_reranker_service.rerank.return_value = list(reranked_results)
 
     # Act
     request = SearchRequest(query="test query", top_k=10)
     results = await service.search(request)
 
-    # Assert - Only results with score >= 0.0 should remain
-    assert len(results) == 2
-    assert results[0].value == 4.5
-    assert results[1].value == 1.2
+    # Assert - Only results with score >= threshold remain, in order
+    assert [r.value for r in results] == expected_out
 
 
 @pytest.mark.asyncio
@@ -137,6 +178,7 @@ async def test_filtering_not_applied_when_reranker_disabled(
     mock_embedding_service,
     mock_search_repository,
     mock_rrf,
+    uid,
 ):
     """Test that filtering is NOT applied when reranker is disabled (None)."""
     # Arrange - Create service WITHOUT reranker
@@ -150,10 +192,10 @@ async def test_filtering_not_applied_when_reranker_disabled(
 
     # Mock RRF results - these are RRF scores (0-1 range), not cross-encoder logits
     fused_results = [
-        create_chunk_result(0.05, "Result 1"),
-        create_chunk_result(0.03, "Result 2"),
-        create_chunk_result(-2, "Result 3"),
-        create_chunk_result(-5, "Result 4"),
+        create_chunk_result(uid, 0.05, "Result 1"),
+        create_chunk_result(uid, 0.03, "Result 2"),
+        create_chunk_result(uid, -2, "Result 3"),
+        create_chunk_result(uid, -5, "Result 4"),
     ]
 
     mock_search_repository.search_by_keyword.return_value = []
@@ -169,29 +211,31 @@ async def test_filtering_not_applied_when_reranker_disabled(
 
 
 @pytest.mark.asyncio
-async def test_filtering_with_negative_threshold(
+async def test_filtering_preserves_order(
     mock_embedding_service,
     mock_search_repository,
     mock_rrf,
     mock_reranker_service,
+    uid,
 ):
-    """Test filtering with a permissive negative threshold (-3.0)."""
-    # Arrange - Create service with negative threshold (more permissive)
+    """Test that filtering preserves the score order of results."""
+    # Arrange
     service = DocumentChunkSearchService(
         embedding_service=mock_embedding_service,
         search_repository=mock_search_repository,
         rrf=mock_rrf,
-        settings=create_chunk_settings(reranker_score_threshold=-3.0),  # Include borderline results
+        settings=create_chunk_settings(reranker_score_threshold=0.0),
         reranker_service=mock_reranker_service,
     )
 
-    # Mock search results
+    # Mock results in descending score order
     fused_results = [
-        create_chunk_result(4.5, "Highly relevant"),
-        create_chunk_result(1.2, "Relevant"),
-        create_chunk_result(-2.5, "Borderline - should be included"),
-        create_chunk_result(-8.0, "Irrelevant - should be filtered"),
-        create_chunk_result(-11.0, "Very irrelevant - should be filtered"),
+        create_chunk_result(uid, 8.0, "Best"),
+        create_chunk_result(uid, 5.0, "Good"),
+        create_chunk_result(uid, -1.0, "Filtered"),
+        create_chunk_result(uid, 2.0, "OK"),  # Out of order to test preservation
+        create_chunk_result(uid, -5.0, "Filtered"),
+        create_chunk_result(uid, 0.5, "Borderline OK"),
     ]
 
     mock_search_repository.search_by_keyword.return_value = []
@@ -203,99 +247,84 @@ async def test_filtering_with_negative_threshold(
     request = SearchRequest(query="test query", top_k=10)
     results = await service.search(request)
 
-    # Assert - Results with score >= -3.0 should remain
-    assert len(results) == 3
-    assert results[0].value == 4.5
-    assert results[1].value == 1.2
-    assert results[2].value == -2.5
+    # Assert - Order should be preserved (as returned by reranker)
+    assert len(results) == 4
+    assert results[0].value == 8.0
+    assert results[1].value == 5.0
+    assert results[2].value == 2.0
+    assert results[3].value == 0.5
 
 
 @pytest.mark.asyncio
-async def test_filtering_with_strict_positive_threshold(
+async def test_default_chunk_settings_threshold(
     mock_embedding_service,
     mock_search_repository,
     mock_rrf,
     mock_reranker_service,
 ):
-    """Test filtering with a strict positive threshold (2.0)."""
-    # Arrange - Create service with strict threshold
+    """Test that default ChunkSearchSettings threshold is 2.0."""
+    # Arrange - Create service with default settings
     service = DocumentChunkSearchService(
         embedding_service=mock_embedding_service,
         search_repository=mock_search_repository,
         rrf=mock_rrf,
-        settings=create_chunk_settings(reranker_score_threshold=2.0),  # Only highly relevant results
+        settings=ChunkSearchSettings(),  # Use defaults
         reranker_service=mock_reranker_service,
     )
 
-    # Mock search results
-    fused_results = [
-        create_chunk_result(4.5, "Highly relevant - included"),
-        create_chunk_result(2.5, "Good - included"),
-        create_chunk_result(1.8, "Decent - filtered"),
-        create_chunk_result(0.5, "OK - filtered"),
-        create_chunk_result(-2.0, "Not good - filtered"),
-    ]
-
-    mock_search_repository.search_by_keyword.return_value = []
-    mock_search_repository.search_by_vector.return_value = fused_results
-    mock_rrf.fuse.return_value = fused_results
-    mock_reranker_service.rerank.return_value = to_reranked_results(fused_results)
-
-    # Act
-    request = SearchRequest(query="test query", top_k=10)
-    results = await service.search(request)
+    # Assert default value from ChunkSearchSettings
+    assert service.settings.reranker_score_threshold == 2.0
 
-    # Assert - Only results with score >= 2.0 should remain
-    assert len(results) == 2
-    assert results[0].value == 4.5
-    assert results[1].value == 2.5
 
+# =============================================================================
+# Tests for Literal Query Short-Circuit
+# =============================================================================
 
 @pytest.mark.asyncio
-async def test_filtering_all_results_below_threshold(
+async def test_quoted_literal_query_skips_reranker(
     mock_embedding_service,
     mock_search_repository,
     mock_rrf,
     mock_reranker_service,
+    uid,
 ):
-    """Test that all results can be filtered out if none meet threshold."""
-    # Arrange - Create service with high threshold
+    """Test that quoted literal queries bypass the cross-encoder and its threshold."""
+    # Arrange
     service = DocumentChunkSearchService(
         embedding_service=mock_embedding_service,
         search_repository=mock_search_repository,
         rrf=mock_rrf,
-        settings=create_chunk_settings(reranker_score_threshold=5.0),  # Very strict
+        settings=ChunkSearchSettings(reranker_score_threshold=2.0, literal_shortcircuit_enabled=True),
         reranker_service=mock_reranker_service,
     )
 
-    # Mock search results - all below threshold
     fused_results = [
-        create_chunk_result(4.5, "Below threshold"),
-        create_chunk_result(2.0, "Below threshold"),
-        create_chunk_result(-1.0, "Below threshold"),
+        create_chunk_result(uid, 0.03, "Invoice INV-2024-001"),
+        create_chunk_result(uid, 0.01, "Other invoice"),
     ]
 
     mock_search_repository.search_by_keyword.return_value = []
     mock_search_repository.search_by_vector.return_value = fused_results
     mock_rrf.fuse.return_value = fused_results
-    mock_reranker_service.rerank.return_value = to_reranked_results(fused_results)
 
     # Act
-    request = SearchRequest(query="test query", top_k=10)
+    request = SearchRequest(query='"INV-2024-001"', top_k=10)
     results = await service.search(request)
 
-    # Assert - No results should remain
-    assert len(results) == 0
+    # Assert - RRF results are returned unfiltered and the reranker is never called
+    mock_reranker_service.rerank.assert_not_called()
+    assert len(results) == 2
 
 
 @pytest.mark.asyncio
-async def test_filtering_preserves_order(
+async def test_quoted_query_reranked_when_shortcircuit_disabled(
     mock_embedding_service,
     mock_search_repository,
     mock_rrf,
     mock_reranker_service,
+    uid,
 ):
-    """Test that filtering preserves the score order of results."""
+    """Test that quoted queries are reranked when the literal short-circuit is off (the default)."""
     # Arrange
     service = DocumentChunkSearchService(
         embedding_service=mock_embedding_service,
@@ -305,15 +334,7 @@ async def test_filtering_preserves_order(
         reranker_service=mock_reranker_service,
     )
 
-    # Mock results in descending score order
-    fused_results = [
-        create_chunk_result(8.0, "Best"),
-        create_chunk_result(5.0, "Good"),
-        create_chunk_result(-1.0, "Filtered"),
-        create_chunk_result(2.0, "OK"),  # Out of order to test preservation
-        create_chunk_result(-5.0, "Filtered"),
-        create_chunk_result(0.5, "Borderline OK"),
-    ]
+    fused_results = [create_chunk_result(uid, 3.0, "Invoice INV-2024-001")]
 
     mock_search_repository.search_by_keyword.return_value = []
     mock_search_repository.search_by_vector.return_value = fused_results
@@ -321,72 +342,77 @@ async def test_filtering_preserves_order(
     mock_reranker_service.rerank.return_value = to_reranked_results(fused_results)
 
     # Act
-    request = SearchRequest(query="test query", top_k=10)
+    request = SearchRequest(query='"INV-2024-001"', top_k=10)
     results = await service.search(request)
 
-    # Assert - Order should be preserved (as returned by reranker)
-    assert len(results) == 4
-    assert results[0].value == 8.0
-    assert results[1].value == 5.0
-    assert results[2].value == 2.0
-    assert results[3].value == 0.5
+    # Assert
+    mock_reranker_service.rerank.assert_called_once()
+    assert len(results) == 1
 
 
+# =============================================================================
+# Tests for Search Modes
+# =============================================================================
+
 @pytest.mark.asyncio
-async def test_filtering_with_exact_threshold_value(
+async def test_keyword_mode_skips_embedding(
     mock_embedding_service,
     mock_search_repository,
     mock_rrf,
-    mock_reranker_service,
+    uid,
 ):
-    """Test that results exactly at threshold are included (>= comparison)."""
+    """Test that keyword-only searches never embed the query or run vector search."""
     # Arrange
     service = DocumentChunkSearchService(
         embedding_service=mock_embedding_service,
         search_repository=mock_search_repository,
         rrf=mock_rrf,
-        settings=create_chunk_settings(reranker_score_threshold=0.0),
-        reranker_service=mock_reranker_service,
+        settings=create_chunk_settings(),
+        reranker_service=None,
     )
 
-    # Mock results with exact threshold value
-    fused_results = [
-        create_chunk_result(1.0, "Above threshold"),
-        create_chunk_result(0.0, "Exactly at threshold - should be included"),
-        create_chunk_result(-0.001, "Just below threshold - should be filtered"),
-    ]
-
-    mock_search_repository.search_by_keyword.return_value = []
-    mock_search_repository.search_by_vector.return_value = fused_results
-    mock_rrf.fuse.return_value = fused_results
-    mock_reranker_service.rerank.return_value = to_reranked_results(fused_results)
+    keyword_results = [create_chunk_result(uid, 0.6, "Keyword match", ScoreSource.KEYWORD_RANK)]
+    mock_search_repository.search_by_keyword.return_value = keyword_results
+    mock_rrf.fuse.return_value = keyword_results
 
     # Act
-    request = SearchRequest(query="test query", top_k=10)
+    request = SearchRequest(query="test query", top_k=10, mode=SearchMode.KEYWORD)
     results = await service.search(request)
 
-    # Assert - Results at exactly the threshold should be included
-    assert len(results) == 2
-    assert results[0].value == 1.0
-    assert results[1].value == 0.0
+    # Assert
+    mock_embedding_service.embed_query.assert_not_called()
+    mock_search_repository.search_by_vector.assert_not_called()
+    mock_rrf.fuse.assert_called_once_with([], keyword_results)
+    assert len(results) == 1
 
 
 @pytest.mark.asyncio
-async def test_default_chunk_settings_threshold(
+async def test_vector_mode_skips_keyword_search(
     mock_embedding_service,
     mock_search_repository,
     mock_rrf,
-    mock_reranker_service,
+    uid,
 ):
-    """Test that default ChunkSearchSettings threshold is 2.0."""
-    # Arrange - Create service with default settings
+    """Test that vector-only searches do not run keyword search."""
+    # Arrange
     service = DocumentChunkSearchService(
         embedding_service=mock_embedding_service,
         search_repository=mock_search_repository,
         rrf=mock_rrf,
-        settings=ChunkSearchSettings(),  # Use defaults
-        reranker_service=mock_reranker_service,
+        settings=create_chunk_settings(),
+        reranker_service=None,
     )
 
-    # Assert default value from ChunkSearchSettings
-    assert service.settings.reranker_score_threshold == 2.0
+    vector_results = [create_chunk_result(uid, 0.8, "Semantic match", ScoreSource.VECTOR_SIMILARITY)]
+    mock_search_repository.search_by_vector.return_value = vector_results
+    mock_rrf.fuse.return_value = vector_results
+
+    # Act
+    request = SearchRequest(query="test query", top_k=10, mode=SearchMode.VECTOR)
+    results = await service.search(request)
+
+    # Assert
+    mock_embedding_service.embed_query.assert_called_once_with("test query")
+    mock_search_repository.search_by_keyword.assert_not_called()
+    mock_rrf.fuse.assert_called_once_with(vector_results, [])
+    assert len(results) == 1
@@ -1,6 +1,7 @@
 """Tests for document processor."""
 from uuid import uuid4
 
+import numpy as np
 import pytest
 from src.app.core.services.document_processor import DocumentProcessor, ProcessingResult
 from src.app.core.services.summarization import SummarizationService
@@ -81,8 +82,8 @@ async def test_process_text_creates_chunks_with_embeddings(document_processor):
         assert len(chunk.chunk_content) > 0
         # Verify embedding exists and has correct dimension
         assert chunk.embedding is not None
-        assert len(chunk.embedding) == 384
-        assert all(isinstance(val, float) for val in chunk.embedding)
+        assert chunk.embedding.shape == (384,)
+        assert chunk.embedding.dtype == np.float32
 
 
 @pytest.mark.asyncio
@@ -121,8 +122,6 @@ async def test_process_text_empty_content(document_processor):
 @pytest.mark.asyncio
 async def test_process_text_embeddings_are_different_for_different_chunks(document_processor):
     """Test that different chunks get different embeddings."""
-    import numpy as np
-
     # Arrange
     document_id = uuid4()
 
@@ -159,11 +158,12 @@ async def test_process_text_embeddings_are_different_for_different_chunks(docume
     assert len(result.chunks) >= 2, f"Expected at least 2 chunks but got {len(result.chunks)}"
 
     # Get embeddings for first two chunks
-    emb1 = np.array(result.chunks[0].embedding)
-    emb2 = np.array(result.chunks[1].embedding)
+    emb1 = np.asarray(result.chunks[0].embedding, dtype=np.float32)
+    emb2 = np.asarray(result.chunks[1].embedding, dtype=np.float32)
 
-    # They should not be identical
-    assert not np.allclose(emb1, emb2)
+    # They should not be identical (all-MiniLM-L6-v2 outputs unit vectors,
+    # so the dot product is their cosine similarity)
+    assert float(emb1 @ emb2) < 0.999
 
 
 @pytest.mark.asyncio
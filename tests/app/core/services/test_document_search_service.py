@@ -1,6 +1,8 @@
 """Tests for DocumentSearchService."""
-from unittest.mock import AsyncMock
-from uuid import uuid4
+import asyncio
+from dataclasses import dataclass
+from uuid import UUID
+from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
@@ -13,9 +15,7 @@ from src.app.core.domain.models import (
     ScoreSource,
     SearchRequest
 )
-from src.app.core.services.chunks_search_service import DocumentChunkSearchService
 from src.app.core.services.document_search_service import DocumentSearchService
-from src.app.infrastructure.document_repository import DocumentRepository
 
 
 def create_chunk_result(chunk: DocumentChunk, score: float) -> ScoredResult[DocumentChunk]:
@@ -26,86 +26,163 @@ def create_chunk_result(chunk: DocumentChunk, score: float) -> ScoredResult[Docu
     )
 
 
-@pytest_asyncio.fixture
-async def mock_chunk_search_service():
-    """Create a mock chunk search service."""
-    service = AsyncMock(spec=DocumentChunkSearchService)
-    return service
+@dataclass(frozen=True)
+class SampleDocuments:
+    """Canned documents and chunks shared by tests that only need distinct IDs."""
+    documents: tuple[Document, ...]
+    chunks: tuple[tuple[DocumentChunk, ...], ...]  # chunks[i] belong to documents[i]
+
+
+@pytest.fixture(scope="module")
+def sample_docs() -> SampleDocuments:
+    """
+    Three documents with four chunks each, built once per module.
+
+    Built with model_construct() to skip validation of the hard-coded fields.
+    Scores live on the ScoredResult wrappers, so tests can share these
+    instances without copying them.
+    """
+    documents = tuple(
+        Document.model_construct(
+            id=UUID(int=1000 + i),
+            client_id=UUID(int=2000 + i),
+            title=f"Doc {i + 1}",
+            s3_key=f"docs/{i + 1}.pdf",
+        )
+        for i in range(3)
+    )
+    chunks = tuple(
+        tuple(
+            DocumentChunk.model_construct(
+                id=UUID(int=3000 + doc_index * 10 + chunk_index),
+                document_id=document.id,
+                chunk_index=chunk_index,
+                chunk_content=f"Chunk {chunk_index} of {document.title}.",
+                embedding=None,
+            )
+            for chunk_index in range(4)
+        )
+        for doc_index, document in enumerate(documents)
+    )
+    return SampleDocuments(documents=documents, chunks=chunks)
 
 
-@pytest_asyncio.fixture
-async def mock_document_repository():
-    """Create a mock document repository."""
-    repository = AsyncMock(spec=DocumentRepository)
-    return repository
+class StubChunkSearch:
+    """
+    Minimal stand-in for DocumentChunkSearchService.
+
+    Records every SearchRequest in `calls`. Returns the next entry of `queued`
+    when set, otherwise `result`.
+    """
+
+    def __init__(self):
+        self.calls: list[SearchRequest] = []
+        self.result: list[ScoredResult[DocumentChunk]] = []
+        self.queued: list[list[ScoredResult[DocumentChunk]]] = []
+
+    async def search(self, request: SearchRequest) -> list[ScoredResult[DocumentChunk]]:
+        self.calls.append(request)
+        if self.queued:
+            return self.queued.pop(0)
+        return self.result
+
+
+class StubDocumentRepository:
+    """
+    Minimal stand-in for DocumentRepository.
+
+    Records the IDs of every get_by_ids() call in `calls` and returns the
+    requested subset of `documents`, so unknown IDs are simply missing.
+    """
+
+    def __init__(self):
+        self.calls: list[list[UUID]] = []
+        self.documents: list[Document] = []
+
+    async def get_by_ids(self, ids: list[UUID]) -> list[Document]:
+        self.calls.append(list(ids))
+        requested = set(ids)
+        return [document for document in self.documents if document.id in requested]
+
+
+@pytest.fixture
+def chunk_search_stub():
+    """Create a stub chunk search service."""
+    return StubChunkSearch()
+
+
+@pytest.fixture
+def document_repository_stub():
+    """Create a stub document repository."""
+    return StubDocumentRepository()
 
 
 @pytest_asyncio.fixture
-async def document_search_service(mock_chunk_search_service, mock_document_repository):
-    """Create a document search service with mocked dependencies."""
+async def document_search_service(chunk_search_stub, document_repository_stub):
+    """Create a document search service with stubbed dependencies."""
     return DocumentSearchService(
-        chunk_search_service=mock_chunk_search_service,
-        document_repository=mock_document_repository
+        chunk_search_service=chunk_search_stub,
+        document_repository=document_repository_stub
     )
 
 
 @pytest.mark.asyncio
-async def test_search_multiple_documents(document_search_service, mock_chunk_search_service, mock_document_repository):
+async def test_search_multiple_documents(document_search_service, chunk_search_stub, document_repository_stub, uid):
     """Test searching returns multiple distinct documents."""
     # Arrange - Create documents
-    doc1_id = uuid4()
-    doc2_id = uuid4()
-    doc3_id = uuid4()
+    doc1_id = uid()
+    doc2_id = uid()
+    doc3_id = uid()
 
     doc1 = Document(
         id=doc1_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Q4 2024 Portfolio Report",
         s3_key="reports/q4-2024.pdf"
     )
     doc2 = Document(
         id=doc2_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Investment Strategy 2025",
         s3_key="strategy/2025.pdf"
     )
     doc3 = Document(
         id=doc3_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Risk Assessment Report",
         s3_key="risk/assessment.pdf"
     )
 
     # Create chunks from different documents
     chunk1 = DocumentChunk(
-        id=uuid4(),
+        id=uid(),
         document_id=doc1_id,
         chunk_index=0,
         chunk_content="Portfolio performance exceeded benchmarks with 12% annual return in equities."
     )
     chunk2 = DocumentChunk(
-        id=uuid4(),
+        id=uid(),
         document_id=doc2_id,
         chunk_index=0,
         chunk_content="Investment strategy focuses on diversified portfolio allocation across asset classes."
     )
     chunk3 = DocumentChunk(
-        id=uuid4(),
+        id=uid(),
         document_id=doc3_id,
         chunk_index=0,
         chunk_content="Risk assessment indicates moderate portfolio volatility within acceptable parameters."
     )
 
-    # Mock chunk search results
+    # Stub chunk search results
     chunk_results = [
         create_chunk_result(chunk1, 0.85),
         create_chunk_result(chunk2, 0.78),
         create_chunk_result(chunk3, 0.72),
     ]
-    mock_chunk_search_service.search.return_value = chunk_results
+    chunk_search_stub.result = chunk_results
 
-    # Mock document repository - batch fetch
-    mock_document_repository.get_by_ids.return_value = [doc1, doc2, doc3]
+    # Stub document repository - batch fetch
+    document_repository_stub.documents = [doc1, doc2, doc3]
 
     # Act
     request = SearchRequest(query="portfolio performance", top_k=10)
@@ -121,60 +198,60 @@ async def test_search_multiple_documents(document_search_service, mock_chunk_sea
     assert results[2].value == 0.72
 
     # Verify chunk search was called with a SearchRequest
-    mock_chunk_search_service.search.assert_called_once()
-    call_args = mock_chunk_search_service.search.call_args[0][0]
+    call_args = chunk_search_stub.calls[0]
     assert isinstance(call_args, SearchRequest)
     assert call_args.query == "portfolio performance"
-    assert call_args.top_k == 50  # top_k * 5
+    # top_k * 5, then top_k * 10 because only 3 of 10 documents were found
+    assert [call.top_k for call in chunk_search_stub.calls] == [50, 100]
 
     # Verify batch fetch was used
-    mock_document_repository.get_by_ids.assert_called_once()
-    called_ids = mock_document_repository.get_by_ids.call_args[0][0]
+    assert len(document_repository_stub.calls) == 1
+    called_ids = document_repository_stub.calls[0]
     assert set(called_ids) == {doc1_id, doc2_id, doc3_id}
 
 
 @pytest.mark.asyncio
-async def test_search_multiple_chunks_same_document(document_search_service, mock_chunk_search_service, mock_document_repository):
+async def test_search_multiple_chunks_same_document(document_search_service, chunk_search_stub, document_repository_stub, uid):
     """Test that when multiple chunks from same document match, highest score is used."""
     # Arrange - Create one document
-    doc_id = uuid4()
+    doc_id = uid()
     document = Document(
         id=doc_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Comprehensive Wealth Management Guide",
         s3_key="guides/wealth-management.pdf"
     )
 
     # Create multiple chunks from the same document with different scores
     chunk1 = DocumentChunk(
-        id=uuid4(),
+        id=uid(),
         document_id=doc_id,
         chunk_index=0,
         chunk_content="Wealth management encompasses portfolio diversification and risk mitigation strategies."
     )
     chunk2 = DocumentChunk(
-        id=uuid4(),
+        id=uid(),
         document_id=doc_id,
         chunk_index=1,
         chunk_content="Tax optimization strategies are crucial for high-net-worth individuals managing wealth."
     )
     chunk3 = DocumentChunk(
-        id=uuid4(),
+        id=uid(),
         document_id=doc_id,
         chunk_index=2,
         chunk_content="Estate planning ensures intergenerational wealth transfer efficiency."
     )
 
-    # Mock chunk search results - different scores for chunks from same document
+    # Stub chunk search results - different scores for chunks from same document
     chunk_results = [
         create_chunk_result(chunk1, 0.92),  # Highest score
         create_chunk_result(chunk2, 0.88),
         create_chunk_result(chunk3, 0.75),
     ]
-    mock_chunk_search_service.search.return_value = chunk_results
+    chunk_search_stub.result = chunk_results
 
-    # Mock document repository - batch fetch
-    mock_document_repository.get_by_ids.return_value = [document]
+    # Stub document repository - batch fetch
+    document_repository_stub.documents = [document]
 
     # Act
     request = SearchRequest(query="wealth management strategies", top_k=5)
@@ -186,27 +263,27 @@ async def test_search_multiple_chunks_same_document(document_search_service, moc
     assert results[0].value == 0.92  # Should use the highest score from the chunks
 
     # Verify batch fetch was used with single document
-    mock_document_repository.get_by_ids.assert_called_once_with([doc_id])
+    assert document_repository_stub.calls == [[doc_id]]
 
 
 @pytest.mark.asyncio
-async def test_search_respects_top_k_limit(document_search_service, mock_chunk_search_service, mock_document_repository):
+async def test_search_respects_top_k_limit(document_search_service, chunk_search_stub, document_repository_stub, uid):
     """Test that search respects the top_k parameter when multiple documents match."""
     # Arrange - Create 5 documents but request only top 3
     documents = {}
     chunk_results = []
 
     for i in range(5):
-        doc_id = uuid4()
+        doc_id = uid()
         documents[doc_id] = Document(
             id=doc_id,
-            client_id=uuid4(),
+            client_id=uid(),
             title=f"Financial Report {i+1}",
             s3_key=f"reports/report-{i+1}.pdf"
         )
 
         chunk = DocumentChunk(
-            id=uuid4(),
+            id=uid(),
             document_id=doc_id,
             chunk_index=0,
             chunk_content=f"Financial analysis report {i+1} for portfolio review."
@@ -214,10 +291,10 @@ async def test_search_respects_top_k_limit(document_search_service, mock_chunk_s
         # Scores in descending order
         chunk_results.append(create_chunk_result(chunk, 0.9 - (i * 0.1)))
 
-    mock_chunk_search_service.search.return_value = chunk_results
+    chunk_search_stub.result = chunk_results
     # Return only the top 3 documents in order
     top_3_docs = [documents[chunk_results[i].item.document_id] for i in range(3)]
-    mock_document_repository.get_by_ids.return_value = top_3_docs
+    document_repository_stub.documents = top_3_docs
 
     # Act - Request only top 3
     request = SearchRequest(query="financial report", top_k=3)
@@ -232,28 +309,28 @@ async def test_search_respects_top_k_limit(document_search_service, mock_chunk_s
 
 
 @pytest.mark.asyncio
-async def test_search_mixed_documents_and_chunks(document_search_service, mock_chunk_search_service, mock_document_repository):
+async def test_search_mixed_documents_and_chunks(document_search_service, chunk_search_stub, document_repository_stub, uid):
     """Test search with mix of single and multiple chunks per document."""
     # Arrange
-    doc1_id = uuid4()  # Will have 3 chunks
-    doc2_id = uuid4()  # Will have 1 chunk
-    doc3_id = uuid4()  # Will have 2 chunks
+    doc1_id = uid()  # Will have 3 chunks
+    doc2_id = uid()  # Will have 1 chunk
+    doc3_id = uid()  # Will have 2 chunks
 
     doc1 = Document(
         id=doc1_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Annual Investment Review 2024",
         s3_key="reviews/2024-annual.pdf"
     )
     doc2 = Document(
         id=doc2_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Market Outlook Q1 2025",
         s3_key="outlook/q1-2025.pdf"
     )
     doc3 = Document(
         id=doc3_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Client Portfolio Summary",
         s3_key="portfolio/client-summary.pdf"
     )
@@ -261,42 +338,42 @@ async def test_search_mixed_documents_and_chunks(document_search_service, mock_c
     chunk_results = [
         # Doc1 - 3 chunks, highest score is 0.95
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=doc1_id, chunk_index=0,
+            DocumentChunk(id=uid(), document_id=doc1_id, chunk_index=0,
                          chunk_content="Investment review shows strong performance."),
             0.95
         ),
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=doc1_id, chunk_index=1,
+            DocumentChunk(id=uid(), document_id=doc1_id, chunk_index=1,
                          chunk_content="Annual returns exceeded expectations."),
             0.82
         ),
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=doc1_id, chunk_index=2,
+            DocumentChunk(id=uid(), document_id=doc1_id, chunk_index=2,
                          chunk_content="Portfolio rebalancing recommended."),
             0.75
         ),
         # Doc2 - 1 chunk, score 0.88
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=doc2_id, chunk_index=0,
+            DocumentChunk(id=uid(), document_id=doc2_id, chunk_index=0,
                          chunk_content="Market outlook remains positive for equities."),
             0.88
         ),
         # Doc3 - 2 chunks, highest score is 0.80
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=doc3_id, chunk_index=0,
+            DocumentChunk(id=uid(), document_id=doc3_id, chunk_index=0,
                          chunk_content="Client portfolio summary for review."),
             0.80
         ),
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=doc3_id, chunk_index=1,
+            DocumentChunk(id=uid(), document_id=doc3_id, chunk_index=1,
                          chunk_content="Asset allocation breakdown by category."),
             0.70
         ),
     ]
 
-    mock_chunk_search_service.search.return_value = chunk_results
+    chunk_search_stub.result = chunk_results
     # Batch fetch all 3 documents
-    mock_document_repository.get_by_ids.return_value = [doc1, doc2, doc3]
+    document_repository_stub.documents = [doc1, doc2, doc3]
 
     # Act
     request = SearchRequest(query="investment portfolio", top_k=10)
@@ -313,10 +390,10 @@ async def test_search_mixed_documents_and_chunks(document_search_service, mock_c
 
 
 @pytest.mark.asyncio
-async def test_search_no_results(document_search_service, mock_chunk_search_service, mock_document_repository):
+async def test_search_no_results(document_search_service, chunk_search_stub, document_repository_stub):
     """Test search with no matching chunks returns empty list."""
     # Arrange
-    mock_chunk_search_service.search.return_value = []
+    chunk_search_stub.result = []
 
     # Act
     request = SearchRequest(query="quantum physics research", top_k=10)
@@ -327,27 +404,27 @@ async def test_search_no_results(document_search_service, mock_chunk_search_serv
 
 
 @pytest.mark.asyncio
-async def test_search_passes_request_to_chunk_service(document_search_service, mock_chunk_search_service, mock_document_repository):
+async def test_search_passes_request_to_chunk_service(document_search_service, chunk_search_stub, document_repository_stub, uid):
     """Test that search passes SearchRequest to chunk search service."""
     # Arrange
-    doc_id = uuid4()
+    doc_id = uid()
     document = Document(
         id=doc_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Regulatory Compliance Report",
         s3_key="compliance/report.pdf"
     )
 
     chunk_results = [
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=doc_id, chunk_index=0,
+            DocumentChunk(id=uid(), document_id=doc_id, chunk_index=0,
                          chunk_content="Regulatory compliance requirements overview."),
             0.85
         ),
     ]
 
-    mock_chunk_search_service.search.return_value = chunk_results
-    mock_document_repository.get_by_ids.return_value = [document]
+    chunk_search_stub.result = chunk_results
+    document_repository_stub.documents = [document]
 
     # Act
     request = SearchRequest(query="compliance requirements", top_k=5)
@@ -356,29 +433,20 @@ async def test_search_passes_request_to_chunk_service(document_search_service, m
     # Assert
     assert len(results) == 1
     # Verify SearchRequest was passed to chunk search
-    mock_chunk_search_service.search.assert_called_once()
-    call_args = mock_chunk_search_service.search.call_args[0][0]
+    call_args = chunk_search_stub.calls[0]
     assert isinstance(call_args, SearchRequest)
     assert call_args.query == "compliance requirements"
     assert call_args.top_k == 25  # top_k * 5
 
 
 @pytest.mark.asyncio
-async def test_search_document_not_found_in_repository(document_search_service, mock_chunk_search_service, mock_document_repository):
+async def test_search_document_not_found_in_repository(document_search_service, chunk_search_stub, document_repository_stub, sample_docs):
     """Test handling when document referenced by chunk is not found."""
     # Arrange
-    doc_id = uuid4()
+    chunk_results = [create_chunk_result(sample_docs.chunks[0][0], 0.85)]
 
-    chunk_results = [
-        create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=doc_id, chunk_index=0,
-                         chunk_content="Test content"),
-            0.85
-        ),
-    ]
-
-    mock_chunk_search_service.search.return_value = chunk_results
-    mock_document_repository.get_by_ids.return_value = []  # Document not found
+    chunk_search_stub.result = chunk_results
+    document_repository_stub.documents = []  # Document not found
 
     # Act
     request = SearchRequest(query="test query", top_k=10)
@@ -389,28 +457,28 @@ async def test_search_document_not_found_in_repository(document_search_service,
 
 
 @pytest.mark.asyncio
-async def test_search_wealth_management_scenario(document_search_service, mock_chunk_search_service, mock_document_repository):
+async def test_search_wealth_management_scenario(document_search_service, chunk_search_stub, document_repository_stub, uid):
     """Test realistic wealth management search scenario."""
     # Arrange - Documents related to a high-net-worth client
-    estate_doc_id = uuid4()
-    tax_doc_id = uuid4()
-    investment_doc_id = uuid4()
+    estate_doc_id = uid()
+    tax_doc_id = uid()
+    investment_doc_id = uid()
 
     estate_doc = Document(
         id=estate_doc_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Estate Planning Strategy - Johnson Family",
         s3_key="estate/johnson-family.pdf"
     )
     tax_doc = Document(
         id=tax_doc_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Tax Optimization Report 2024",
         s3_key="tax/optimization-2024.pdf"
     )
     investment_doc = Document(
         id=investment_doc_id,
-        client_id=uuid4(),
+        client_id=uid(),
         title="Alternative Investments Portfolio",
         s3_key="investments/alternatives.pdf"
     )
@@ -418,30 +486,30 @@ async def test_search_wealth_management_scenario(document_search_service, mock_c
     # Search for "estate planning" should rank estate doc highest
     chunk_results = [
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=estate_doc_id, chunk_index=0,
+            DocumentChunk(id=uid(), document_id=estate_doc_id, chunk_index=0,
                          chunk_content="Estate planning for intergenerational wealth transfer strategies."),
             0.94
         ),
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=estate_doc_id, chunk_index=1,
+            DocumentChunk(id=uid(), document_id=estate_doc_id, chunk_index=1,
                          chunk_content="Trust structures and estate tax minimization approaches."),
             0.89
         ),
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=tax_doc_id, chunk_index=0,
+            DocumentChunk(id=uid(), document_id=tax_doc_id, chunk_index=0,
                          chunk_content="Estate tax considerations for high-net-worth families."),
             0.76
         ),
         create_chunk_result(
-            DocumentChunk(id=uuid4(), document_id=investment_doc_id, chunk_index=0,
+            DocumentChunk(id=uid(), document_id=investment_doc_id, chunk_index=0,
                          chunk_content="Alternative investments complement traditional estate holdings."),
             0.62
         ),
     ]
 
-    mock_chunk_search_service.search.return_value = chunk_results
+    chunk_search_stub.result = chunk_results
     # Batch fetch all 3 documents
-    mock_document_repository.get_by_ids.return_value = [estate_doc, tax_doc, investment_doc]
+    document_repository_stub.documents = [estate_doc, tax_doc, investment_doc]
 
     # Act
     request = SearchRequest(query="estate planning strategies", top_k=5)
@@ -458,3 +526,164 @@ async def test_search_wealth_management_scenario(document_search_service, mock_c
     # Investment document should be third
     assert results[2].item.title == "Alternative Investments Portfolio"
     assert results[2].value == 0.62
+
+
+@pytest.mark.asyncio
+async def test_search_overlaps_fetch_and_rank(document_search_service, chunk_search_stub, document_repository_stub, sample_docs):
+    """Test that the document fetch is issued before ranking starts and awaited afterwards."""
+    # Arrange
+    doc1, doc2, _ = sample_docs.documents
+    doc1_chunks, doc2_chunks, _ = sample_docs.chunks
+
+    chunk_results = [
+        create_chunk_result(doc1_chunks[0], 0.91),
+        create_chunk_result(doc2_chunks[0], 0.84),
+        create_chunk_result(doc1_chunks[1], 0.60),
+    ]
+    chunk_search_stub.result = chunk_results
+
+    fetch_started = asyncio.Event()
+    release_fetch = asyncio.Event()
+
+    document_repository_stub.documents = [doc1, doc2]
+    get_by_ids = document_repository_stub.get_by_ids
+
+    async def slow_get_by_ids(ids):
+        fetch_started.set()
+        await release_fetch.wait()
+        return await get_by_ids(ids)
+
+    document_repository_stub.get_by_ids = slow_get_by_ids
+
+    # Record whether the fetch was already in flight when ranking began
+    fetch_started_at_ranking = []
+    group_chunks_by_document = DocumentSearchService._group_chunks_by_document
+
+    def recording_group_chunks_by_document(results):
+        fetch_started_at_ranking.append(fetch_started.is_set())
+        return group_chunks_by_document(results)
+
+    # Act - Run the search and check the fetch is in flight before it can complete
+    request = SearchRequest(query="pension retirement", top_k=2)
+    with patch.object(document_search_service, "_group_chunks_by_document", recording_group_chunks_by_document):
+        search_task = asyncio.create_task(document_search_service.search(request))
+        await asyncio.wait_for(fetch_started.wait(), timeout=1)
+        assert not search_task.done()
+
+        release_fetch.set()
+        results = await search_task
+
+    assert fetch_started_at_ranking == [True]
+
+    # Assert - A single prefetch with the ranked candidate IDs served the results
+    assert document_repository_stub.calls == [[doc1.id, doc2.id]]
+    assert [r.item.id for r in results] == [doc1.id, doc2.id]
+    assert [r.value for r in results] == [0.91, 0.84]
+
+
+@pytest.mark.asyncio
+async def test_search_fetches_documents_missed_by_prefetch(document_search_service, chunk_search_stub, document_repository_stub, sample_docs):
+    """Test that unordered chunk results still return the true top documents."""
+    # Arrange - Best chunk (doc3) arrives after the first top_k distinct documents
+    doc1, doc2, doc3 = sample_docs.documents
+
+    chunk_results = [
+        create_chunk_result(sample_docs.chunks[0][0], 0.70),
+        create_chunk_result(sample_docs.chunks[1][0], 0.50),
+        create_chunk_result(sample_docs.chunks[2][0], 0.90),
+    ]
+    chunk_search_stub.result = chunk_results
+    document_repository_stub.documents = [doc1, doc2, doc3]
+
+    # Act
+    request = SearchRequest(query="test query", top_k=2)
+    results = await document_search_service.search(request)
+
+    # Assert - doc3 is fetched in a follow-up call and ranked first
+    assert len(document_repository_stub.calls) == 2
+    assert document_repository_stub.calls[1] == [doc3.id]
+    assert [r.item.id for r in results] == [doc3.id, doc1.id]
+
+
+@pytest.mark.asyncio
+async def test_search_widens_chunk_retrieval_when_too_few_documents(document_search_service, chunk_search_stub, document_repository_stub, sample_docs):
+    """Test that a first pass with too few distinct documents triggers one wider pass."""
+    # Arrange - First pass returns 4 chunks, all from one document
+    doc1, doc2, _ = sample_docs.documents
+
+    first_pass = [
+        create_chunk_result(chunk, 0.9 - i * 0.1)
+        for i, chunk in enumerate(sample_docs.chunks[0])
+    ]
+    second_pass = [
+        *first_pass,
+        create_chunk_result(sample_docs.chunks[1][0], 0.4),
+    ]
+    chunk_search_stub.queued = [first_pass, second_pass]
+    document_repository_stub.documents = [doc1, doc2]
+
+    # Act
+    request = SearchRequest(query="test query", top_k=2)
+    results = await document_search_service.search(request)
+
+    # Assert - 5x first pass, then 10x second pass
+    limits = [call.top_k for call in chunk_search_stub.calls]
+    assert limits == [10, 20]
+    assert [r.item.id for r in results] == [doc1.id, doc2.id]
+
+
+@pytest.mark.asyncio
+async def test_search_widens_when_threshold_leaves_first_pass_short(document_search_service, chunk_search_stub, document_repository_stub, sample_docs):
+    """Test that a first pass cut short by the reranker threshold still widens when documents are missing."""
+    # Arrange - Only 2 of the 15 requested chunks survive the threshold, both from one document
+    doc1, doc2, doc3 = sample_docs.documents
+
+    first_pass = [
+        create_chunk_result(sample_docs.chunks[0][0], 4.2),
+        create_chunk_result(sample_docs.chunks[0][1], 3.1),
+    ]
+    second_pass = [
+        *first_pass,
+        create_chunk_result(sample_docs.chunks[1][0], 2.8),
+        create_chunk_result(sample_docs.chunks[2][0], 2.5),
+    ]
+    chunk_search_stub.queued = [first_pass, second_pass]
+    document_repository_stub.documents = [doc1, doc2, doc3]
+
+    # Act
+    request = SearchRequest(query="test query", top_k=3)
+    results = await document_search_service.search(request)
+
+    # Assert - The wider pass ran and found the missing documents
+    assert [call.top_k for call in chunk_search_stub.calls] == [15, 30]
+    assert [r.item.id for r in results] == [doc1.id, doc2.id, doc3.id]
+
+
+@pytest.mark.asyncio
+async def test_search_does_not_widen_when_first_pass_is_empty(document_search_service, chunk_search_stub, document_repository_stub):
+    """Test that a first pass with no chunks at all returns without a wider pass."""
+    # Arrange
+    chunk_search_stub.result = []
+
+    # Act
+    request = SearchRequest(query="test query", top_k=3)
+    results = await document_search_service.search(request)
+
+    # Assert
+    assert results == []
+    assert len(chunk_search_stub.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_caps_chunk_retrieval_limit(document_search_service, chunk_search_stub, document_repository_stub):
+    """Test that chunk requests never exceed the SearchRequest top_k bound."""
+    # Arrange
+    chunk_search_stub.result = []
+
+    # Act
+    request = SearchRequest(query="test query", top_k=100)
+    await document_search_service.search(request)
+
+    # Assert
+    call_args = chunk_search_stub.calls[-1]
+    assert call_args.top_k == 100
@@ -3,6 +3,9 @@
 Uses session-scoped embedding_service fixture from conftest.py to avoid
 reloading the ML model for each test.
 """
+import os
+
+import numpy as np
 import pytest
 
 
@@ -13,9 +16,21 @@ async def test_embed_single_text(embedding_service):
     result = await embedding_service.embed_document(text)
 
     assert result.text == text
-    assert isinstance(result.embedding, list)
-    assert len(result.embedding) == 384
-    assert all(isinstance(val, float) for val in result.embedding)
+    assert isinstance(result.embedding, np.ndarray)
+    assert result.embedding.shape == (384,)
+    assert result.embedding.dtype == np.float32
+
+
+@pytest.mark.asyncio
+async def test_embeddings_are_unit_normalized(embedding_service):
+    """Test that query, document and batch embeddings are L2-normalized float32 vectors."""
+    query_result = await embedding_service.embed_query("normalized query embedding")
+    document_result = await embedding_service.embed_document("Normalized document embedding.")
+    batch_results = await embedding_service.embed_document_batch(["First text.", "Second text."])
+
+    for result in [query_result, document_result, *batch_results]:
+        assert result.embedding.dtype == np.float32
+        assert np.linalg.norm(result.embedding) == pytest.approx(1.0, abs=1e-5)
 
 
 @pytest.mark.asyncio
@@ -43,8 +58,8 @@ async def test_embed_batch(embedding_service):
 
     for i, result in enumerate(results):
         assert result.text == texts[i]
-        assert len(result.embedding) == 384
-        assert all(isinstance(val, float) for val in result.embedding)
+        assert result.embedding.shape == (384,)
+        assert result.embedding.dtype == np.float32
 
 
 @pytest.mark.asyncio
@@ -70,8 +85,6 @@ async def test_embed_text_similarity_address_proof(embedding_service):
     Validates that searching for 'address proof' returns documents
     containing utility bills (which serve as address proof).
     """
-    import numpy as np
-
     # Mock utility bill content (contains address information)
     utility_bill = """
     ELECTRICITY BILL
@@ -95,22 +108,17 @@ async def test_embed_text_similarity_address_proof(embedding_service):
         Restrictions: Corrective Lenses Required
         """
 
-    # Generate embeddings
-    bill_result = await embedding_service.embed_document(utility_bill)
-    query_result = await embedding_service.embed_query(query)
-    unrelated_result = await embedding_service.embed_document(driving_license_chunk)
+    # Generate embeddings in a single model invocation
+    doc_results, query_results = await embedding_service.embed_mixed_batch(
+        [utility_bill, driving_license_chunk],
+        [query],
+    )
+    bill_result, unrelated_result = doc_results
+    query_result = query_results[0]
 
-    # Convert to numpy arrays
-    bill_emb = np.array(bill_result.embedding)
-    query_emb = np.array(query_result.embedding)
-    unrelated_emb = np.array(unrelated_result.embedding)
-
-    # Compute cosine similarities
-    def cosine_similarity(a, b):
-        return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
-
-    sim_query_bill = cosine_similarity(query_emb, bill_emb)
-    sim_query_unrelated = cosine_similarity(query_emb, unrelated_emb)
+    # Embeddings are unit-normalized, so cosine similarity is a plain dot product
+    sim_query_bill = float(query_result.embedding @ bill_result.embedding)
+    sim_query_unrelated = float(query_result.embedding @ unrelated_result.embedding)
 
     # Utility bill should be more similar to "address proof" than unrelated text
     assert sim_query_bill > sim_query_unrelated
@@ -150,8 +158,6 @@ async def test_embed_batch_semantic_search(embedding_service):
     1. Utility bill (relevant - contains address) - highest similarity
     2. Driving license (less relevant - has address but not proof of address)
     """
-    import numpy as np
-
     # Document chunks
     utility_bill_chunk = """
     WATER UTILITY BILL
@@ -175,22 +181,15 @@ async def test_embed_batch_semantic_search(embedding_service):
     # Search query
     query = "I want a proof of address for my customer"
 
-    # Batch embed all documents
+    # Batch embed all documents and the query together
     texts = [utility_bill_chunk, driving_license_chunk]
-    doc_results = await embedding_service.embed_document_batch(texts)
-    query_result = await embedding_service.embed_query(query)
+    doc_results, query_results = await embedding_service.embed_mixed_batch(texts, [query])
+    query_result = query_results[0]
 
-    # Convert to numpy arrays
-    query_emb = np.array(query_result.embedding)
-    bill_emb = np.array(doc_results[0].embedding)
-    license_emb = np.array(doc_results[1].embedding)
-
-    # Compute cosine similarities
-    def cosine_similarity(a, b):
-        return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
-
-    sim_query_bill = cosine_similarity(query_emb, bill_emb)
-    sim_query_license = cosine_similarity(query_emb, license_emb)
+    # Embeddings are unit-normalized, so one matrix-vector product gives all cosine similarities
+    similarities = np.stack([result.embedding for result in doc_results]) @ query_result.embedding
+    sim_query_bill = float(similarities[0])
+    sim_query_license = float(similarities[1])
 
     # Utility bill should be more semantically similar to "address proof"
     # than driving license (though both contain addresses)
@@ -202,3 +201,118 @@ async def test_embed_batch_semantic_search(embedding_service):
     # Verify batch maintained correct text-embedding pairing
     assert doc_results[0].text == utility_bill_chunk
     assert doc_results[1].text == driving_license_chunk
+
+
+@pytest.mark.asyncio
+async def test_embed_query_is_cached(embedding_service):
+    """Test that repeated queries are served from the query embedding cache."""
+    query = "cached query about portfolio performance"
+
+    first = await embedding_service.embed_query(query)
+    second = await embedding_service.embed_query(query)
+
+    assert second is first
+    assert second.text == query
+    assert not second.embedding.flags.writeable
+
+
+@pytest.mark.asyncio
+async def test_embed_query_cache_evicts_least_recently_used(sentence_transformer_model):
+    """Test that the query cache is bounded and evicts the oldest entry."""
+    from src.app.core.services.embedding import SentenceTransformerEmbedding
+
+    service = SentenceTransformerEmbedding(sentence_transformer_model, query_cache_size=2)
+
+    first = await service.embed_query("first query")
+    await service.embed_query("second query")
+    await service.embed_query("third query")
+
+    assert len(service._query_cache) == 2
+    assert await service.embed_query("first query") is not first
+
+
+@pytest.mark.asyncio
+async def test_embed_mixed_batch_matches_individual_embeddings(embedding_service):
+    """Test that a mixed batch produces the same vectors as embed_document/embed_query."""
+    document = "Quarterly portfolio statement for the Johnson family trust."
+    query = "portfolio statement"
+
+    doc_results, query_results = await embedding_service.embed_mixed_batch([document], [query])
+    single_doc = await embedding_service.embed_document(document)
+    single_query = await embedding_service.embed_query(query)
+
+    assert doc_results[0].text == document
+    assert query_results[0].text == query
+    np.testing.assert_allclose(doc_results[0].embedding, single_doc.embedding, rtol=1e-4, atol=1e-6)
+    np.testing.assert_allclose(query_results[0].embedding, single_query.embedding, rtol=1e-4, atol=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_embed_mixed_batch_empty_raises_error(embedding_service):
+    """Test that a mixed batch with no texts raises ValueError."""
+    with pytest.raises(ValueError, match="Texts list cannot be empty"):
+        await embedding_service.embed_mixed_batch([], [])
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    os.environ.get("TEST_FAST_EMBEDDER") != "1",
+    reason="loads a second embedding model; set TEST_FAST_EMBEDDER=1 to check INT8 drift",
+)
+async def test_int8_onnx_embeddings_stay_close_to_fp32():
+    """
+    Test that the INT8-quantized ONNX export (TEST_FAST_EMBEDDER=1) drifts only
+    slightly from the FP32 model on document-style texts.
+    """
+    pytest.importorskip("onnxruntime")
+    from src.app.config import get_settings
+    from src.app.containers import create_sentence_transformer
+    from src.app.core.services.embedding import SentenceTransformerEmbedding
+    from tests.conftest import quantized_onnx_file_name
+
+    model_name = get_settings().embedding.model_name
+    fp32_service = SentenceTransformerEmbedding(create_sentence_transformer(model_name, "torch"))
+    int8_service = SentenceTransformerEmbedding(
+        create_sentence_transformer(model_name, "onnx", quantized_onnx_file_name())
+    )
+
+    texts = [
+        "ELECTRICITY BILL Service Address: 123 Main Street, Apartment 4B, New York, NY 10001",
+        "DRIVER'S LICENSE License Number: D1234567 Name: Jane Doe",
+        "Portfolio performance exceeded benchmarks with 12% annual return in equities.",
+        "Estate planning for intergenerational wealth transfer strategies.",
+    ]
+    fp32_results = await fp32_service.embed_document_batch(texts)
+    int8_results = await int8_service.embed_document_batch(texts)
+
+    for fp32_result, int8_result in zip(fp32_results, int8_results):
+        assert float(fp32_result.embedding @ int8_result.embedding) > 0.98
+
+
+class PromptRecordingModel:
+    """Stub SentenceTransformer that records the texts passed to encode()."""
+
+    def __init__(self, prompts: dict[str, str], default_prompt_name: str | None = None):
+        self.prompts = prompts
+        self.default_prompt_name = default_prompt_name
+        self.encoded_texts: list[str] = []
+
+    def eval(self):
+        return self
+
+    def encode(self, texts, **kwargs):
+        self.encoded_texts.extend(texts)
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_embed_mixed_batch_resolves_prompts_like_encode_document():
+    """Test that the mixed batch falls back to "passage" and the default prompt like encode_document/encode_query."""
+    from src.app.core.services.embedding import SentenceTransformerEmbedding
+
+    model = PromptRecordingModel({"passage": "passage: ", "default": "text: "}, default_prompt_name="default")
+    service = SentenceTransformerEmbedding(model)
+
+    await service.embed_mixed_batch(["doc"], ["question"])
+
+    assert model.encoded_texts == ["passage: doc", "text: question"]
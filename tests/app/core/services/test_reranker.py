@@ -3,11 +3,12 @@
 Uses session-scoped reranker_service fixture from conftest.py to avoid
 reloading the ML model for each test.
 """
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 
 from src.app.core.domain.models import DocumentChunk, ScoredResult, Score, ScoreSource
+from src.app.core.services.reranker import CrossEncoderReranker, RerankerService
 
 
 # Content extractor for DocumentChunk - used across all tests
@@ -25,14 +26,14 @@ def create_scored_chunk(chunk: DocumentChunk, score: float = 0.7) -> ScoredResul
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_documents():
     """Create sample document chunks for testing."""
-    document_id = uuid4()
+    document_id = UUID(int=1)
 
     # Utility bill - best proof of address
     utility_bill_chunk = DocumentChunk(
-        id=uuid4(),
+        id=UUID(int=2),
         document_id=document_id,
         chunk_index=0,
         chunk_content="""
@@ -43,13 +44,12 @@ def sample_documents():
 
         This bill serves as proof of residence at the above address.
         This utility bill can be used as proof of address for official purposes.
-        """,
-        embedding=[0.1] * 384  # Dummy embedding
+        """
     )
 
     # Passport - proof of identity, NOT proof of address
     passport_chunk = DocumentChunk(
-        id=uuid4(),
+        id=UUID(int=3),
         document_id=document_id,
         chunk_index=1,
         chunk_content="""
@@ -63,13 +63,12 @@ def sample_documents():
 
         This document serves as proof of identity and citizenship.
         This passport is valid for international travel.
-        """,
-        embedding=[0.2] * 384  # Dummy embedding
+        """
     )
 
     # Driver's License - has address but weaker proof
     license_chunk = DocumentChunk(
-        id=uuid4(),
+        id=UUID(int=4),
         document_id=document_id,
         chunk_index=2,
         chunk_content="""
@@ -81,8 +80,7 @@ def sample_documents():
         Date of Birth: 03/15/1985
 
         This license authorizes the holder to operate motor vehicles.
-        """,
-        embedding=[0.3] * 384  # Dummy embedding
+        """
     )
 
     return {
@@ -158,37 +156,26 @@ async def test_rerank_with_top_k(reranker_service, sample_documents):
     assert len(ranked) == 2, "Should return only top_k results"
 
 
-@pytest.mark.asyncio
-async def test_rerank_empty_query_raises_error(reranker_service, sample_documents):
+# Input validation is a static method shared by rerank() and rerank_many(), so these
+# tests call it directly and never load the session-scoped model.
+
+def test_rerank_empty_query_raises_error(sample_documents):
     """Test that empty query raises ValueError."""
     initial_results = [
         create_scored_chunk(sample_documents["utility_bill"]),
     ]
 
     with pytest.raises(ValueError, match="Query cannot be empty"):
-        await reranker_service.rerank(
-            query="",
-            results=initial_results,
-            content_extractor=chunk_content_extractor,
-        )
+        RerankerService._validate_rerank_inputs([""], initial_results)
 
     with pytest.raises(ValueError, match="Query cannot be empty"):
-        await reranker_service.rerank(
-            query="   ",
-            results=initial_results,
-            content_extractor=chunk_content_extractor,
-        )
+        RerankerService._validate_rerank_inputs(["   "], initial_results)
 
 
-@pytest.mark.asyncio
-async def test_rerank_empty_results_raises_error(reranker_service):
+def test_rerank_empty_results_raises_error():
     """Test that empty results list raises ValueError."""
     with pytest.raises(ValueError, match="Results list cannot be empty"):
-        await reranker_service.rerank(
-            query="proof of address",
-            results=[],
-            content_extractor=chunk_content_extractor,
-        )
+        RerankerService._validate_rerank_inputs(["proof of address"], [])
 
 
 @pytest.mark.asyncio
@@ -231,15 +218,10 @@ async def test_rerank_different_queries_produce_different_rankings(reranker_serv
     ]
 
     # Query 1: proof of address - should rank utility bill highest
-    results_address = await reranker_service.rerank(
-        query="proof of address",
-        results=initial_results,
-        content_extractor=chunk_content_extractor,
-    )
-
     # Query 2: proof of identity - should rank passport highest
-    results_identity = await reranker_service.rerank(
-        query="proof of identity",
+    # Both queries share the same documents, so score them in one batched call
+    results_address, results_identity = await reranker_service.rerank_many(
+        queries=["proof of address", "proof of identity"],
         results=initial_results,
         content_extractor=chunk_content_extractor,
     )
@@ -254,6 +236,43 @@ async def test_rerank_different_queries_produce_different_rankings(reranker_serv
     )
 
 
+@pytest.mark.asyncio
+async def test_rerank_many_matches_individual_reranks(cross_encoder_model, sample_documents):
+    """Test that batched reranking over several queries matches one rerank() per query."""
+    # Bypass the memoized reranker_service: both paths must actually run the model
+    reranker_service = CrossEncoderReranker(cross_encoder_model)
+    initial_results = [
+        create_scored_chunk(sample_documents["utility_bill"]),
+        create_scored_chunk(sample_documents["passport"]),
+        create_scored_chunk(sample_documents["license"]),
+    ]
+    queries = ["proof of address", "proof of identity"]
+
+    ranked_per_query = await reranker_service.rerank_many(
+        queries=queries,
+        results=initial_results,
+        content_extractor=chunk_content_extractor,
+        top_k=2,
+    )
+
+    assert len(ranked_per_query) == len(queries)
+    for query, ranked in zip(queries, ranked_per_query):
+        expected = await reranker_service.rerank(
+            query=query,
+            results=initial_results,
+            content_extractor=chunk_content_extractor,
+            top_k=2,
+        )
+        assert [r.item.id for r in ranked] == [r.item.id for r in expected]
+        assert [r.value for r in ranked] == pytest.approx([r.value for r in expected], abs=1e-4)
+
+
+def test_rerank_many_empty_queries_raises_error(sample_documents):
+    """Test that an empty queries list raises ValueError."""
+    with pytest.raises(ValueError, match="Queries list cannot be empty"):
+        RerankerService._validate_rerank_inputs([], [create_scored_chunk(sample_documents["utility_bill"])])
+
+
 # =============================================================================
 # Generic Reranker Tests - Test with different item types
 # =============================================================================
@@ -333,14 +352,14 @@ async def test_rerank_with_dict_items(reranker_service):
 # 2. Queries seeking specific information (e.g., "John Doe's tax record") - client record should score LOW
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client_and_document_chunks():
     """Create client description and related document chunks for testing."""
-    document_id = uuid4()
+    document_id = UUID(int=11)
 
     # Client record description (as stored in client entity)
     client_description = DocumentChunk(
-        id=uuid4(),
+        id=UUID(int=12),
         document_id=document_id,
         chunk_index=0,
         chunk_content="""
@@ -349,13 +368,12 @@ def client_and_document_chunks():
         Senior Software Engineer at Tech Corp.
         Specializes in wealth management and retirement planning.
         High net worth individual with diverse investment portfolio.
-        """,
-        embedding=[0.1] * 384
+        """
     )
 
     # Tax document for John Doe
     tax_document = DocumentChunk(
-        id=uuid4(),
+        id=UUID(int=13),
         document_id=document_id,
         chunk_index=1,
         chunk_content="""
@@ -369,13 +387,12 @@ def client_and_document_chunks():
         Taxable Income: $380,000
         Total Tax Liability: $115,000
         Refund Amount: $10,000
-        """,
-        embedding=[0.2] * 384
+        """
     )
 
     # Investment portfolio document
     investment_document = DocumentChunk(
-        id=uuid4(),
+        id=UUID(int=14),
         document_id=document_id,
         chunk_index=2,
         chunk_content="""
@@ -387,8 +404,7 @@ def client_and_document_chunks():
         - Fixed Income: 25% ($625,000)
         - Alternative Investments: 15% ($375,000)
         YTD Performance: +12.5%
-        """,
-        embedding=[0.3] * 384
+        """
     )
 
     return {
@@ -535,20 +551,18 @@ async def test_cross_encoder_score_ranges_for_client_vs_document_queries(reranke
         ("What is John Doe's taxable income", "document_lookup"),
     ]
 
-    print("\n" + "=" * 80)
-    print("CrossEncoder Score Analysis: Client vs Document Queries")
-    print("=" * 80)
-
     client_lookup_scores = []
     document_lookup_scores = []
+    rows = []
 
-    for query, query_type in queries:
-        ranked = await reranker_service.rerank(
-            query=query,
-            results=initial_results,
-            content_extractor=chunk_content_extractor,
-        )
+    # Score every (query, document) pair in a single batched predict call
+    ranked_per_query = await reranker_service.rerank_many(
+        queries=[query for query, _ in queries],
+        results=initial_results,
+        content_extractor=chunk_content_extractor,
+    )
 
+    for (query, query_type), ranked in zip(queries, ranked_per_query):
         client_result = next(r for r in ranked if r.item.id == client_and_document_chunks["client"].id)
         client_score = client_result.value
 
@@ -557,17 +571,25 @@ async def test_cross_encoder_score_ranges_for_client_vs_document_queries(reranke
         else:
             document_lookup_scores.append(client_score)
 
-        print(f"  {query_type:15} | Query: '{query[:40]:<40}' | Client score: {client_score:+.4f}")
-
-    print("-" * 80)
-    print(f"Client lookup queries - Avg client score: {sum(client_lookup_scores)/len(client_lookup_scores):+.4f}")
-    print(f"Document lookup queries - Avg client score: {sum(document_lookup_scores)/len(document_lookup_scores):+.4f}")
-    print("=" * 80)
+        rows.append(f"  {query_type:15} | Query: '{query[:40]:<40}' | Client score: {client_score:+.4f}")
 
-    # Key assertion: client scores should be meaningfully higher for client-seeking queries
     avg_client_lookup = sum(client_lookup_scores) / len(client_lookup_scores)
     avg_document_lookup = sum(document_lookup_scores) / len(document_lookup_scores)
 
+    # Emit the whole analysis as a single block
+    print("\n".join([
+        "",
+        "=" * 80,
+        "CrossEncoder Score Analysis: Client vs Document Queries",
+        "=" * 80,
+        *rows,
+        "-" * 80,
+        f"Client lookup queries - Avg client score: {avg_client_lookup:+.4f}",
+        f"Document lookup queries - Avg client score: {avg_document_lookup:+.4f}",
+        "=" * 80,
+    ]))
+
+    # Key assertion: client scores should be meaningfully higher for client-seeking queries
     assert avg_client_lookup > avg_document_lookup, (
         f"Client-seeking queries should score client higher on average. "
         f"Client lookup avg: {avg_client_lookup:.4f}, Document lookup avg: {avg_document_lookup:.4f}"
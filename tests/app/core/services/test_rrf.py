@@ -1,23 +1,45 @@
 """Tests for Reciprocal Rank Fusion (RRF) implementation."""
 
+from typing import Callable
+from uuid import UUID
+
+import numpy as np
 import pytest
-from uuid import uuid4
 
-from src.app.core.domain.models import DocumentChunk, ScoredResult, Score, ScoreSource
+from src.app.core.domain.models import DocumentChunk, ScoredResult, Score, ScoreSource, embeddings_equal
 from src.app.core.services.rrf import ReciprocalRankFusion
 
 
-def create_chunk(chunk_id=None, content="test content") -> DocumentChunk:
-    """Helper to create a DocumentChunk for testing."""
-    return DocumentChunk(
-        id=chunk_id or uuid4(),
-        document_id=uuid4(),
+# Shared by every test chunk: stored by reference, so no per-chunk copy
+_DEFAULT_EMBEDDING = np.full(384, 0.1, dtype=np.float32)
+_DEFAULT_EMBEDDING.flags.writeable = False
+
+
+def create_chunk(uid: Callable[[], UUID], chunk_id=None, content="test content") -> DocumentChunk:
+    """Helper to create a DocumentChunk for testing (validation skipped, inputs are known-valid)."""
+    return DocumentChunk.model_construct(
+        id=chunk_id or uid(),
+        document_id=uid(),
         chunk_index=0,
         chunk_content=content,
-        embedding=[0.1] * 384,
+        embedding=_DEFAULT_EMBEDDING,
     )
 
 
+def bulk_create_chunks(uid: Callable[[], UUID], n: int) -> list[DocumentChunk]:
+    """Helper to create n distinct DocumentChunks in one pass for testing."""
+    return [
+        DocumentChunk.model_construct(
+            id=uid(),
+            document_id=uid(),
+            chunk_index=0,
+            chunk_content="test content",
+            embedding=_DEFAULT_EMBEDDING,
+        )
+        for _ in range(n)
+    ]
+
+
 def create_result(chunk: DocumentChunk, score: float, source: ScoreSource = ScoreSource.VECTOR_SIMILARITY) -> ScoredResult[DocumentChunk]:
     """Helper to create a ScoredResult[DocumentChunk] for testing."""
     return ScoredResult(
@@ -61,13 +83,13 @@ class TestReciprocalRankFusion:
         result = rrf.fuse([])
         assert result == []
 
-    def test_fuse_single_list_preserves_order(self):
+    def test_fuse_single_list_preserves_order(self, uid):
         """Test that fusing a single list preserves order."""
         rrf = ReciprocalRankFusion(k=60)
 
-        chunk1 = create_chunk()
-        chunk2 = create_chunk()
-        chunk3 = create_chunk()
+        chunk1 = create_chunk(uid)
+        chunk2 = create_chunk(uid)
+        chunk3 = create_chunk(uid)
 
         list1 = [
             create_result(chunk1, 0.9),
@@ -82,12 +104,33 @@ class TestReciprocalRankFusion:
         assert result[1].item.id == chunk2.id
         assert result[2].item.id == chunk3.id
 
-    def test_fuse_single_list_computes_rrf_scores(self):
+    def test_fuse_single_list_with_empty_lists_and_repeated_chunk(self, uid):
+        """Test the single-list path skips empty lists but still merges a repeated chunk."""
+        rrf = ReciprocalRankFusion(k=60)
+
+        chunk1 = create_chunk(uid)
+        chunk2 = create_chunk(uid)
+
+        # Only one non-empty list: ranked positionally
+        result = rrf.fuse([], [create_result(chunk1, 0.9), create_result(chunk2, 0.8)], [])
+        assert [r.item.id for r in result] == [chunk1.id, chunk2.id]
+        assert abs(result[0].value - 1 / 61) < 1e-6
+
+        # chunk2 appears twice in the same list: its contributions are summed
+        result = rrf.fuse([
+            create_result(chunk1, 0.9),
+            create_result(chunk2, 0.8),
+            create_result(chunk2, 0.7),
+        ])
+        assert [r.item.id for r in result] == [chunk2.id, chunk1.id]
+        assert abs(result[0].value - (1 / 62 + 1 / 63)) < 1e-6
+
+    def test_fuse_single_list_computes_rrf_scores(self, uid):
         """Test RRF score computation for a single list."""
         rrf = ReciprocalRankFusion(k=60)
 
-        chunk1 = create_chunk()
-        chunk2 = create_chunk()
+        chunk1 = create_chunk(uid)
+        chunk2 = create_chunk(uid)
 
         list1 = [
             create_result(chunk1, 0.9),
@@ -98,20 +141,20 @@ class TestReciprocalRankFusion:
 
         # RRF score for rank 1: 1/(60+1) = 1/61
         # RRF score for rank 2: 1/(60+2) = 1/62
-        assert abs(result[0].value - 1 / 61) < 1e-10
-        assert abs(result[1].value - 1 / 62) < 1e-10
+        assert abs(result[0].value - 1 / 61) < 1e-6
+        assert abs(result[1].value - 1 / 62) < 1e-6
         # Verify source is RRF_FUSION
         assert result[0].source == ScoreSource.RRF_FUSION
         assert result[1].source == ScoreSource.RRF_FUSION
 
-    def test_fuse_two_disjoint_lists(self):
+    def test_fuse_two_disjoint_lists(self, uid):
         """Test fusion of two lists with no overlapping chunks."""
         rrf = ReciprocalRankFusion(k=60)
 
-        chunk_a1 = create_chunk()
-        chunk_a2 = create_chunk()
-        chunk_b1 = create_chunk()
-        chunk_b2 = create_chunk()
+        chunk_a1 = create_chunk(uid)
+        chunk_a2 = create_chunk(uid)
+        chunk_b1 = create_chunk(uid)
+        chunk_b2 = create_chunk(uid)
 
         list_a = [create_result(chunk_a1, 0.9), create_result(chunk_a2, 0.8)]
         list_b = [create_result(chunk_b1, 0.95), create_result(chunk_b2, 0.85)]
@@ -131,14 +174,14 @@ class TestReciprocalRankFusion:
         assert result[2].item.id in rank2_ids
         assert result[3].item.id in rank2_ids
 
-    def test_fuse_overlapping_chunks_accumulate_scores(self):
+    def test_fuse_overlapping_chunks_accumulate_scores(self, uid):
         """Test that overlapping chunks accumulate RRF scores."""
         rrf = ReciprocalRankFusion(k=60)
 
         # Create chunks with known IDs
-        shared_chunk = create_chunk()
-        chunk_a = create_chunk()
-        chunk_b = create_chunk()
+        shared_chunk = create_chunk(uid)
+        chunk_a = create_chunk(uid)
+        chunk_b = create_chunk(uid)
 
         # Shared chunk appears in both lists
         list_a = [
@@ -160,15 +203,15 @@ class TestReciprocalRankFusion:
 
         # Shared chunk RRF score: 1/(60+1) + 1/(60+1) = 2/61
         expected_shared_score = 2 / 61
-        assert abs(result[0].value - expected_shared_score) < 1e-10
+        assert abs(result[0].value - expected_shared_score) < 1e-6
 
-    def test_fuse_different_ranks_for_same_chunk(self):
+    def test_fuse_different_ranks_for_same_chunk(self, uid):
         """Test chunk appearing at different ranks in different lists."""
         rrf = ReciprocalRankFusion(k=60)
 
-        shared_chunk = create_chunk()
-        chunk_a = create_chunk()
-        chunk_b = create_chunk()
+        shared_chunk = create_chunk(uid)
+        chunk_a = create_chunk(uid)
+        chunk_b = create_chunk(uid)
 
         # Shared chunk is rank 1 in list_a, rank 2 in list_b
         list_a = [
@@ -187,16 +230,16 @@ class TestReciprocalRankFusion:
 
         # RRF score: 1/(60+1) + 1/(60+2) = 1/61 + 1/62
         expected_score = 1 / 61 + 1 / 62
-        assert abs(shared_result.value - expected_score) < 1e-10
+        assert abs(shared_result.value - expected_score) < 1e-6
 
-    def test_fuse_three_lists(self):
+    def test_fuse_three_lists(self, uid):
         """Test fusion of three ranked lists."""
         rrf = ReciprocalRankFusion(k=60)
 
-        shared_chunk = create_chunk()
-        chunk_a = create_chunk()
-        chunk_b = create_chunk()
-        chunk_c = create_chunk()
+        shared_chunk = create_chunk(uid)
+        chunk_a = create_chunk(uid)
+        chunk_b = create_chunk(uid)
+        chunk_c = create_chunk(uid)
 
         list_a = [create_result(shared_chunk, 0.9), create_result(chunk_a, 0.8)]
         list_b = [create_result(shared_chunk, 0.95), create_result(chunk_b, 0.85)]
@@ -212,28 +255,45 @@ class TestReciprocalRankFusion:
 
         # RRF score: 1/61 + 1/61 + 1/62 (rank 1, 1, 2)
         expected_score = 1 / 61 + 1 / 61 + 1 / 62
-        assert abs(result[0].value - expected_score) < 1e-10
+        assert abs(result[0].value - expected_score) < 1e-6
 
-    def test_fuse_with_k_zero(self):
+    def test_fuse_with_k_zero(self, uid):
         """Test fusion with k=0 (ranks become the only factor)."""
         rrf = ReciprocalRankFusion(k=0)
 
-        chunk1 = create_chunk()
-        chunk2 = create_chunk()
+        chunk1 = create_chunk(uid)
+        chunk2 = create_chunk(uid)
 
         list1 = [create_result(chunk1, 0.9), create_result(chunk2, 0.8)]
 
         result = rrf.fuse(list1)
 
         # With k=0: rank 1 -> 1/1 = 1.0, rank 2 -> 1/2 = 0.5
-        assert abs(result[0].value - 1.0) < 1e-10
-        assert abs(result[1].value - 0.5) < 1e-10
+        assert abs(result[0].value - 1.0) < 1e-6
+        assert abs(result[1].value - 0.5) < 1e-6
+
+    def test_fuse_reuses_and_grows_reciprocal_table(self, uid):
+        """Test that the 1/(k+rank) table is pre-sized, cached across calls and grown for longer lists."""
+        rrf = ReciprocalRankFusion(k=60)
+        table = rrf._reciprocals
+        assert len(table) > 0
 
-    def test_fuse_with_limit(self):
+        short_list = [create_result(chunk, 0.9) for chunk in bulk_create_chunks(uid, 2)]
+        rrf.fuse(short_list)
+        rrf.fuse(short_list)
+        assert rrf._reciprocals is table
+
+        depth = len(table) + 1
+        long_list = [create_result(chunk, 0.9) for chunk in bulk_create_chunks(uid, depth)]
+        result = rrf.fuse(long_list)
+        assert len(rrf._reciprocals) >= depth
+        assert abs(result[-1].value - 1 / (60 + depth)) < 1e-6
+
+    def test_fuse_with_limit(self, uid):
         """Test fuse_with_limit returns only top-k results."""
         rrf = ReciprocalRankFusion(k=60)
 
-        chunks = [create_chunk() for _ in range(5)]
+        chunks = bulk_create_chunks(uid, 5)
         list1 = [create_result(chunk, 0.9 - i * 0.1) for i, chunk in enumerate(chunks)]
 
         result = rrf.fuse_with_limit(list1, limit=3)
@@ -243,11 +303,11 @@ class TestReciprocalRankFusion:
         assert result[1].item.id == chunks[1].id
         assert result[2].item.id == chunks[2].id
 
-    def test_fuse_with_limit_more_than_results(self):
+    def test_fuse_with_limit_more_than_results(self, uid):
         """Test fuse_with_limit when limit exceeds available results."""
         rrf = ReciprocalRankFusion(k=60)
 
-        chunks = [create_chunk() for _ in range(3)]
+        chunks = bulk_create_chunks(uid, 3)
         list1 = [create_result(chunk, 0.9) for chunk in chunks]
 
         result = rrf.fuse_with_limit(list1, limit=10)
@@ -255,24 +315,56 @@ class TestReciprocalRankFusion:
         # Should return all available results
         assert len(result) == 3
 
-    def test_fuse_preserves_chunk_data(self):
+    def test_fuse_with_limit_matches_fuse_prefix_on_ties(self, uid):
+        """Test fuse_with_limit keeps fuse()'s first-seen order for tied RRF scores."""
+        rrf = ReciprocalRankFusion(k=60)
+
+        chunks = bulk_create_chunks(uid, 6)
+        # Each chunk is rank 1 in exactly one list, so all RRF scores tie
+        lists = [[create_result(chunk, 0.9)] for chunk in chunks]
+
+        limited = rrf.fuse_with_limit(*lists, limit=4)
+        full = rrf.fuse(*lists)
+
+        assert [r.item.id for r in limited] == [r.item.id for r in full[:4]]
+        assert [r.item.id for r in limited] == [chunk.id for chunk in chunks[:4]]
+        assert rrf.fuse_with_limit(*lists, limit=0) == []
+
+    def test_fuse_with_limit_matches_fuse_prefix_for_large_fan_in(self, uid):
+        """Test the bounded top-k selection against a full fuse() over four overlapping lists."""
+        rrf = ReciprocalRankFusion(k=60)
+
+        chunks = bulk_create_chunks(uid, 300)
+        # Four channels with different, overlapping orderings of the candidate pool
+        lists = [
+            [create_result(chunk, 0.5) for chunk in chunks[offset::step]]
+            for offset, step in ((0, 1), (1, 2), (2, 3), (0, 5))
+        ]
+
+        limited = rrf.fuse_with_limit(*lists, limit=10)
+        full = rrf.fuse(*lists)
+
+        assert [(r.item.id, r.value) for r in limited] == [(r.item.id, r.value) for r in full[:10]]
+        assert [len(r.score_history) for r in limited] == [len(r.score_history) for r in full[:10]]
+
+    def test_fuse_preserves_chunk_data(self, uid):
         """Test that chunk data is preserved through fusion."""
         rrf = ReciprocalRankFusion(k=60)
 
-        chunk = create_chunk(content="important content")
+        chunk = create_chunk(uid, content="important content")
         list1 = [create_result(chunk, 0.9)]
 
         result = rrf.fuse(list1)
 
         assert result[0].item.chunk_content == "important content"
-        assert result[0].item.embedding == chunk.embedding
+        assert embeddings_equal(result[0].item.embedding, chunk.embedding)
 
-    def test_fuse_deterministic_ordering_for_equal_scores(self):
+    def test_fuse_deterministic_ordering_for_equal_scores(self, uid):
         """Test that fusion produces consistent results for equal scores."""
         rrf = ReciprocalRankFusion(k=60)
 
-        chunk1 = create_chunk()
-        chunk2 = create_chunk()
+        chunk1 = create_chunk(uid)
+        chunk2 = create_chunk(uid)
 
         list1 = [create_result(chunk1, 0.9)]
         list2 = [create_result(chunk2, 0.9)]
@@ -285,15 +377,15 @@ class TestReciprocalRankFusion:
         for result in results[1:]:
             assert [r.item.id for r in result] == first_result_order
 
-    def test_rrf_boosts_chunks_appearing_in_multiple_lists(self):
+    def test_rrf_boosts_chunks_appearing_in_multiple_lists(self, uid):
         """Test that chunks in multiple lists rank higher than single-list chunks."""
         rrf = ReciprocalRankFusion(k=60)
 
         # Chunk appearing in both lists at rank 2
-        shared_chunk = create_chunk()
+        shared_chunk = create_chunk(uid)
         # Chunks appearing at rank 1 but only in one list
-        top_a = create_chunk()
-        top_b = create_chunk()
+        top_a = create_chunk(uid)
+        top_b = create_chunk(uid)
 
         list_a = [create_result(top_a, 0.99), create_result(shared_chunk, 0.5)]
         list_b = [create_result(top_b, 0.99), create_result(shared_chunk, 0.5)]
@@ -307,12 +399,12 @@ class TestReciprocalRankFusion:
 
         assert result[0].item.id == shared_chunk.id
 
-    def test_fuse_preserves_score_history(self):
+    def test_fuse_preserves_score_history(self, uid):
         """Test that RRF fusion preserves original scores in history."""
         rrf = ReciprocalRankFusion(k=60)
 
-        shared_chunk = create_chunk()
-        chunk_a = create_chunk()
+        shared_chunk = create_chunk(uid)
+        chunk_a = create_chunk(uid)
 
         # Use different sources to test history tracking
         list_a = [create_result(shared_chunk, 0.9, ScoreSource.VECTOR_SIMILARITY)]
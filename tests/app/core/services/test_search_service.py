@@ -1,9 +1,8 @@
 """Tests for unified SearchService."""
-from unittest.mock import AsyncMock
-from uuid import uuid4
+import asyncio
+from uuid import UUID
 
 import pytest
-from pydantic.v1 import EmailStr
 
 from src.app.core.domain.models import (
     Client,
@@ -12,8 +11,9 @@ from src.app.core.domain.models import (
     Score,
     ScoreSource,
     SearchRequest,
+    SearchResult,
 )
-from src.app.core.services.search_service import SearchService
+from src.app.core.services.search_service import SearchResultCache, SearchService
 
 
 def create_client_result(client: Client, score: float) -> ScoredResult[Client]:
@@ -32,24 +32,73 @@ def create_document_result(document: Document, score: float) -> ScoredResult[Doc
     )
 
 
+@pytest.fixture(scope="module")
+def sample_clients() -> tuple[Client, ...]:
+    """Five generic clients built once per module, for tests that only check IDs and scores."""
+    return tuple(
+        Client.model_construct(
+            id=UUID(int=1 + i),
+            first_name=f"Client{i}",
+            last_name="Test",
+            email=f"client{i}@test.com",
+            description=f"Client {i}",
+        )
+        for i in range(5)
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_documents() -> tuple[Document, ...]:
+    """Three generic documents built once per module, for tests that only check IDs and scores."""
+    return tuple(
+        Document.model_construct(
+            id=UUID(int=101 + i),
+            client_id=UUID(int=201 + i),
+            title=f"Doc {i}",
+            s3_key=f"documents/doc-{i}.pdf",
+        )
+        for i in range(3)
+    )
+
+
+class StubSearchService:
+    """
+    Minimal stand-in for ClientSearchService / DocumentSearchService.
+
+    Records every SearchRequest in `calls`. Raises `error` when set,
+    otherwise returns `result`.
+    """
+
+    def __init__(self):
+        self.calls: list[SearchRequest] = []
+        self.result: list[ScoredResult] = []
+        self.error: Exception | None = None
+
+    async def search(self, request: SearchRequest) -> list[ScoredResult]:
+        self.calls.append(request)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
 @pytest.fixture
-def mock_client_search_service():
-    """Create a mock ClientSearchService."""
-    return AsyncMock()
+def client_search_stub():
+    """Create a stub ClientSearchService."""
+    return StubSearchService()
 
 
 @pytest.fixture
-def mock_document_search_service():
-    """Create a mock DocumentSearchService."""
-    return AsyncMock()
+def document_search_stub():
+    """Create a stub DocumentSearchService."""
+    return StubSearchService()
 
 
 @pytest.fixture
-def search_service(mock_client_search_service, mock_document_search_service):
-    """Create SearchService with mocked dependencies."""
+def search_service(client_search_stub, document_search_stub):
+    """Create SearchService with stubbed dependencies."""
     return SearchService(
-        client_search_service=mock_client_search_service,
-        document_search_service=mock_document_search_service,
+        client_search_service=client_search_stub,
+        document_search_service=document_search_stub,
     )
 
 class TestSearchServiceMixedResults:
@@ -57,45 +106,45 @@ class TestSearchServiceMixedResults:
 
     @pytest.mark.asyncio
     async def test_search_returns_mixed_results_sorted_by_score(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub, uid
     ):
         """Test that search returns mixed results sorted by score descending."""
         # Arrange
-        client1 = Client(
-            id=uuid4(),
+        client1 = Client.model_construct(
+            id=uid(),
             first_name="Alice",
             last_name="Smith",
-            email=EmailStr("alice@example.com"),
+            email="alice@example.com",
             description="Wealth manager",
         )
-        client2 = Client(
-            id=uuid4(),
+        client2 = Client.model_construct(
+            id=uid(),
             first_name="Bob",
             last_name="Johnson",
-            email=EmailStr("bob@example.com"),
+            email="bob@example.com",
             description="Portfolio manager",
         )
-        doc1 = Document(
-            id=uuid4(),
+        doc1 = Document.model_construct(
+            id=uid(),
             client_id=client1.id,
             title="Investment Strategy",
             s3_key="documents/investment-strategy.pdf",
         )
-        doc2 = Document(
-            id=uuid4(),
+        doc2 = Document.model_construct(
+            id=uid(),
             client_id=client1.id,
             title="Market Analysis",
             s3_key="documents/market-analysis.pdf",
         )
 
-        # Mock client search returns 2 results with scores 0.8 and 0.6
-        mock_client_search_service.search.return_value = [
+        # Client search returns 2 results with scores 0.8 and 0.6
+        client_search_stub.result = [
             create_client_result(client1, 0.8),
             create_client_result(client2, 0.6),
         ]
 
-        # Mock document search returns 2 results with scores 0.9 and 0.7
-        mock_document_search_service.search.return_value = [
+        # Document search returns 2 results with scores 0.9 and 0.7
+        document_search_stub.result = [
             create_document_result(doc1, 0.9),
             create_document_result(doc2, 0.7),
         ]
@@ -127,38 +176,21 @@ class TestSearchServiceMixedResults:
 
     @pytest.mark.asyncio
     async def test_search_respects_top_k_limit(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub, sample_clients, sample_documents
     ):
         """Test that search respects top_k limit when combined results exceed it."""
-        # Arrange - Create 3 clients and 3 documents (6 total)
-        clients = [
-            Client(
-                id=uuid4(),
-                first_name=f"Client{i}",
-                last_name="Test",
-                email=EmailStr(f"client{i}@test.com"),
-                description=f"Client {i}",
-            )
-            for i in range(3)
-        ]
-        documents = [
-            Document(
-                id=uuid4(),
-                client_id=uuid4(),
-                title=f"Doc {i}",
-                s3_key=f"documents/doc-{i}.pdf",
-            )
-            for i in range(3)
-        ]
+        # Arrange - 3 clients and 3 documents (6 total)
+        clients = sample_clients[:3]
+        documents = sample_documents
 
         # Mix of scores: 0.9, 0.8, 0.7, 0.6, 0.5, 0.4
-        mock_client_search_service.search.return_value = [
+        client_search_stub.result = [
             create_client_result(clients[0], 0.9),
             create_client_result(clients[1], 0.6),
             create_client_result(clients[2], 0.4),
         ]
 
-        mock_document_search_service.search.return_value = [
+        document_search_stub.result = [
             create_document_result(documents[0], 0.8),
             create_document_result(documents[1], 0.7),
             create_document_result(documents[2], 0.5),
@@ -181,26 +213,26 @@ class TestSearchServiceNoClientsFound:
 
     @pytest.mark.asyncio
     async def test_search_with_no_clients_returns_only_documents(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub, uid
     ):
         """Test that search works correctly when no clients are found."""
         # Arrange
-        doc1 = Document(
-            id=uuid4(),
-            client_id=uuid4(),
+        doc1 = Document.model_construct(
+            id=uid(),
+            client_id=uid(),
             title="Report",
             s3_key="documents/financial-report.pdf",
         )
-        doc2 = Document(
-            id=uuid4(),
-            client_id=uuid4(),
+        doc2 = Document.model_construct(
+            id=uid(),
+            client_id=uid(),
             title="Analysis",
             s3_key="documents/market-analysis.pdf",
         )
 
-        mock_client_search_service.search.return_value = []  # No clients found
+        client_search_stub.result = []  # No clients found
 
-        mock_document_search_service.search.return_value = [
+        document_search_stub.result = [
             create_document_result(doc1, 0.8),
             create_document_result(doc2, 0.6),
         ]
@@ -212,7 +244,7 @@ class TestSearchServiceNoClientsFound:
 
         # Assert
         assert len(results) == 2
-        assert all(result.type == "DOCUMENT" for result in results)
+        assert {result.type for result in results} == {"DOCUMENT"}
         assert results[0].entity.id == doc1.id
         assert results[1].entity.id == doc2.id
 
@@ -222,31 +254,31 @@ class TestSearchServiceNoDocumentsFound:
 
     @pytest.mark.asyncio
     async def test_search_with_no_documents_returns_only_clients(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub, uid
     ):
         """Test that search works correctly when no documents are found."""
         # Arrange
-        client1 = Client(
-            id=uuid4(),
+        client1 = Client.model_construct(
+            id=uid(),
             first_name="Jane",
             last_name="Doe",
-            email=EmailStr("jane@example.com"),
+            email="jane@example.com",
             description="Financial advisor",
         )
-        client2 = Client(
-            id=uuid4(),
+        client2 = Client.model_construct(
+            id=uid(),
             first_name="Mike",
             last_name="Wilson",
-            email=EmailStr("mike@example.com"),
+            email="mike@example.com",
             description="Investment consultant",
         )
 
-        mock_client_search_service.search.return_value = [
+        client_search_stub.result = [
             create_client_result(client1, 0.9),
             create_client_result(client2, 0.7),
         ]
 
-        mock_document_search_service.search.return_value = []  # No documents found
+        document_search_stub.result = []  # No documents found
 
         request = SearchRequest(query="financial advisor", top_k=10)
 
@@ -255,7 +287,7 @@ class TestSearchServiceNoDocumentsFound:
 
         # Assert
         assert len(results) == 2
-        assert all(result.type == "CLIENT" for result in results)
+        assert {result.type for result in results} == {"CLIENT"}
         assert results[0].entity.id == client1.id
         assert results[1].entity.id == client2.id
 
@@ -265,12 +297,12 @@ class TestSearchServiceEmptyResults:
 
     @pytest.mark.asyncio
     async def test_search_with_no_results_returns_empty_list(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub
     ):
         """Test that search returns empty list when nothing is found."""
         # Arrange
-        mock_client_search_service.search.return_value = []
-        mock_document_search_service.search.return_value = []
+        client_search_stub.result = []
+        document_search_stub.result = []
 
         request = SearchRequest(query="nonexistent query xyz", top_k=10)
 
@@ -278,7 +310,6 @@ class TestSearchServiceEmptyResults:
         results = await search_service.search(request)
 
         # Assert
-        assert len(results) == 0
         assert results == []
 
 
@@ -287,21 +318,16 @@ class TestSearchServiceExceptionHandling:
 
     @pytest.mark.asyncio
     async def test_search_handles_client_service_exception(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub, sample_documents
     ):
         """Test that search continues when client service raises exception."""
         # Arrange
-        doc1 = Document(
-            id=uuid4(),
-            client_id=uuid4(),
-            title="Report",
-            s3_key="documents/test-report.pdf",
-        )
+        doc1 = sample_documents[0]
 
         # Client search raises an exception
-        mock_client_search_service.search.side_effect = Exception("Client search failed")
+        client_search_stub.error = Exception("Client search failed")
 
-        mock_document_search_service.search.return_value = [
+        document_search_stub.result = [
             create_document_result(doc1, 0.8)
         ]
 
@@ -317,24 +343,18 @@ class TestSearchServiceExceptionHandling:
 
     @pytest.mark.asyncio
     async def test_search_handles_document_service_exception(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub, sample_clients
     ):
         """Test that search continues when document service raises exception."""
         # Arrange
-        client1 = Client(
-            id=uuid4(),
-            first_name="Test",
-            last_name="User",
-            email=EmailStr("test@example.com"),
-            description="Test client",
-        )
+        client1 = sample_clients[0]
 
-        mock_client_search_service.search.return_value = [
+        client_search_stub.result = [
             create_client_result(client1, 0.9)
         ]
 
         # Document search raises exception
-        mock_document_search_service.search.side_effect = Exception("Document search failed")
+        document_search_stub.error = Exception("Document search failed")
 
         request = SearchRequest(query="test", top_k=10)
 
@@ -348,12 +368,12 @@ class TestSearchServiceExceptionHandling:
 
     @pytest.mark.asyncio
     async def test_search_handles_both_services_exception(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub
     ):
         """Test that search returns empty when both services raise exceptions."""
         # Arrange
-        mock_client_search_service.search.side_effect = Exception("Client search failed")
-        mock_document_search_service.search.side_effect = Exception("Document search failed")
+        client_search_stub.error = Exception("Client search failed")
+        document_search_stub.error = Exception("Document search failed")
 
         request = SearchRequest(query="test", top_k=10)
 
@@ -361,7 +381,7 @@ class TestSearchServiceExceptionHandling:
         results = await search_service.search(request)
 
         # Assert - Should return empty list
-        assert len(results) == 0
+        assert results == []
 
 
 class TestSearchServiceSorting:
@@ -369,22 +389,13 @@ class TestSearchServiceSorting:
 
     @pytest.mark.asyncio
     async def test_search_sorts_results_by_score_descending(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub, sample_clients
     ):
         """Test that results are sorted by score descending."""
         # Arrange
-        clients = [
-            Client(
-                id=uuid4(),
-                first_name=f"Client{i}",
-                last_name="Test",
-                email=EmailStr(f"client{i}@test.com"),
-                description=f"Client {i}",
-            )
-            for i in range(5)
-        ]
+        clients = sample_clients
 
-        mock_client_search_service.search.return_value = [
+        client_search_stub.result = [
             create_client_result(clients[0], 0.95),
             create_client_result(clients[1], 0.85),
             create_client_result(clients[2], 0.75),
@@ -392,7 +403,7 @@ class TestSearchServiceSorting:
             create_client_result(clients[4], 0.55),
         ]
 
-        mock_document_search_service.search.return_value = []
+        document_search_stub.result = []
 
         request = SearchRequest(query="test", top_k=5)
 
@@ -407,30 +418,19 @@ class TestSearchServiceSorting:
 
     @pytest.mark.asyncio
     async def test_search_handles_equal_scores(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub, sample_clients, sample_documents
     ):
         """Test that equal scores are handled correctly."""
         # Arrange
-        client1 = Client(
-            id=uuid4(),
-            first_name="Alice",
-            last_name="Test",
-            email=EmailStr("alice@test.com"),
-            description="Client 1",
-        )
-        doc1 = Document(
-            id=uuid4(),
-            client_id=uuid4(),
-            title="Doc 1",
-            s3_key="documents/doc-1.pdf",
-        )
+        client1 = sample_clients[0]
+        doc1 = sample_documents[0]
 
         # Both have the same score
-        mock_client_search_service.search.return_value = [
+        client_search_stub.result = [
             create_client_result(client1, 0.8)
         ]
 
-        mock_document_search_service.search.return_value = [
+        document_search_stub.result = [
             create_document_result(doc1, 0.8)
         ]
 
@@ -450,12 +450,12 @@ class TestSearchServiceSearchRequestParameters:
 
     @pytest.mark.asyncio
     async def test_search_passes_request_to_both_services(
-        self, search_service, mock_client_search_service, mock_document_search_service
+        self, search_service, client_search_stub, document_search_stub
     ):
         """Test that the same SearchRequest is passed to both services."""
         # Arrange
-        mock_client_search_service.search.return_value = []
-        mock_document_search_service.search.return_value = []
+        client_search_stub.result = []
+        document_search_stub.result = []
 
         request = SearchRequest(query="test query", top_k=5)
 
@@ -463,5 +463,114 @@ class TestSearchServiceSearchRequestParameters:
         await search_service.search(request)
 
         # Assert - Verify both services were called with the request
-        mock_client_search_service.search.assert_called_once_with(request)
-        mock_document_search_service.search.assert_called_once_with(request)
+        assert client_search_stub.calls == [request]
+        assert document_search_stub.calls == [request]
+
+    @pytest.mark.asyncio
+    async def test_search_runs_both_services_concurrently(
+        self, search_service, client_search_stub, document_search_stub
+    ):
+        """Test that the client and document searches overlap instead of running back to back."""
+        # Arrange - each service only finishes once the other one has started
+        client_started = asyncio.Event()
+        document_started = asyncio.Event()
+
+        async def client_search(request):
+            client_started.set()
+            await document_started.wait()
+            return []
+
+        async def document_search(request):
+            document_started.set()
+            await client_started.wait()
+            return []
+
+        client_search_stub.search = client_search
+        document_search_stub.search = document_search
+
+        request = SearchRequest(query="test query", top_k=5)
+
+        # Act - sequential awaits would deadlock and time out here
+        results = await asyncio.wait_for(search_service.search(request), timeout=1)
+
+        # Assert
+        assert results == []
+
+
+class TestSearchServiceResultCache:
+    """Test SearchService with a shared SearchResultCache."""
+
+    @pytest.fixture
+    def cached_search_service(self, client_search_stub, document_search_stub):
+        """Create SearchService with stubbed dependencies and a result cache."""
+        return SearchService(
+            client_search_service=client_search_stub,
+            document_search_service=document_search_stub,
+            result_cache=SearchResultCache(max_size=2),
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_cached_returns_without_calling_backends(
+        self, cached_search_service, client_search_stub, document_search_stub, sample_clients, sample_documents
+    ):
+        """Test that a repeated request is answered from the cache."""
+        # Arrange
+        client_search_stub.result = [create_client_result(sample_clients[0], 0.9)]
+        document_search_stub.result = [create_document_result(sample_documents[0], 0.8)]
+        request = SearchRequest(query="test query", top_k=5)
+
+        # Act
+        first = await cached_search_service.search(request)
+        second = await cached_search_service.search(SearchRequest(query="test query", top_k=5))
+
+        # Assert - Backends called once, same results both times
+        assert second == first
+        assert client_search_stub.calls == [request]
+        assert document_search_stub.calls == [request]
+
+    @pytest.mark.asyncio
+    async def test_search_cache_keys_on_top_k_and_skips_partial_results(
+        self, cached_search_service, client_search_stub, document_search_stub, sample_clients, sample_documents
+    ):
+        """Test that a different top_k misses the cache and failed searches are not cached."""
+        # Arrange
+        client_search_stub.error = Exception("Client search failed")
+        document_search_stub.result = [create_document_result(sample_documents[0], 0.8)]
+
+        # Act - partial answer is returned but not cached
+        await cached_search_service.search(SearchRequest(query="test", top_k=5))
+        client_search_stub.error = None
+        client_search_stub.result = [create_client_result(sample_clients[0], 0.9)]
+        results = await cached_search_service.search(SearchRequest(query="test", top_k=5))
+        await cached_search_service.search(SearchRequest(query="test", top_k=1))
+
+        # Assert
+        assert [result.type for result in results] == ["CLIENT", "DOCUMENT"]
+        assert len(client_search_stub.calls) == 3
+        assert len(document_search_stub.calls) == 3
+
+
+def test_search_result_cache_evicts_least_recently_used(sample_clients):
+    """Test that the cache stays bounded and evicts the least recently used request."""
+    cache = SearchResultCache(max_size=2)
+    first, second, third = (SearchRequest(query=query) for query in ("a", "b", "c"))
+    result = [SearchResult(type="CLIENT", entity=sample_clients[0], score=0.9)]
+
+    cache.put(first, result)
+    cache.put(second, result)
+    assert cache.get(first) == result  # first is now most recently used
+    cache.put(third, result)
+
+    assert cache.get(second) is None
+    assert cache.get(first) == result
+    assert cache.get(third) == result
+
+
+def test_search_result_cache_expires_entries(sample_clients):
+    """Test that entries older than the TTL are not served."""
+    cache = SearchResultCache(max_size=2, ttl_seconds=0.0)
+    request = SearchRequest(query="a")
+
+    cache.put(request, [SearchResult(type="CLIENT", entity=sample_clients[0], score=0.9)])
+
+    assert cache.get(request) is None
@@ -1,39 +1,69 @@
 """Unit tests for summarization service with mocked LLM calls."""
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.app.core.services import summarization
 from src.app.core.services.summarization import (
     ClaudeSummarizationService,
     GeminiSummarizationService,
+    LLMSummarizationService,
     SummarizationError,
     SUMMARIZATION_PROMPT_TEMPLATE,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_llm_client_caches():
+    """Drop the shared LLM clients so each test sees its own patched SDK objects."""
+    summarization._get_claude_client.cache_clear()
+    yield
+    summarization._get_claude_client.cache_clear()
+
+
+def make_claude_client(text: str) -> tuple[SimpleNamespace, list[dict]]:
+    """Stub AsyncAnthropic client whose messages.create() returns `text` and records its kwargs."""
+    calls: list[dict] = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    return SimpleNamespace(messages=SimpleNamespace(create=create)), calls
+
+
+def make_gemini_model(text: str) -> tuple[SimpleNamespace, list[str]]:
+    """Stub GenerativeModel whose generate_content_async() returns `text` and records its prompts."""
+    prompts: list[str] = []
+
+    async def generate_content_async(prompt):
+        prompts.append(prompt)
+        return SimpleNamespace(text=text)
+
+    return SimpleNamespace(generate_content_async=generate_content_async), prompts
+
+
 class TestClaudeSummarizationService:
     """Tests for Claude summarization service."""
 
     @pytest.mark.asyncio
     async def test_summarize_success(self):
         """Test successful summarization with Claude."""
-        mock_client = MagicMock()
-        mock_message = MagicMock()
-        mock_message.content = [MagicMock(text="This is a summary of the document.")]
-        mock_client.messages.create = AsyncMock(return_value=mock_message)
+        client, calls = make_claude_client("This is a summary of the document.")
 
-        with patch("anthropic.AsyncAnthropic", return_value=mock_client):
+        with patch("anthropic.AsyncAnthropic", return_value=client):
             service = ClaudeSummarizationService(
                 api_key="test-api-key",
                 model="claude-3-haiku-20240307"
             )
-            service.client = mock_client
 
             result = await service.summarize("This is a long document content.")
 
             assert result == "This is a summary of the document."
-            mock_client.messages.create.assert_called_once()
-            call_kwargs = mock_client.messages.create.call_args.kwargs
+            assert len(calls) == 1
+            call_kwargs = calls[0]
             assert call_kwargs["model"] == "claude-3-haiku-20240307"
             assert call_kwargs["max_tokens"] == 200
             assert len(call_kwargs["messages"]) == 1
@@ -42,17 +72,13 @@ class TestClaudeSummarizationService:
     @pytest.mark.asyncio
     async def test_summarize_strips_whitespace(self):
         """Test that summarization strips whitespace from response."""
-        mock_client = MagicMock()
-        mock_message = MagicMock()
-        mock_message.content = [MagicMock(text="  Summary with whitespace  \n")]
-        mock_client.messages.create = AsyncMock(return_value=mock_message)
+        client, _ = make_claude_client("  Summary with whitespace  \n")
 
-        with patch("anthropic.AsyncAnthropic", return_value=mock_client):
+        with patch("anthropic.AsyncAnthropic", return_value=client):
             service = ClaudeSummarizationService(
                 api_key="test-api-key",
                 model="claude-3-haiku-20240307"
             )
-            service.client = mock_client
 
             result = await service.summarize("Document content")
 
@@ -77,33 +103,57 @@ class TestClaudeSummarizationService:
                 api_key="test-api-key",
                 model="claude-3-haiku-20240307"
             )
-            service.client = mock_client
 
             with pytest.raises(SummarizationError) as exc_info:
                 await service.summarize("Document content")
 
             assert "Claude summarization failed" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_summarize_caches_identical_content(self):
+        """Test that summarizing the same content twice calls Claude once."""
+        client, calls = make_claude_client("Summary")
+
+        with patch("anthropic.AsyncAnthropic", return_value=client):
+            service = ClaudeSummarizationService(
+                api_key="test-api-key",
+                model="claude-3-haiku-20240307"
+            )
+
+            first = await service.summarize("Document content")
+            second = await service.summarize("Document content")
+            await service.summarize("Other content")
+
+        assert first == second == "Summary"
+        assert len(calls) == 2
+
     @pytest.mark.asyncio
     async def test_custom_model(self):
         """Test using a custom Claude model."""
-        mock_client = MagicMock()
-        mock_message = MagicMock()
-        mock_message.content = [MagicMock(text="Summary")]
-        mock_client.messages.create = AsyncMock(return_value=mock_message)
+        client, calls = make_claude_client("Summary")
 
-        with patch("anthropic.AsyncAnthropic", return_value=mock_client):
+        with patch("anthropic.AsyncAnthropic", return_value=client):
             service = ClaudeSummarizationService(
                 api_key="test-api-key",
                 model="claude-3-sonnet-20240229"
             )
-            service.client = mock_client
 
             await service.summarize("Content")
 
-            call_kwargs = mock_client.messages.create.call_args.kwargs
+            call_kwargs = calls[-1]
             assert call_kwargs["model"] == "claude-3-sonnet-20240229"
 
+    def test_services_with_same_api_key_share_client(self):
+        """Test that the AsyncAnthropic client is created once per API key."""
+        with patch("anthropic.AsyncAnthropic", side_effect=lambda api_key: MagicMock()) as mock_anthropic:
+            first = ClaudeSummarizationService(api_key="test-api-key", model="claude-3-haiku-20240307")
+            second = ClaudeSummarizationService(api_key="test-api-key", model="claude-3-sonnet-20240229")
+            other = ClaudeSummarizationService(api_key="other-api-key", model="claude-3-haiku-20240307")
+
+        assert first.client is second.client
+        assert other.client is not first.client
+        assert mock_anthropic.call_count == 2
+
     def test_raises_error_when_no_model_provided(self):
         """Test that ValueError is raised when model is not provided."""
         with pytest.raises(ValueError) as exc_info:
@@ -118,13 +168,10 @@ class TestGeminiSummarizationService:
     @pytest.mark.asyncio
     async def test_summarize_success(self):
         """Test successful summarization with Gemini."""
-        mock_model = MagicMock()
-        mock_response = MagicMock()
-        mock_response.text = "This is a Gemini summary."
-        mock_model.generate_content_async = AsyncMock(return_value=mock_response)
+        model, prompts = make_gemini_model("This is a Gemini summary.")
 
         with patch("google.generativeai.configure"):
-            with patch("google.generativeai.GenerativeModel", return_value=mock_model):
+            with patch("google.generativeai.GenerativeModel", return_value=model):
                 service = GeminiSummarizationService(
                     api_key="test-api-key",
                     model="gemini-1.5-flash"
@@ -133,20 +180,16 @@ class TestGeminiSummarizationService:
                 result = await service.summarize("Document content for Gemini")
 
                 assert result == "This is a Gemini summary."
-                mock_model.generate_content_async.assert_called_once()
-                call_args = mock_model.generate_content_async.call_args[0][0]
-                assert "Document content for Gemini" in call_args
+                assert len(prompts) == 1
+                assert "Document content for Gemini" in prompts[0]
 
     @pytest.mark.asyncio
     async def test_summarize_strips_whitespace(self):
         """Test that summarization strips whitespace from response."""
-        mock_model = MagicMock()
-        mock_response = MagicMock()
-        mock_response.text = "  Summary with whitespace  \n"
-        mock_model.generate_content_async = AsyncMock(return_value=mock_response)
+        model, _ = make_gemini_model("  Summary with whitespace  \n")
 
         with patch("google.generativeai.configure"):
-            with patch("google.generativeai.GenerativeModel", return_value=mock_model):
+            with patch("google.generativeai.GenerativeModel", return_value=model):
                 service = GeminiSummarizationService(
                     api_key="test-api-key",
                     model="gemini-1.5-flash"
@@ -179,13 +222,10 @@ class TestGeminiSummarizationService:
     @pytest.mark.asyncio
     async def test_custom_model(self):
         """Test using a custom Gemini model."""
-        mock_model = MagicMock()
-        mock_response = MagicMock()
-        mock_response.text = "Summary"
-        mock_model.generate_content_async = AsyncMock(return_value=mock_response)
+        model, _ = make_gemini_model("Summary")
 
         with patch("google.generativeai.configure") as mock_configure:
-            with patch("google.generativeai.GenerativeModel", return_value=mock_model) as mock_gen_model:
+            with patch("google.generativeai.GenerativeModel", return_value=model) as mock_gen_model:
                 service = GeminiSummarizationService(
                     api_key="test-api-key",
                     model="gemini-1.5-pro"
@@ -196,6 +236,20 @@ class TestGeminiSummarizationService:
                 mock_configure.assert_called_once_with(api_key="test-api-key")
                 mock_gen_model.assert_called_once_with("gemini-1.5-pro")
 
+    def test_each_service_configures_its_own_api_key(self):
+        """Test that switching back to an earlier API key reconfigures the process-global SDK."""
+        with patch("google.generativeai.configure") as mock_configure:
+            with patch("google.generativeai.GenerativeModel", side_effect=lambda model: MagicMock()):
+                GeminiSummarizationService(api_key="first-api-key", model="gemini-1.5-flash")
+                GeminiSummarizationService(api_key="second-api-key", model="gemini-1.5-flash")
+                GeminiSummarizationService(api_key="first-api-key", model="gemini-1.5-flash")
+
+        assert [call.kwargs["api_key"] for call in mock_configure.call_args_list] == [
+            "first-api-key",
+            "second-api-key",
+            "first-api-key",
+        ]
+
     def test_raises_error_when_no_model_provided(self):
         """Test that ValueError is raised when model is not provided."""
         with pytest.raises(ValueError) as exc_info:
@@ -204,6 +258,123 @@ class TestGeminiSummarizationService:
         assert "Gemini model must be specified" in str(exc_info.value)
 
 
+class TestLLMSummarizationService:
+    """Tests for the summarize() flow shared by LLM providers."""
+
+    class EchoSummarizationService(LLMSummarizationService):
+        provider_name = "Echo"
+        api_errors = (ConnectionError,)
+
+        def __init__(self, error: Exception | None = None):
+            super().__init__(max_words=10)
+            self.error = error
+
+        async def _complete(self, prompt: str) -> str:
+            if self.error is not None:
+                raise self.error
+            return f"  {prompt.split()[-2]}  "
+
+    @pytest.mark.asyncio
+    async def test_summarize_formats_prompt_and_strips(self):
+        """Test that the completion receives the formatted prompt and is stripped."""
+        service = self.EchoSummarizationService()
+
+        assert await service.summarize("content") == "content"
+
+    @pytest.mark.asyncio
+    async def test_summarize_wraps_only_declared_api_errors(self):
+        """Test that declared provider errors become SummarizationError and others propagate."""
+        with pytest.raises(SummarizationError, match="Echo summarization failed"):
+            await self.EchoSummarizationService(ConnectionError("down")).summarize("content")
+
+        with pytest.raises(KeyError):
+            await self.EchoSummarizationService(KeyError("bug")).summarize("content")
+
+    @pytest.mark.asyncio
+    async def test_summary_cache_evicts_least_recently_used(self):
+        """Test that the summary cache keeps at most cache_size entries, evicting the oldest."""
+        service = self.EchoSummarizationService()
+        service.cache_size = 2
+
+        for content in ("first", "second", "first", "third"):
+            await service.summarize(content)
+
+        assert list(service._summary_cache) == [service._cache_key("first"), service._cache_key("third")]
+
+    @pytest.mark.asyncio
+    async def test_failed_summaries_are_not_cached(self):
+        """Test that a failed completion is retried on the next call."""
+        service = self.EchoSummarizationService(ConnectionError("down"))
+
+        with pytest.raises(SummarizationError):
+            await service.summarize("content")
+        service.error = None
+
+        assert await service.summarize("content") == "content"
+
+
+class TestSummarizeMany:
+    """Tests for batched summarization shared by all providers."""
+
+    @staticmethod
+    def _service_with_client(create) -> tuple[ClaudeSummarizationService, AsyncMock]:
+        """Build a Claude service whose patched client routes messages.create() to `create`."""
+        client = MagicMock()
+        client.messages.create = AsyncMock(side_effect=create)
+        with patch("anthropic.AsyncAnthropic", return_value=client):
+            service = ClaudeSummarizationService(api_key="test-api-key", model="claude-3-haiku-20240307")
+        return service, client.messages.create
+
+    @pytest.mark.asyncio
+    async def test_summarize_many_runs_concurrently(self):
+        """Test that calls overlap up to max_concurrency and results keep input order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            # The prompt ends with "...document <i>\n\nSummary:", so echo <i> back
+            document_number = kwargs["messages"][0]["content"].split()[-2]
+            return SimpleNamespace(content=[SimpleNamespace(text=f"summary of {document_number}")])
+
+        service, create_mock = self._service_with_client(create)
+        contents = [f"document {i}" for i in range(6)]
+
+        results = await service.summarize_many(contents, max_concurrency=3)
+
+        assert create_mock.call_count == len(contents)
+        assert max_in_flight == 3
+        assert results == [f"summary of {i}" for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_summarize_many_returns_none_for_failed_documents(self):
+        """Test that a failed document yields None without failing the batch."""
+        import anthropic
+
+        async def create(**kwargs):
+            if "bad" in kwargs["messages"][0]["content"]:
+                raise anthropic.APIError(message="API Error", request=MagicMock(), body=None)
+            return SimpleNamespace(content=[SimpleNamespace(text="Summary")])
+
+        service, _ = self._service_with_client(create)
+
+        results = await service.summarize_many(["good document", "bad document"])
+
+        assert results == ["Summary", None]
+
+    @pytest.mark.asyncio
+    async def test_summarize_many_rejects_non_positive_concurrency(self):
+        """Test that max_concurrency must be at least 1."""
+        service, _ = self._service_with_client(AsyncMock())
+
+        with pytest.raises(ValueError):
+            await service.summarize_many(["document"], max_concurrency=0)
+
+
 class TestSummarizationPrompt:
     """Tests for the summarization prompt template."""
 
@@ -225,3 +396,11 @@ class TestSummarizationPrompt:
         assert "100" in formatted
         assert "{content}" not in formatted
         assert "{max_words}" not in formatted
+
+    def test_precompiled_prompt_matches_template_format(self):
+        """Test that the concatenated prompt equals formatting the template directly."""
+        content = "Balance: {amount} in account {id}"
+
+        assert summarization._format_prompt(content, 50) == SUMMARIZATION_PROMPT_TEMPLATE.format(
+            content=content, max_words=50
+        )
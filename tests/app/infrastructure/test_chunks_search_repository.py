@@ -16,29 +16,39 @@ from src.app.core.domain.models import Client
 from pydantic.v1 import EmailStr
 
 
-@pytest_asyncio.fixture
-async def chunk_search_repository(clean_database):
-    """Create a document search repository."""
-    return ChunksRepositorySearch(clean_database, DocumentChunkMapper())
+@pytest.fixture(scope="module")
+def chunk_mapper():
+    """Stateless chunk mapper, shared by every test in the module."""
+    return DocumentChunkMapper()
 
 
-@pytest_asyncio.fixture
-async def unit_of_work(clean_database):
-    """Create a unit of work for test data setup."""
-    entity_mapper = EntityMapper(
+@pytest.fixture(scope="module")
+def entity_mapper(chunk_mapper):
+    """Stateless entity mapper for test data setup, shared by every test in the module."""
+    return EntityMapper(
         entity_mappings={
             Client: ClientMapper().to_entity,
             Document: DocumentMapper().to_entity,
-            DocumentChunk: DocumentChunkMapper().to_entity,
+            DocumentChunk: chunk_mapper.to_entity,
         }
     )
+
+
+@pytest_asyncio.fixture
+async def chunk_search_repository(clean_database, chunk_mapper):
+    """Create a document search repository."""
+    return ChunksRepositorySearch(clean_database, chunk_mapper)
+
+
+@pytest_asyncio.fixture
+async def unit_of_work(clean_database, entity_mapper):
+    """Create a unit of work for test data setup."""
     return UnitOfWork(clean_database, entity_mapper)
 
 
-@pytest.mark.asyncio
-async def test_search_by_vector_returns_similar_chunks(chunk_search_repository, unit_of_work):
-    """Test that vector search returns chunks ordered by similarity."""
-    # Arrange - Create a client and document
+@pytest_asyncio.fixture
+async def persisted_client_document(unit_of_work):
+    """Persist one client and one processed document for the chunks under test."""
     client = Client(
         id=uuid4(),
         first_name="Test",
@@ -54,6 +64,19 @@ async def test_search_by_vector_returns_similar_chunks(chunk_search_repository,
         status=DocumentStatus.PROCESSED
     )
 
+    async with unit_of_work:
+        unit_of_work.add(client)
+        unit_of_work.add(document)
+
+    return client, document
+
+
+@pytest.mark.asyncio
+async def test_search_by_vector_returns_similar_chunks(chunk_search_repository, unit_of_work, persisted_client_document):
+    """Test that vector search returns chunks ordered by similarity."""
+    # Arrange
+    _, document = persisted_client_document
+
     # Create chunks with different embeddings
     # Embedding 1: Opposite direction - negative values (low similarity to positive query)
     chunk1 = DocumentChunk(
@@ -84,8 +107,6 @@ async def test_search_by_vector_returns_similar_chunks(chunk_search_repository,
 
     # Persist all entities
     async with unit_of_work:
-        unit_of_work.add(client)
-        unit_of_work.add(document)
         unit_of_work.add(chunk1)
         unit_of_work.add(chunk2)
         unit_of_work.add(chunk3)
@@ -109,40 +130,24 @@ async def test_search_by_vector_returns_similar_chunks(chunk_search_repository,
 
 
 @pytest.mark.asyncio
-async def test_search_by_vector_respects_limit(chunk_search_repository, unit_of_work):
+async def test_search_by_vector_respects_limit(chunk_search_repository, unit_of_work, persisted_client_document):
     """Test that the limit parameter restricts the number of results."""
-    # Arrange - Create a client, document, and multiple chunks
-    client = Client(
-        id=uuid4(),
-        first_name="Test",
-        last_name="User",
-        email=EmailStr("test@example.com")
-    )
-
-    document = Document(
-        id=uuid4(),
-        client_id=client.id,
-        title="Test Document",
-        s3_key="test/document.pdf",
-        status=DocumentStatus.PROCESSED
-    )
+    # Arrange - Create multiple chunks
+    _, document = persisted_client_document
 
     # Create 5 chunks with embeddings
-    chunks = []
+    chunks = [
+        DocumentChunk(
+            id=uuid4(),
+            document_id=document.id,
+            chunk_index=i,
+            chunk_content=f"This is chunk {i}",
+            embedding=[float(i) / 10] * 384
+        )
+        for i in range(5)
+    ]
     async with unit_of_work:
-        unit_of_work.add(client)
-        unit_of_work.add(document)
-
-        for i in range(5):
-            chunk = DocumentChunk(
-                id=uuid4(),
-                document_id=document.id,
-                chunk_index=i,
-                chunk_content=f"This is chunk {i}",
-                embedding=[float(i) / 10] * 384
-            )
-            chunks.append(chunk)
-            unit_of_work.add(chunk)
+        unit_of_work.add_many(chunks)
 
     # Act - Search with limit=3
     query_vector = [1.0] * 384
@@ -153,23 +158,10 @@ async def test_search_by_vector_respects_limit(chunk_search_repository, unit_of_
 
 
 @pytest.mark.asyncio
-async def test_search_by_vector_with_similarity_threshold(chunk_search_repository, unit_of_work):
+async def test_search_by_vector_with_similarity_threshold(chunk_search_repository, unit_of_work, persisted_client_document):
     """Test that similarity_threshold filters out low-scoring results."""
-    # Arrange - Create a client, document, and chunks
-    client = Client(
-        id=uuid4(),
-        first_name="Test",
-        last_name="User",
-        email=EmailStr("test@example.com")
-    )
-
-    document = Document(
-        id=uuid4(),
-        client_id=client.id,
-        title="Test Document",
-        s3_key="test/document.pdf",
-        status=DocumentStatus.PROCESSED
-    )
+    # Arrange - Create chunks
+    _, document = persisted_client_document
 
     # Create chunks with varying similarity to query vector [1.0, 1.0, ...]
     # High similarity chunk - same direction as query
@@ -191,8 +183,6 @@ async def test_search_by_vector_with_similarity_threshold(chunk_search_repositor
     )
 
     async with unit_of_work:
-        unit_of_work.add(client)
-        unit_of_work.add(document)
         unit_of_work.add(high_sim_chunk)
         unit_of_work.add(low_sim_chunk)
 
@@ -212,23 +202,10 @@ async def test_search_by_vector_with_similarity_threshold(chunk_search_repositor
 
 
 @pytest.mark.asyncio
-async def test_search_by_vector_excludes_chunks_without_embeddings(chunk_search_repository, unit_of_work):
+async def test_search_by_vector_excludes_chunks_without_embeddings(chunk_search_repository, unit_of_work, persisted_client_document):
     """Test that chunks without embeddings are excluded from search results."""
     # Arrange - Create chunks with and without embeddings
-    client = Client(
-        id=uuid4(),
-        first_name="Test",
-        last_name="User",
-        email=EmailStr("test@example.com")
-    )
-
-    document = Document(
-        id=uuid4(),
-        client_id=client.id,
-        title="Test Document",
-        s3_key="test/document.pdf",
-        status=DocumentStatus.PROCESSED
-    )
+    _, document = persisted_client_document
 
     # Chunk with embedding
     chunk_with_embedding = DocumentChunk(
@@ -249,8 +226,6 @@ async def test_search_by_vector_excludes_chunks_without_embeddings(chunk_search_
     )
 
     async with unit_of_work:
-        unit_of_work.add(client)
-        unit_of_work.add(document)
         unit_of_work.add(chunk_with_embedding)
         unit_of_work.add(chunk_without_embedding)
 
@@ -263,6 +238,31 @@ async def test_search_by_vector_excludes_chunks_without_embeddings(chunk_search_
     assert results[0].item.id == chunk_with_embedding.id
 
 
+@pytest.mark.asyncio
+async def test_search_by_vector_scores_are_cosine_for_unnormalized_vectors(chunk_search_repository, unit_of_work, persisted_client_document):
+    """Test that stored and query vectors are normalized, so scores stay cosine similarities."""
+    # Arrange - Same direction as the query but different magnitudes
+    _, document = persisted_client_document
+
+    chunk = DocumentChunk(
+        id=uuid4(),
+        document_id=document.id,
+        chunk_index=0,
+        chunk_content="Scaled chunk",
+        embedding=[0.25] * 384
+    )
+
+    async with unit_of_work:
+        unit_of_work.add(chunk)
+
+    # Act
+    results = await chunk_search_repository.search_by_vector([3.0] * 384, limit=10, similarity_threshold=0.99)
+
+    # Assert - Cosine similarity of parallel vectors is 1.0 regardless of magnitude
+    assert len(results) == 1
+    assert results[0].value == pytest.approx(1.0, abs=1e-5)
+
+
 @pytest.mark.asyncio
 async def test_search_by_vector_empty_query_raises_error(chunk_search_repository):
     """Test that searching with an empty query vector raises ValueError."""
@@ -295,23 +295,10 @@ async def test_search_by_vector_returns_empty_when_no_chunks(chunk_search_reposi
 # ============================================================================
 
 @pytest.mark.asyncio
-async def test_search_by_keyword_returns_matching_chunks(chunk_search_repository, unit_of_work):
+async def test_search_by_keyword_returns_matching_chunks(chunk_search_repository, unit_of_work, persisted_client_document):
     """Test that keyword search returns chunks containing the search terms."""
-    # Arrange - Create a client and document
-    client = Client(
-        id=uuid4(),
-        first_name="Test",
-        last_name="User",
-        email=EmailStr("test@example.com")
-    )
-
-    document = Document(
-        id=uuid4(),
-        client_id=client.id,
-        title="Test Document",
-        s3_key="test/document.pdf",
-        status=DocumentStatus.PROCESSED
-    )
+    # Arrange
+    _, document = persisted_client_document
 
     # Create chunks with different content
     chunk1 = DocumentChunk(
@@ -339,8 +326,6 @@ async def test_search_by_keyword_returns_matching_chunks(chunk_search_repository
     )
 
     async with unit_of_work:
-        unit_of_work.add(client)
-        unit_of_work.add(document)
         unit_of_work.add(chunk1)
         unit_of_work.add(chunk2)
         unit_of_work.add(chunk3)
@@ -361,37 +346,23 @@ async def test_search_by_keyword_returns_matching_chunks(chunk_search_repository
 
 
 @pytest.mark.asyncio
-async def test_search_by_keyword_respects_limit(chunk_search_repository, unit_of_work):
+async def test_search_by_keyword_respects_limit(chunk_search_repository, unit_of_work, persisted_client_document):
     """Test that keyword search respects the limit parameter."""
     # Arrange - Create chunks all containing the same keyword
-    client = Client(
-        id=uuid4(),
-        first_name="Test",
-        last_name="User",
-        email=EmailStr("test@example.com")
-    )
-
-    document = Document(
-        id=uuid4(),
-        client_id=client.id,
-        title="Test Document",
-        s3_key="test/document.pdf",
-        status=DocumentStatus.PROCESSED
-    )
-
+    _, document = persisted_client_document
+
+    chunks = [
+        DocumentChunk(
+            id=uuid4(),
+            document_id=document.id,
+            chunk_index=i,
+            chunk_content=f"Investment strategy number {i} for retirement",
+            embedding=[0.1] * 384
+        )
+        for i in range(5)
+    ]
     async with unit_of_work:
-        unit_of_work.add(client)
-        unit_of_work.add(document)
-
-        for i in range(5):
-            chunk = DocumentChunk(
-                id=uuid4(),
-                document_id=document.id,
-                chunk_index=i,
-                chunk_content=f"Investment strategy number {i} for retirement",
-                embedding=[0.1] * 384
-            )
-            unit_of_work.add(chunk)
+        unit_of_work.add_many(chunks)
 
     # Act - Search with limit=2
     results = await chunk_search_repository.search_by_keyword("investment", limit=2)
@@ -401,23 +372,10 @@ async def test_search_by_keyword_respects_limit(chunk_search_repository, unit_of
 
 
 @pytest.mark.asyncio
-async def test_search_by_keyword_returns_empty_when_no_matches(chunk_search_repository, unit_of_work):
+async def test_search_by_keyword_returns_empty_when_no_matches(chunk_search_repository, unit_of_work, persisted_client_document):
     """Test that keyword search returns empty list when no chunks match."""
     # Arrange - Create chunks that don't match search term
-    client = Client(
-        id=uuid4(),
-        first_name="Test",
-        last_name="User",
-        email=EmailStr("test@example.com")
-    )
-
-    document = Document(
-        id=uuid4(),
-        client_id=client.id,
-        title="Test Document",
-        s3_key="test/document.pdf",
-        status=DocumentStatus.PROCESSED
-    )
+    _, document = persisted_client_document
 
     chunk = DocumentChunk(
         id=uuid4(),
@@ -428,8 +386,6 @@ async def test_search_by_keyword_returns_empty_when_no_matches(chunk_search_repo
     )
 
     async with unit_of_work:
-        unit_of_work.add(client)
-        unit_of_work.add(document)
         unit_of_work.add(chunk)
 
     # Act - Search for a term that doesn't exist
@@ -451,23 +407,10 @@ async def test_search_by_keyword_empty_query_raises_error(chunk_search_repositor
 
 
 @pytest.mark.asyncio
-async def test_search_by_keyword_handles_multiple_words(chunk_search_repository, unit_of_work):
+async def test_search_by_keyword_handles_multiple_words(chunk_search_repository, unit_of_work, persisted_client_document):
     """Test that keyword search handles multi-word queries."""
     # Arrange
-    client = Client(
-        id=uuid4(),
-        first_name="Test",
-        last_name="User",
-        email=EmailStr("test@example.com")
-    )
-
-    document = Document(
-        id=uuid4(),
-        client_id=client.id,
-        title="Test Document",
-        s3_key="test/document.pdf",
-        status=DocumentStatus.PROCESSED
-    )
+    _, document = persisted_client_document
 
     chunk1 = DocumentChunk(
         id=uuid4(),
@@ -486,8 +429,6 @@ async def test_search_by_keyword_handles_multiple_words(chunk_search_repository,
     )
 
     async with unit_of_work:
-        unit_of_work.add(client)
-        unit_of_work.add(document)
         unit_of_work.add(chunk1)
         unit_of_work.add(chunk2)
 
@@ -500,23 +441,10 @@ async def test_search_by_keyword_handles_multiple_words(chunk_search_repository,
 
 
 @pytest.mark.asyncio
-async def test_search_by_keyword_ranks_by_relevance(chunk_search_repository, unit_of_work):
+async def test_search_by_keyword_ranks_by_relevance(chunk_search_repository, unit_of_work, persisted_client_document):
     """Test that keyword search returns results ranked by relevance."""
     # Arrange
-    client = Client(
-        id=uuid4(),
-        first_name="Test",
-        last_name="User",
-        email=EmailStr("test@example.com")
-    )
-
-    document = Document(
-        id=uuid4(),
-        client_id=client.id,
-        title="Test Document",
-        s3_key="test/document.pdf",
-        status=DocumentStatus.PROCESSED
-    )
+    _, document = persisted_client_document
 
     # Chunk with many occurrences of search term
     chunk_high_relevance = DocumentChunk(
@@ -537,8 +465,6 @@ async def test_search_by_keyword_ranks_by_relevance(chunk_search_repository, uni
     )
 
     async with unit_of_work:
-        unit_of_work.add(client)
-        unit_of_work.add(document)
         unit_of_work.add(chunk_high_relevance)
         unit_of_work.add(chunk_low_relevance)
 
@@ -60,8 +60,7 @@ async def test_get_documents_by_client_id(document_repository, unit_of_work):
     ]
     async with unit_of_work:
         unit_of_work.add(client)
-        for doc in docs:
-            unit_of_work.add(doc)
+        unit_of_work.add_many(docs)
 
     retrieved_docs = await document_repository.get_by_client_id(client.id)
     assert len(retrieved_docs) == 3
@@ -126,8 +125,7 @@ async def test_get_documents_by_ids(document_repository, unit_of_work):
 
     async with unit_of_work:
         unit_of_work.add(client)
-        for doc in docs:
-            unit_of_work.add(doc)
+        unit_of_work.add_many(docs)
 
     # Test fetching all 5 documents
     all_ids = [doc.id for doc in docs]
@@ -167,8 +165,7 @@ async def test_get_documents_by_ids_partial_match(document_repository, unit_of_w
 
     async with unit_of_work:
         unit_of_work.add(client)
-        for doc in docs:
-            unit_of_work.add(doc)
+        unit_of_work.add_many(docs)
 
     # Request 3 existing documents + 2 non-existent ones
     existing_ids = [doc.id for doc in docs]
@@ -224,3 +221,26 @@ async def test_get_documents_by_ids_single_document(document_repository, unit_of
     assert retrieved_docs[0].id == doc.id
     assert retrieved_docs[0].title == "Single Document"
     assert retrieved_docs[0].status == DocumentStatus.PROCESSED
+
+
+@pytest.mark.asyncio
+async def test_get_documents_by_ids_uses_single_array_bound_statement(document_repository):
+    """Test that batch fetching issues one statement whose SQL does not depend on the number of IDs."""
+    from unittest.mock import AsyncMock, patch
+
+    from sqlalchemy.dialects.postgresql import asyncpg
+
+    compiled_statements = []
+    with patch.object(document_repository, "find_all", AsyncMock(return_value=[])) as find_all:
+        for id_count in (1, 50):
+            ids = [uuid4() for _ in range(id_count)]
+            await document_repository.get_by_ids(ids)
+
+            statement = find_all.call_args[0][0]
+            compiled = statement.compile(dialect=asyncpg.dialect())
+            assert compiled.params["document_ids"] == ids
+            compiled_statements.append(str(compiled))
+
+    assert find_all.call_count == 2
+    assert compiled_statements[0] == compiled_statements[1]
+    assert "= ANY (" in compiled_statements[0]
@@ -1,21 +1,29 @@
 """Shared test fixtures and utilities for all tests."""
 import os
+import platform
 
 # Disable tokenizers parallelism to avoid fork warnings from HuggingFace
 # This must be set before any tokenizers are imported
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
 import asyncio
+import importlib.util
+import itertools
+import uuid
 
+import numpy as np
 import pytest
 import pytest_asyncio
 from dependency_injector import providers
+from filelock import FileLock
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
 from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
 from testcontainers.postgres import PostgresContainer
 
 from src.app.containers import Container
+from src.app.core.services.reranker import CrossEncoderReranker
 from src.app.main import create_app, default_lifespan
 from src.client import NevisClient
 from src.eval import EvalRunner
@@ -68,6 +76,42 @@ def s3_endpoint_url(localstack_container):
     return f"http://{host}:{port}"
 
 
+def quantized_onnx_file_name() -> str:
+    """
+    Pick the INT8 ONNX export that matches this CPU.
+
+    The sentence-transformers model repositories publish one quantized export
+    per instruction set. Prefer AVX-512 VNNI, then ARM64, then AVX2.
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "onnx/model_qint8_arm64.onnx"
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            if "avx512_vnni" in cpuinfo.read():
+                return "onnx/model_qint8_avx512_vnni.onnx"
+    except OSError:
+        pass
+    return "onnx/model_quint8_avx2.onnx"
+
+
+def reranker_backend() -> tuple[str, str]:
+    """
+    Pick the (backend, model file) the test reranker runs on.
+
+    On Intel CPUs with OpenVINO installed (the sentence-transformers[openvino]
+    extra), use its INT8 export; otherwise fall back to the INT8 ONNX export
+    on a bare ONNX Runtime session.
+    """
+    if importlib.util.find_spec("openvino") is not None:
+        try:
+            with open("/proc/cpuinfo") as cpuinfo:
+                if "GenuineIntel" in cpuinfo.read():
+                    return "openvino", "openvino/openvino_model_qint8_quantized.xml"
+        except OSError:
+            pass
+    return "onnxruntime", quantized_onnx_file_name()
+
+
 @pytest.fixture(scope="session")
 def test_settings_override(async_db_url, s3_endpoint_url):
     """
@@ -83,6 +127,22 @@ def test_settings_override(async_db_url, s3_endpoint_url):
     os.environ["AWS__ACCESS_KEY_ID"] = "test"
     os.environ["AWS__SECRET_ACCESS_KEY"] = "test"
 
+    # TEST_FAST_EMBEDDER=1 swaps the PyTorch embedding model for its INT8 ONNX export
+    # (same 384-dim output, much faster load and CPU inference)
+    if os.environ.get("TEST_FAST_EMBEDDER") == "1":
+        os.environ["EMBEDDING__BACKEND"] = "onnx"
+        os.environ["EMBEDDING__MODEL_FILE_NAME"] = quantized_onnx_file_name()
+
+    # TEST_FAST_RERANKER=1 swaps the reranker for an INT8 export: OpenVINO on Intel when
+    # available, otherwise a bare ONNX Runtime session (needs the sentence-transformers[onnx] dev extra)
+    if os.environ.get("TEST_FAST_RERANKER") == "1":
+        reranker_backend_name, reranker_model_file_name = reranker_backend()
+        os.environ["RERANKER__BACKEND"] = reranker_backend_name
+        os.environ["RERANKER__MODEL_FILE_NAME"] = reranker_model_file_name
+    # Under pytest-xdist, N workers x 1 thread keeps every core busy without oversubscribing
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        os.environ["RERANKER__NUM_THREADS"] = "1"
+
     # Clear settings cache to force reload with new env vars
     from src.app.config import get_settings
     get_settings.cache_clear()
@@ -92,6 +152,20 @@ def test_settings_override(async_db_url, s3_endpoint_url):
     get_settings.cache_clear()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def limit_torch_threads_per_worker():
+    """
+    Pin torch to a single intra-op thread when running under pytest-xdist.
+
+    Each xdist worker loads its own models; letting every worker spawn a
+    full thread pool oversubscribes the CPU and slows all of them down.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        import torch
+        torch.set_num_threads(1)
+    yield
+
+
 # =============================================================================
 # Session-scoped database fixture
 # =============================================================================
@@ -128,16 +202,26 @@ async def session_db(async_db_url):
 # =============================================================================
 
 @pytest.fixture(scope="session")
-def test_container(test_settings_override, session_db):
+def test_container(test_settings_override, session_db, tmp_path_factory):
     """
     Session-scoped test container with database override.
     Reuses expensive ML model singletons across all tests.
+
+    Models are loaded up front while holding a file lock shared by all
+    pytest-xdist workers, so only one worker downloads them into the
+    HuggingFace cache and the rest load from disk.
     """
     container = Container()
 
     # Override the database singleton with the test database instance
     container.database.override(providers.Object(session_db))
 
+    # getbasetemp().parent is the same directory for every xdist worker
+    lock_path = tmp_path_factory.getbasetemp().parent / "ml_models.lock"
+    with FileLock(str(lock_path)):
+        container.sentence_transformer_model()
+        container.cross_encoder_model()
+
     yield container
 
     container.database.reset_override()
@@ -164,15 +248,20 @@ async def test_app(test_container):
 @pytest_asyncio.fixture(scope="function")
 async def clean_database(session_db, test_app):
     """
-    Clean the database before each test by dropping and recreating all tables.
+    Clean the database before each test by truncating all tables.
     Depends on test_app to ensure extensions are created first via app lifespan.
+
+    Tables and their HNSW/GIN indexes are created once and only emptied per
+    test, instead of being dropped and rebuilt for every test.
     """
     # test_app dependency ensures lifespan has run (extensions + initial tables created)
     _ = test_app
 
+    table_names = ", ".join(table.name for table in Base.metadata.sorted_tables)
     async with session_db._engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+        # checkfirst: only creates tables registered after the lifespan ran (e.g. test-only entities)
         await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text(f"TRUNCATE {table_names} RESTART IDENTITY CASCADE"))
 
     yield session_db
 
@@ -201,6 +290,18 @@ async def unit_of_work(clean_database, test_container):
     yield UnitOfWork(clean_database, entity_mapper)
 
 
+@pytest.fixture
+def uid():
+    """
+    Factory for deterministic, sequential UUIDs (UUID(int=1), UUID(int=2), ...).
+
+    Cheaper than uuid4() (no OS entropy read) and reproducible across runs,
+    for tests that only need distinct IDs.
+    """
+    counter = itertools.count(1)
+    return lambda: uuid.UUID(int=next(counter))
+
+
 # =============================================================================
 # Aliases for backwards compatibility
 # =============================================================================
@@ -281,16 +382,53 @@ def client_service(test_container):
     return test_container.client_service()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sentence_transformer_model(test_container):
+    """Get the SentenceTransformer singleton, loaded once per test session."""
+    return test_container.sentence_transformer_model()
+
+
+@pytest.fixture(scope="session")
+def cross_encoder_model(test_container):
+    """Get the cross-encoder model singleton, loaded once per test session."""
+    return test_container.cross_encoder_model()
+
+
+@pytest.fixture(scope="session")
 def embedding_service(test_container):
-    """Get embedding service from container."""
+    """Get embedding service from container. Session-scoped, it only wraps the shared model."""
     return test_container.embedding_service()
 
 
-@pytest.fixture
-def reranker_service(test_container):
-    """Get reranker service from container."""
-    return test_container.reranker_service()
+class MemoizedPairScorer:
+    """
+    Test-only wrapper that memoizes cross-encoder scores per (query, content) pair.
+
+    Reranker tests score the same fixed pairs over and over (e.g. "proof of
+    address" against the sample documents). The model is deterministic and
+    read-only, so each distinct pair only needs one forward pass per session.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._scores: dict[tuple[str, str], float] = {}
+
+    def predict(self, sentences: list[tuple[str, str]], **kwargs) -> np.ndarray:
+        missing = list(dict.fromkeys(pair for pair in sentences if pair not in self._scores))
+        if missing:
+            scores = self.model.predict(missing, **kwargs)
+            self._scores.update(zip(missing, np.asarray(scores, dtype=np.float32).tolist()))
+        return np.array([self._scores[pair] for pair in sentences], dtype=np.float32)
+
+
+@pytest.fixture(scope="session")
+def reranker_service(cross_encoder_model):
+    """
+    Reranker over the shared cross-encoder, with per-pair score memoization.
+
+    Session-scoped: pairs repeated across tests are scored once.
+    """
+    return CrossEncoderReranker(MemoizedPairScorer(cross_encoder_model))
 
 
 @pytest.fixture